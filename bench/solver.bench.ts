@@ -0,0 +1,330 @@
+/**
+ * Solver Benchmarks
+ *
+ * Times each generation phase over a matrix of deck sizes, from the demo
+ * deck to festival scale:
+ *
+ *   model build → solve → local search → assignmentToBoards → calculateStats
+ *
+ * Timings go through vitest's own reporter (`npm run bench:baseline` saves
+ * them, `npm run bench:compare` diffs a run against that file). Overlap
+ * quality is deterministic for a fixed seed: each run compares it with
+ * bench/baselines/quality.json and warns on regressions, and the file is
+ * only rewritten when BENCH_UPDATE_BASELINE=1 (set by bench:baseline).
+ *
+ * Without HiGHS installed, "solve" falls back to greedy exactly as the
+ * generator does; the quality report records which solver ran.
+ */
+
+import { bench, describe } from "vitest";
+import { existsSync, mkdirSync, readFileSync, writeFileSync } from "node:fs";
+import path from "node:path";
+import type { DistributionStrategy, GeneratorConfig, SolverUsed } from "@/lib/types";
+import { getBoardSize } from "@/lib/types";
+import { calculateFrequencies } from "@/lib/constraints/engine";
+import {
+  type SolverResult,
+  assignmentToBoards,
+  calculateStats,
+  createSeededRandom,
+  solveAssignment,
+} from "@/lib/solver/highs-solver";
+import { buildAssignmentModel, modelToLp } from "@/lib/solver/model-builder";
+import {
+  type BoardBitset,
+  cloneBoardBitset,
+  summarizeOverlaps,
+} from "@/lib/solver/board-bitset";
+import { localSearchOptimization } from "@/lib/solver/optimizers";
+import { shouldDecompose, solveDecomposed } from "@/lib/solver/decomposition";
+import { constructDesign } from "@/lib/solver/designs";
+import { greedyAssignment } from "@/lib/solver/greedy";
+import { acquireSolver } from "@/lib/solver/solver-pool";
+
+// ============================================================================
+// MATRIX
+// ============================================================================
+
+interface Scenario {
+  name: string;
+  numItems: number;
+  numBoards: number;
+  rows: number;
+  cols: number;
+  distribution: DistributionStrategy;
+}
+
+const SCENARIOS: Scenario[] = [
+  {
+    name: "demo deck (36 items, 15 boards, 4×4)",
+    numItems: 36,
+    numBoards: 15,
+    rows: 4,
+    cols: 4,
+    distribution: { type: "uniform" },
+  },
+  {
+    name: "party (48 items, 40 boards, 4×4, grouped)",
+    numItems: 48,
+    numBoards: 40,
+    rows: 4,
+    cols: 4,
+    distribution: {
+      type: "grouped",
+      groups: [
+        { startIndex: 0, endIndex: 15, frequency: 16 },
+        { startIndex: 16, endIndex: 47, frequency: 12 },
+      ],
+    },
+  },
+  {
+    name: "school fair (90 items, 150 boards, 5×5)",
+    numItems: 90,
+    numBoards: 150,
+    rows: 5,
+    cols: 5,
+    distribution: { type: "uniform" },
+  },
+  {
+    name: "league night (120 items, 400 boards, 5×5, custom)",
+    numItems: 120,
+    numBoards: 400,
+    rows: 5,
+    cols: 5,
+    distribution: {
+      type: "custom",
+      frequencies: Array.from({ length: 120 }, (_, i) => ({
+        itemId: String(i + 1),
+        frequency: i < 40 ? 100 : 75,
+      })),
+    },
+  },
+  {
+    name: "festival (200 items, 2000 boards, 5×5)",
+    numItems: 200,
+    numBoards: 2000,
+    rows: 5,
+    cols: 5,
+    distribution: { type: "uniform" },
+  },
+];
+
+const SEED = 12345;
+
+const BENCH_OPTIONS = { time: 500, iterations: 5, warmupIterations: 1 };
+
+/** Resolved from the project root (vitest runs from there) */
+const QUALITY_BASELINE = path.resolve("bench/baselines/quality.json");
+
+/** Rewrite the quality baseline instead of comparing against it */
+const UPDATE_BASELINE = process.env.BENCH_UPDATE_BASELINE === "1";
+
+// ============================================================================
+// PIPELINE
+// ============================================================================
+
+/** Whether a HiGHS instance can be obtained in this environment */
+const highsAvailable = await acquireSolver().then(
+  (lease) => {
+    lease.release();
+    return true;
+  },
+  () => false
+);
+
+function createConfig(scenario: Scenario): GeneratorConfig {
+  return {
+    items: Array.from({ length: scenario.numItems }, (_, i) => ({
+      id: String(i + 1),
+      name: `Item ${i + 1}`,
+    })),
+    numBoards: scenario.numBoards,
+    boardConfig: { rows: scenario.rows, cols: scenario.cols },
+    distribution: scenario.distribution,
+    seed: SEED,
+  };
+}
+
+function stageResult(
+  assignment: BoardBitset,
+  solverUsed: SolverUsed,
+  construction?: string
+): SolverResult {
+  return {
+    success: true,
+    assignment,
+    maxOverlap: 0,
+    solveTimeMs: 0,
+    instantiationTimeMs: 0,
+    solverUsed,
+    construction,
+  };
+}
+
+/** Same stage order as generateBoardsWithHiGHS: design, HiGHS, greedy */
+async function solve(
+  N: number,
+  B: number,
+  S: number,
+  frequencies: number[]
+): Promise<SolverResult> {
+  const design = constructDesign(N, B, S, frequencies);
+  if (design) return stageResult(design.assignment, "design", design.name);
+
+  if (highsAvailable) {
+    const decompose = shouldDecompose(N, B);
+    const assignment = decompose
+      ? await solveDecomposed(N, B, S, frequencies, {
+          solveBlock: solveAssignment,
+          workers: 0,
+          random: createSeededRandom(SEED),
+        })
+      : await solveAssignment(N, B, S, frequencies);
+    if (assignment) {
+      return stageResult(assignment, decompose ? "decomposition" : "highs");
+    }
+  }
+  return stageResult(greedyAssignment(N, B, S, frequencies), "greedy");
+}
+
+// ============================================================================
+// SETUP
+// ============================================================================
+
+interface Prepared {
+  scenario: Scenario;
+  config: GeneratorConfig;
+  N: number;
+  B: number;
+  S: number;
+  frequencies: number[];
+  solved: SolverResult;
+  optimized: BoardBitset;
+}
+
+interface QualityEntry {
+  scenario: string;
+  solverUsed: SolverUsed;
+  construction?: string;
+  /** Max overlap straight out of the solver */
+  solvedMaxOverlap: number;
+  maxOverlap: number;
+  avgOverlap: number;
+}
+
+const prepared: Prepared[] = [];
+const quality: QualityEntry[] = [];
+
+for (const scenario of SCENARIOS) {
+  const config = createConfig(scenario);
+  const N = config.items.length;
+  const B = config.numBoards;
+  const S = getBoardSize(config.boardConfig);
+  const frequencies = calculateFrequencies(N, B, S, config.distribution);
+
+  const solved = await solve(N, B, S, frequencies);
+  const optimized = cloneBoardBitset(solved.assignment);
+  await localSearchOptimization(optimized, S);
+
+  const stats = calculateStats(config, frequencies, { ...solved, assignment: optimized }, 0, SEED);
+  prepared.push({ scenario, config, N, B, S, frequencies, solved, optimized });
+  quality.push({
+    scenario: scenario.name,
+    solverUsed: solved.solverUsed,
+    construction: solved.construction,
+    solvedMaxOverlap: summarizeOverlaps(solved.assignment).maxOverlap,
+    maxOverlap: stats.maxOverlap,
+    avgOverlap: Number(stats.avgOverlap.toFixed(4)),
+  });
+}
+
+/**
+ * Describe scenarios whose overlap got worse than the baseline (scenarios
+ * solved by a different stage, e.g. without HiGHS, aren't comparable)
+ */
+function qualityRegressions(
+  current: QualityEntry[],
+  baseline: QualityEntry[]
+): string[] {
+  const byScenario = new Map(baseline.map((entry) => [entry.scenario, entry]));
+  const regressions: string[] = [];
+  for (const entry of current) {
+    const previous = byScenario.get(entry.scenario);
+    if (!previous || previous.solverUsed !== entry.solverUsed) continue;
+    if (
+      entry.maxOverlap > previous.maxOverlap ||
+      entry.avgOverlap > previous.avgOverlap
+    ) {
+      regressions.push(
+        `${entry.scenario}: max ${previous.maxOverlap} → ${entry.maxOverlap}, ` +
+          `avg ${previous.avgOverlap} → ${entry.avgOverlap}`
+      );
+    }
+  }
+  return regressions;
+}
+
+console.table(quality);
+if (UPDATE_BASELINE) {
+  mkdirSync(path.dirname(QUALITY_BASELINE), { recursive: true });
+  writeFileSync(QUALITY_BASELINE, `${JSON.stringify(quality, null, 2)}\n`);
+} else if (existsSync(QUALITY_BASELINE)) {
+  const baseline: QualityEntry[] = JSON.parse(readFileSync(QUALITY_BASELINE, "utf8"));
+  const regressions = qualityRegressions(quality, baseline);
+  if (regressions.length > 0) {
+    console.warn(`Overlap quality regressed:\n  ${regressions.join("\n  ")}`);
+  }
+}
+
+// ============================================================================
+// BENCHMARKS
+// ============================================================================
+
+for (const p of prepared) {
+  const { config, N, B, S, frequencies, solved, optimized } = p;
+
+  describe(p.scenario.name, () => {
+    // Decomposed scenarios never build the single model
+    if (!shouldDecompose(N, B)) {
+      bench(
+        "model build",
+        () => {
+          modelToLp(buildAssignmentModel(N, B, S, frequencies));
+        },
+        BENCH_OPTIONS
+      );
+    }
+
+    bench(
+      `solve (${solved.solverUsed})`,
+      async () => {
+        await solve(N, B, S, frequencies);
+      },
+      BENCH_OPTIONS
+    );
+
+    bench(
+      "local search",
+      async () => {
+        await localSearchOptimization(cloneBoardBitset(solved.assignment), S);
+      },
+      BENCH_OPTIONS
+    );
+
+    bench(
+      "assignmentToBoards",
+      () => {
+        assignmentToBoards(optimized, config, createSeededRandom(SEED));
+      },
+      BENCH_OPTIONS
+    );
+
+    bench(
+      "calculateStats",
+      () => {
+        calculateStats(config, frequencies, { ...solved, assignment: optimized }, 0, SEED);
+      },
+      BENCH_OPTIONS
+    );
+  });
+}
@@ -0,0 +1,139 @@
+import { NextRequest, NextResponse } from "next/server";
+import type { BatchStreamEvent } from "@/lib/types";
+import { getGenerationPool } from "@/lib/solver/worker-pool";
+import { withResultCache } from "@/lib/solver/result-cache";
+import { precheckFeasibility } from "@/lib/constraints/engine";
+import {
+  RequestValidationError,
+  defaultRequestLimits,
+  readJsonBody,
+  validateGeneratorConfig,
+} from "@/lib/constraints/request-validation";
+import { MAX_BATCH_SIZE, runBatch } from "@/lib/solver/batch";
+import { toPlainBoard } from "@/lib/utils/board-layout";
+import { createDevLogger } from "@/lib/utils/dev-logger";
+import { NDJSON_CONTENT_TYPE, encodeNdjsonLine } from "@/lib/utils/ndjson";
+
+// Scoped logger for API (only outputs in development)
+const log = createDevLogger("API:GenerateBatch");
+
+// Force Node.js runtime for HiGHS WASM
+export const runtime = "nodejs";
+export const dynamic = "force-dynamic";
+
+/** Per-config caps; the body may hold up to MAX_BATCH_SIZE configs */
+const REQUEST_LIMITS = defaultRequestLimits();
+
+/**
+ * Generate boards for many configs in one request
+ *
+ * Body: `GeneratorConfig[]` or `{ configs: GeneratorConfig[] }`.
+ * Responds with an NDJSON stream of BatchStreamEvents: progress and one
+ * "result" (or "error") per config in completion order, then "done".
+ */
+export async function POST(request: NextRequest) {
+  const pool = getGenerationPool();
+
+  let configs: unknown[];
+  try {
+    const body = (await readJsonBody(
+      request,
+      REQUEST_LIMITS.maxBodyBytes * MAX_BATCH_SIZE
+    )) as { configs?: unknown[] } | unknown[] | null;
+    configs = Array.isArray(body) ? body : (body?.configs ?? []);
+  } catch (error) {
+    if (!(error instanceof RequestValidationError)) throw error;
+    return NextResponse.json(
+      { success: false, errors: error.errors },
+      { status: error.status }
+    );
+  }
+
+  if (!Array.isArray(configs) || configs.length === 0) {
+    return NextResponse.json(
+      { success: false, error: "Expected a non-empty array of configs" },
+      { status: 400 }
+    );
+  }
+  if (configs.length > MAX_BATCH_SIZE) {
+    return NextResponse.json(
+      {
+        success: false,
+        error: `Batch of ${configs.length} configs exceeds the limit of ${MAX_BATCH_SIZE}`,
+      },
+      { status: 413 }
+    );
+  }
+
+  log.info(
+    `Generating batch of ${configs.length} configs (queue depth: ${pool.getStats().queueDepth})`
+  );
+
+  let closed = false;
+  const stream = new ReadableStream<Uint8Array>({
+    async start(controller) {
+      const send = (event: BatchStreamEvent) => {
+        if (!closed) controller.enqueue(encodeNdjsonLine(event));
+      };
+      let completed = 0;
+      let failed = 0;
+
+      await runBatch(
+        configs,
+        async (config, onProgress) => {
+          // Infeasible configs fail without queueing a solver job
+          const infeasible = precheckFeasibility(config);
+          if (infeasible.length > 0) {
+            throw new Error(infeasible.map((v) => v.message).join(" "));
+          }
+          return withResultCache(config, () =>
+            pool.run(config, { signal: request.signal, onProgress })
+          );
+        },
+        {
+          // One group per job the pool can run at once (every worker, or
+          // the single inline lane), so the batch doesn't fill the queue
+          concurrency: pool.getStats().capacity,
+          signal: request.signal,
+          // Every entry, not just each group's solved one, so names and
+          // images that are only relabelled in are capped too
+          validate: (entry) => validateGeneratorConfig(entry, REQUEST_LIMITS),
+          onProgress: (index, progress) =>
+            send({ type: "progress", index, progress }),
+          onResult: (index, result) => {
+            completed++;
+            send({
+              type: "result",
+              index,
+              result: { ...result, boards: result.boards.map(toPlainBoard) },
+            });
+          },
+          onError: (index, error) => {
+            failed++;
+            log.error(`Batch config ${index} failed`, error);
+            send({
+              type: "error",
+              index,
+              error: error instanceof Error ? error.message : String(error),
+            });
+          },
+        }
+      );
+
+      send({ type: "done", completed, failed });
+      if (!closed) controller.close();
+      closed = true;
+    },
+    cancel() {
+      closed = true;
+    },
+  });
+
+  return new Response(stream, {
+    headers: {
+      "Content-Type": NDJSON_CONTENT_TYPE,
+      "Cache-Control": "no-cache",
+      "X-Queue-Depth": String(pool.getStats().queueDepth),
+    },
+  });
+}
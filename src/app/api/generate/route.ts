@@ -1,7 +1,23 @@
 import { NextRequest, NextResponse } from "next/server";
-import type { GeneratorConfig } from "@/lib/types";
-import { generateBoardsWithHiGHS } from "@/lib/solver/highs-solver";
+import {
+  GenerationJobError,
+  type GenerationJobErrorCode,
+  getGenerationPool,
+} from "@/lib/solver/worker-pool";
+import { withResultCache } from "@/lib/solver/result-cache";
+import { streamGeneration } from "@/lib/solver/generation-stream";
+import { precheckFeasibility } from "@/lib/constraints/engine";
+import {
+  RequestValidationError,
+  defaultRequestLimits,
+  readJsonBody,
+  validateGeneratorConfig,
+} from "@/lib/constraints/request-validation";
 import { createDevLogger } from "@/lib/utils/dev-logger";
+import { NDJSON_CONTENT_TYPE } from "@/lib/utils/ndjson";
+import { formatServerTiming } from "@/lib/utils/server-timing";
+import { COMPACT_FORMAT, packResult } from "@/lib/utils/board-codec";
+import { toPlainBoard } from "@/lib/utils/board-layout";
 
 // Scoped logger for API (only outputs in development)
 const log = createDevLogger("API:Generate");
@@ -10,23 +26,100 @@ const log = createDevLogger("API:Generate");
 export const runtime = "nodejs";
 export const dynamic = "force-dynamic";
 
+/** HTTP status for each way a pooled job can fail */
+const JOB_ERROR_STATUS: Record<GenerationJobErrorCode, number> = {
+  QUEUE_FULL: 503,
+  TIMEOUT: 504,
+  CANCELLED: 499,
+  WORKER_FAILED: 500,
+};
+
+/** Body, item and board caps (read once; configured through env) */
+const REQUEST_LIMITS = defaultRequestLimits();
+
 export async function POST(request: NextRequest) {
+  const pool = getGenerationPool();
+  const requestStart = performance.now();
+
   try {
-    const config: GeneratorConfig = await request.json();
+    // Oversized or malformed bodies are rejected before anything is allocated
+    const config = validateGeneratorConfig(
+      await readJsonBody(request, REQUEST_LIMITS.maxBodyBytes),
+      REQUEST_LIMITS
+    );
+
+    // Infeasible configs are answered without queueing a solver job
+    const infeasible = precheckFeasibility(config);
+    if (infeasible.length > 0) {
+      return NextResponse.json(
+        { success: false, errors: infeasible.map((v) => v.message) },
+        { status: 422 }
+      );
+    }
+
+    const compact = request.nextUrl.searchParams.get("format") === COMPACT_FORMAT;
 
     log.info(
-      `Generating ${config.numBoards} boards with ${config.items.length} items`
+      `Generating ${config.numBoards} boards with ${config.items.length} items (queue depth: ${pool.getStats().queueDepth})`
     );
 
-    const result = await generateBoardsWithHiGHS(config);
+    if (request.headers.get("accept")?.includes(NDJSON_CONTENT_TYPE)) {
+      return streamGeneration(config, compact, (send) =>
+        withResultCache(config, () =>
+          pool.run(config, {
+            signal: request.signal,
+            onProgress: (progress) => send({ type: "progress", progress }),
+          })
+        )
+      );
+    }
+
+    const result = await withResultCache(config, () =>
+      pool.run(config, { signal: request.signal })
+    );
 
     log.info(
-      `Generation complete - success: ${result.success}, solver: ${result.stats?.solverUsed}`
+      `Generation complete - success: ${result.success}, solver: ${result.stats?.solverUsed}, cache hit: ${result.stats?.cacheHit}`
     );
 
-    return NextResponse.json(result);
+    const body = compact
+      ? packResult(result, config.items, config.boardConfig)
+      : { ...result, boards: result.boards.map(toPlainBoard) };
+
+    // Streamed responses carry the same timings in their "done" event
+    return NextResponse.json(body, {
+      headers: {
+        "X-Queue-Depth": String(pool.getStats().queueDepth),
+        "Server-Timing": formatServerTiming(
+          result.stats,
+          performance.now() - requestStart
+        ),
+      },
+    });
   } catch (error) {
+    if (error instanceof RequestValidationError) {
+      return NextResponse.json(
+        { success: false, errors: error.errors },
+        { status: error.status }
+      );
+    }
+
     log.error("Generation failed", error);
+
+    if (error instanceof GenerationJobError) {
+      const status = JOB_ERROR_STATUS[error.code];
+      return NextResponse.json(
+        { success: false, error: error.message },
+        {
+          status,
+          headers: {
+            "X-Queue-Depth": String(pool.getStats().queueDepth),
+            ...(error.code === "QUEUE_FULL" && { "Retry-After": "5" }),
+          },
+        }
+      );
+    }
+
     return NextResponse.json(
       { success: false, error: String(error) },
       { status: 500 }
@@ -0,0 +1,286 @@
+"use client";
+
+import { useEffect, useRef, useState, type MouseEvent } from "react";
+import { Loader2 } from "lucide-react";
+import { runBoardAnalytics } from "@/lib/analytics/analytics-client";
+import {
+  boardAnalyticsInput,
+  type BoardAnalytics,
+} from "@/lib/analytics/board-analytics";
+import type { GeneratedBoard, Item } from "@/lib/types";
+
+/** Bar colour (amber-500) */
+const BAR_COLOR = "#f59e0b";
+/** Heatmap colour ramp: amber-50 (no overlap) to red-700 (max overlap) */
+const HEAT_LOW = [255, 251, 235];
+const HEAT_HIGH = [185, 28, 28];
+
+/**
+ * Item frequency, overlap distribution and board×board heatmap
+ *
+ * Analytics are computed in a Web Worker and drawn to canvases; hovering
+ * only updates a caption, so the charts stay responsive for 1,000+ boards.
+ */
+export function BoardAnalyticsPanel({
+  boards,
+  items,
+  boardSize,
+}: {
+  boards: GeneratedBoard[];
+  items: Item[];
+  boardSize: number;
+}) {
+  // Tagged with the boards they describe, so a new result shows the
+  // loading state until its own analytics arrive
+  const [state, setState] = useState<{
+    boards: GeneratedBoard[];
+    analytics?: BoardAnalytics;
+    error?: string;
+  } | null>(null);
+
+  useEffect(() => {
+    const controller = new AbortController();
+    Promise.resolve()
+      .then(() =>
+        runBoardAnalytics(
+          boardAnalyticsInput(boards, items, boardSize),
+          controller.signal
+        )
+      )
+      .then(
+        (analytics) => setState({ boards, analytics }),
+        (e) => {
+          if (controller.signal.aborted) return;
+          setState({
+            boards,
+            error: e instanceof Error ? e.message : "Analytics failed",
+          });
+        }
+      );
+    return () => controller.abort();
+  }, [boards, items, boardSize]);
+
+  const current = state?.boards === boards ? state : null;
+
+  if (current?.error) {
+    return <div className="text-sm text-red-600">{current.error}</div>;
+  }
+
+  if (!current?.analytics) {
+    return (
+      <div className="flex items-center gap-2 text-sm text-amber-600 py-6 justify-center">
+        <Loader2 className="w-4 h-4 animate-spin" />
+        Analyzing {boards.length} boards...
+      </div>
+    );
+  }
+
+  const { analytics } = current;
+
+  return (
+    <div className="grid gap-4 md:grid-cols-2">
+      <ChartCard title="Item frequency">
+        <BarChart
+          values={analytics.itemCounts}
+          describe={(i, count) =>
+            `${items[i].id}. ${items[i].name}: on ${count} boards`
+          }
+          hint={`${items.length} items`}
+        />
+      </ChartCard>
+
+      <ChartCard title="Overlap distribution">
+        <BarChart
+          values={analytics.overlapCounts}
+          describe={(overlap, count) =>
+            `${count.toLocaleString()} pairs share ${overlap} items`
+          }
+          hint={`Pairs by shared items (0-${boardSize})`}
+        />
+      </ChartCard>
+
+      <ChartCard title="Board overlap heatmap">
+        <Heatmap analytics={analytics} numBoards={boards.length} />
+      </ChartCard>
+
+      <ChartCard title="Most similar boards">
+        {analytics.mostSimilar.length === 0 ? (
+          <div className="text-xs text-amber-600">Fewer than two boards.</div>
+        ) : (
+          <ol className="space-y-1 text-sm">
+            {analytics.mostSimilar.map(({ first, second, overlap }) => (
+              <li
+                key={`${first}-${second}`}
+                className="flex justify-between text-amber-800"
+              >
+                <span>
+                  #{first + 1} & #{second + 1}
+                </span>
+                <span className="text-amber-600">
+                  {overlap} shared
+                </span>
+              </li>
+            ))}
+          </ol>
+        )}
+      </ChartCard>
+    </div>
+  );
+}
+
+function ChartCard({
+  title,
+  children,
+}: {
+  title: string;
+  children: React.ReactNode;
+}) {
+  return (
+    <div className="bg-amber-50/50 rounded-lg p-3 border border-amber-100">
+      <div className="text-xs font-medium text-amber-700 mb-2">{title}</div>
+      {children}
+    </div>
+  );
+}
+
+/**
+ * Bar chart on a canvas sized to its box (redrawn on resize)
+ */
+function BarChart({
+  values,
+  describe,
+  hint,
+}: {
+  values: ArrayLike<number>;
+  describe: (index: number, value: number) => string;
+  hint: string;
+}) {
+  const canvasRef = useRef<HTMLCanvasElement>(null);
+  const [hovered, setHovered] = useState<number | null>(null);
+
+  useEffect(() => {
+    const canvas = canvasRef.current;
+    if (!canvas) return;
+    const draw = () => drawBars(canvas, values);
+    draw();
+    const observer = new ResizeObserver(draw);
+    observer.observe(canvas);
+    return () => observer.disconnect();
+  }, [values]);
+
+  const handleMove = (e: MouseEvent<HTMLCanvasElement>) => {
+    const rect = e.currentTarget.getBoundingClientRect();
+    const index = Math.floor(((e.clientX - rect.left) / rect.width) * values.length);
+    setHovered(index >= 0 && index < values.length ? index : null);
+  };
+
+  return (
+    <div>
+      <canvas
+        ref={canvasRef}
+        className="w-full h-32"
+        onMouseMove={handleMove}
+        onMouseLeave={() => setHovered(null)}
+      />
+      <div className="text-xs text-amber-600 mt-1 truncate">
+        {hovered === null ? hint : describe(hovered, values[hovered])}
+      </div>
+    </div>
+  );
+}
+
+/**
+ * Board×board heatmap: one pixel per cell, scaled up without smoothing
+ */
+function Heatmap({
+  analytics,
+  numBoards,
+}: {
+  analytics: BoardAnalytics;
+  numBoards: number;
+}) {
+  const canvasRef = useRef<HTMLCanvasElement>(null);
+  const [hovered, setHovered] = useState<{ row: number; col: number } | null>(null);
+  const { heatmap, heatmapSize: size, boardsPerCell, maxOverlap } = analytics;
+
+  useEffect(() => {
+    const canvas = canvasRef.current;
+    const ctx = canvas?.getContext("2d");
+    if (!canvas || !ctx || size === 0) return;
+    canvas.width = size;
+    canvas.height = size;
+    const image = ctx.createImageData(size, size);
+    for (let k = 0; k < heatmap.length; k++) {
+      const t = maxOverlap > 0 ? heatmap[k] / maxOverlap : 0;
+      for (let c = 0; c < 3; c++) {
+        image.data[4 * k + c] = HEAT_LOW[c] + (HEAT_HIGH[c] - HEAT_LOW[c]) * t;
+      }
+      image.data[4 * k + 3] = 255;
+    }
+    ctx.putImageData(image, 0, 0);
+  }, [heatmap, size, maxOverlap]);
+
+  const handleMove = (e: MouseEvent<HTMLCanvasElement>) => {
+    const rect = e.currentTarget.getBoundingClientRect();
+    const row = Math.floor(((e.clientY - rect.top) / rect.height) * size);
+    const col = Math.floor(((e.clientX - rect.left) / rect.width) * size);
+    const inside = row >= 0 && row < size && col >= 0 && col < size;
+    setHovered((prev) =>
+      !inside ? null : prev?.row === row && prev.col === col ? prev : { row, col }
+    );
+  };
+
+  const boardRange = (cell: number) => {
+    const first = cell * boardsPerCell + 1;
+    const last = Math.min(first + boardsPerCell - 1, numBoards);
+    return boardsPerCell === 1 ? `#${first}` : `#${first}-${last}`;
+  };
+
+  return (
+    <div>
+      <canvas
+        ref={canvasRef}
+        className="w-full aspect-square rounded-sm"
+        style={{ imageRendering: "pixelated" }}
+        onMouseMove={handleMove}
+        onMouseLeave={() => setHovered(null)}
+      />
+      <div className="text-xs text-amber-600 mt-1 truncate">
+        {hovered === null
+          ? `Darker = more shared items (max ${maxOverlap})`
+          : hovered.row === hovered.col && boardsPerCell === 1
+            ? `Board ${boardRange(hovered.row)}`
+            : `${boardRange(hovered.row)} × ${boardRange(hovered.col)}: ` +
+              `${boardsPerCell === 1 ? "" : "up to "}` +
+              `${heatmap[hovered.row * size + hovered.col]} shared`}
+      </div>
+    </div>
+  );
+}
+
+/**
+ * Draw bars scaled to the largest value at device resolution
+ */
+function drawBars(canvas: HTMLCanvasElement, values: ArrayLike<number>): void {
+  const ctx = canvas.getContext("2d");
+  if (!ctx) return;
+  const dpr = window.devicePixelRatio || 1;
+  const width = canvas.clientWidth;
+  const height = canvas.clientHeight;
+  canvas.width = Math.round(width * dpr);
+  canvas.height = Math.round(height * dpr);
+  ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+  ctx.clearRect(0, 0, width, height);
+
+  let max = 0;
+  for (let i = 0; i < values.length; i++) max = Math.max(max, values[i]);
+  if (max === 0) return;
+
+  const slot = width / values.length;
+  const gap = slot > 4 ? 1 : 0;
+  ctx.fillStyle = BAR_COLOR;
+  for (let i = 0; i < values.length; i++) {
+    const barHeight = (values[i] / max) * height;
+    ctx.fillRect(i * slot + gap, height - barHeight, Math.max(slot - 2 * gap, 0.5), barHeight);
+  }
+}
@@ -14,6 +14,7 @@ import {
   Share2,
 } from "lucide-react";
 import { useResult, useConfig } from "@/stores/generator-store";
+import { boardRows } from "@/lib/utils/board-layout";
 
 export function StepExport() {
   const result = useResult();
@@ -29,6 +30,9 @@ export function StepExport() {
   }
 
   const { boards, stats } = result;
+  // Rows are built per export from each board's flat layout, so exporting
+  // doesn't leave a materialized grid on every board in the store
+  const { cols } = config.boardConfig;
 
   const handleDownloadJSON = () => {
     const data = {
@@ -49,7 +53,7 @@ export function StepExport() {
         id: b.id,
         number: b.boardNumber,
         items: b.items.map((item) => item.name),
-        grid: b.grid.map((row) => row.map((item) => item.name)),
+        grid: boardRows(b.items, cols).map((row) => row.map((item) => item.name)),
       })),
     };
 
@@ -86,7 +90,7 @@ export function StepExport() {
     const text = boards
       .map(
         (b) =>
-          `Board #${b.boardNumber}\n${b.grid
+          `Board #${b.boardNumber}\n${boardRows(b.items, cols)
             .map((row) => row.map((item) => item.name).join(" | "))
             .join("\n")}`
       )
@@ -147,9 +151,8 @@ export function StepExport() {
                 (b) => `
               <div class="board">
                 <div class="board-title">Board #${b.boardNumber}</div>
-                <div class="grid" style="grid-template-columns: repeat(${b.grid[0].length}, 1fr);">
-                  ${b.grid
-                    .flat()
+                <div class="grid" style="grid-template-columns: repeat(${cols}, 1fr);">
+                  ${b.items
                     .map((item) => `<div class="cell">${item.name}</div>`)
                     .join("")}
                 </div>
@@ -174,7 +177,9 @@ export function StepExport() {
         id: b.id,
         number: b.boardNumber,
         items: b.items.map((item) => ({ id: item.id, name: item.name })),
-        grid: b.grid.map((row) => row.map((item) => ({ id: item.id, name: item.name }))),
+        grid: boardRows(b.items, cols).map((row) =>
+          row.map((item) => ({ id: item.id, name: item.name }))
+        ),
       })),
     };
     localStorage.setItem("tabula-boards", JSON.stringify(data));
@@ -1,7 +1,6 @@
 "use client";
 
-import { useState } from "react";
-import { motion } from "framer-motion";
+import { memo, useState } from "react";
 import { Badge } from "@/components/ui/badge";
 import { Button } from "@/components/ui/button";
 import { Alert, AlertDescription } from "@/components/ui/alert";
@@ -9,25 +8,39 @@ import {
   RefreshCw,
   Clock,
   Zap,
-  ChevronLeft,
-  ChevronRight,
   AlertCircle,
   BarChart3,
   Key,
   Copy,
   Check,
+  X,
 } from "lucide-react";
-import { useResult, useGeneratorStore, useError } from "@/stores/generator-store";
+import {
+  useResult,
+  useGeneratorStore,
+  useError,
+  useIsGenerating,
+  useStreamedBoards,
+} from "@/stores/generator-store";
 import { cn } from "@/lib/utils";
-import type { GeneratedBoard } from "@/lib/types";
+import type { GeneratedBoard, SolverUsed } from "@/lib/types";
+import { VirtualBoardGrid } from "./virtual-board-grid";
+import { BoardAnalyticsPanel } from "./board-analytics-panel";
 
-const BOARDS_PER_PAGE = 12;
+const SOLVER_LABELS: Record<SolverUsed, string> = {
+  design: "Design",
+  highs: "HiGHS (Optimal)",
+  decomposition: "HiGHS (Blocks)",
+  greedy: "Greedy",
+};
 
 export function StepPreview() {
   const result = useResult();
   const error = useError();
-  const { regenerate } = useGeneratorStore();
-  const [page, setPage] = useState(0);
+  const isGenerating = useIsGenerating();
+  const streamedBoards = useStreamedBoards();
+  const { regenerate, cancelGeneration, config } = useGeneratorStore();
+  const [showAnalytics, setShowAnalytics] = useState(false);
 
   if (error) {
     return (
@@ -38,7 +51,10 @@ export function StepPreview() {
     );
   }
 
-  if (!result || !result.success) {
+  // While a streaming generation runs, show boards as they arrive
+  const streaming = isGenerating && streamedBoards.length > 0;
+
+  if (!streaming && (!result || !result.success)) {
     return (
       <div className="text-center py-12 text-amber-600">
         No boards generated yet.
@@ -46,10 +62,8 @@ export function StepPreview() {
     );
   }
 
-  const { boards, stats } = result;
-  const totalPages = Math.ceil(boards.length / BOARDS_PER_PAGE);
-  const startIdx = page * BOARDS_PER_PAGE;
-  const visibleBoards = boards.slice(startIdx, startIdx + BOARDS_PER_PAGE);
+  const boards = streaming ? streamedBoards : result!.boards;
+  const stats = streaming ? null : result!.stats;
 
   return (
     <div className="space-y-6">
@@ -60,93 +74,93 @@ export function StepPreview() {
             Generated Boards
           </h2>
           <p className="text-amber-600 text-sm">
-            {boards.length} unique boards created
+            {streaming
+              ? `Receiving boards... ${boards.length} of ${config.numBoards}`
+              : `${boards.length} unique boards created`}
           </p>
         </div>
-        <Button
-          variant="outline"
-          size="sm"
-          onClick={regenerate}
-          className="border-amber-200 text-amber-700 hover:bg-amber-50"
-        >
-          <RefreshCw className="w-4 h-4 mr-1" />
-          Regenerate
-        </Button>
-      </div>
-
-      {/* Stats */}
-      <div className="grid grid-cols-2 md:grid-cols-5 gap-3">
-        <StatCard
-          icon={Clock}
-          label="Time"
-          value={`${stats.generationTimeMs.toFixed(0)}ms`}
-        />
-        <StatCard
-          icon={Zap}
-          label="Solver"
-          value={stats.solverUsed === "highs" ? "HiGHS (Optimal)" : "Greedy"}
-        />
-        <StatCard
-          icon={BarChart3}
-          label="Max Overlap"
-          value={`${stats.maxOverlap} items`}
-        />
-        <StatCard
-          icon={BarChart3}
-          label="Avg Overlap"
-          value={`${stats.avgOverlap.toFixed(1)} items`}
-        />
-        <SeedCard seed={stats.seedUsed} />
-      </div>
-
-      {/* Board Grid */}
-      <div className="grid grid-cols-2 sm:grid-cols-3 md:grid-cols-4 lg:grid-cols-6 gap-3">
-        {visibleBoards.map((board, idx) => (
-          <BoardCard key={board.id} board={board} index={startIdx + idx} />
-        ))}
-      </div>
-
-      {/* Pagination */}
-      {totalPages > 1 && (
-        <div className="flex items-center justify-center gap-2">
+        {streaming ? (
           <Button
             variant="outline"
             size="sm"
-            onClick={() => setPage((p) => Math.max(0, p - 1))}
-            disabled={page === 0}
-            className="border-amber-200"
+            onClick={cancelGeneration}
+            className="border-amber-200 text-amber-700 hover:bg-amber-50"
           >
-            <ChevronLeft className="w-4 h-4" />
+            <X className="w-4 h-4 mr-1" />
+            Cancel
           </Button>
-
-          <div className="flex gap-1">
-            {Array.from({ length: totalPages }).map((_, i) => (
-              <button
-                key={i}
-                onClick={() => setPage(i)}
-                className={cn(
-                  "w-8 h-8 rounded-full text-sm font-medium transition-colors",
-                  page === i
-                    ? "bg-amber-600 text-white"
-                    : "text-amber-600 hover:bg-amber-100"
-                )}
-              >
-                {i + 1}
-              </button>
-            ))}
+        ) : (
+          <div className="flex gap-2">
+            <Button
+              variant="outline"
+              size="sm"
+              onClick={() => setShowAnalytics((show) => !show)}
+              className={cn(
+                "border-amber-200 text-amber-700 hover:bg-amber-50",
+                showAnalytics && "bg-amber-100"
+              )}
+            >
+              <BarChart3 className="w-4 h-4 mr-1" />
+              Analytics
+            </Button>
+            <Button
+              variant="outline"
+              size="sm"
+              onClick={regenerate}
+              className="border-amber-200 text-amber-700 hover:bg-amber-50"
+            >
+              <RefreshCw className="w-4 h-4 mr-1" />
+              Regenerate
+            </Button>
           </div>
+        )}
+      </div>
 
-          <Button
-            variant="outline"
-            size="sm"
-            onClick={() => setPage((p) => Math.min(totalPages - 1, p + 1))}
-            disabled={page === totalPages - 1}
-            className="border-amber-200"
-          >
-            <ChevronRight className="w-4 h-4" />
-          </Button>
+      {/* Stats */}
+      {stats && (
+        <div className="grid grid-cols-2 md:grid-cols-5 gap-3">
+          <StatCard
+            icon={Clock}
+            label="Time"
+            value={`${stats.generationTimeMs.toFixed(0)}ms`}
+          />
+          <StatCard
+            icon={Zap}
+            label="Solver"
+            value={SOLVER_LABELS[stats.solverUsed]}
+          />
+          <StatCard
+            icon={BarChart3}
+            label="Max Overlap"
+            value={`${stats.maxOverlap} items`}
+          />
+          <StatCard
+            icon={BarChart3}
+            label="Avg Overlap"
+            value={`${stats.avgOverlap.toFixed(1)} items`}
+          />
+          <SeedCard seed={stats.seedUsed} />
         </div>
       )}
+
+      {/* Analytics (computed in a worker on demand) */}
+      {stats && showAnalytics && (
+        <BoardAnalyticsPanel
+          boards={boards}
+          items={config.items}
+          boardSize={config.boardConfig.rows * config.boardConfig.cols}
+        />
+      )}
+
+      {/* Board Grid */}
+      <VirtualBoardGrid
+        boards={boards}
+        boardRows={config.boardConfig.rows}
+        boardCols={config.boardConfig.cols}
+        renderBoard={(board) => (
+          <BoardCard board={board} cols={config.boardConfig.cols} />
+        )}
+      />
     </div>
   );
 }
@@ -218,14 +232,18 @@ function SeedCard({ seed }: { seed: number }) {
   );
 }
 
-function BoardCard({ board, index }: { board: GeneratedBoard; index: number }) {
+// Memoized: cards stay mounted while the virtual window shifts around them
+const BoardCard = memo(function BoardCard({
+  board,
+  cols,
+}: {
+  board: GeneratedBoard;
+  cols: number;
+}) {
   const [isHovered, setIsHovered] = useState(false);
 
   return (
-    <motion.div
-      initial={{ opacity: 0, scale: 0.95 }}
-      animate={{ opacity: 1, scale: 1 }}
-      transition={{ delay: (index % BOARDS_PER_PAGE) * 0.02 }}
+    <div
       className="relative"
       onMouseEnter={() => setIsHovered(true)}
       onMouseLeave={() => setIsHovered(false)}
@@ -248,14 +266,14 @@ function BoardCard({ board, index }: { board: GeneratedBoard; index: number }) {
           </Badge>
         </div>
 
-        {/* Grid */}
+        {/* Grid (flat row-major items; CSS wraps them into rows) */}
         <div
           className="grid gap-0.5"
           style={{
-            gridTemplateColumns: `repeat(${board.grid[0]?.length || 4}, 1fr)`,
+            gridTemplateColumns: `repeat(${cols}, 1fr)`,
           }}
         >
-          {board.grid.flat().map((item, i) => (
+          {board.items.map((item, i) => (
             <div
               key={i}
               className="aspect-square bg-gradient-to-br from-amber-50 to-orange-50 rounded-sm flex items-center justify-center text-[11px] text-amber-700 font-medium p-0.5 text-center leading-tight border border-amber-100/50"
@@ -269,7 +287,7 @@ function BoardCard({ board, index }: { board: GeneratedBoard; index: number }) {
 
       {/* Hover tooltip with item names */}
       {isHovered && (
-        <div className="absolute z-10 left-full ml-2 top-0 w-48 bg-white rounded-lg shadow-xl border border-amber-200 p-2 text-xs">
+        <div className="absolute z-10 inset-x-0 top-full mt-1 bg-white rounded-lg shadow-xl border border-amber-200 p-2 text-xs">
           <div className="font-medium text-amber-900 mb-1">
             Board #{board.boardNumber}
           </div>
@@ -282,7 +300,7 @@ function BoardCard({ board, index }: { board: GeneratedBoard; index: number }) {
           </div>
         </div>
       )}
-    </motion.div>
+    </div>
   );
-}
+});
 
@@ -0,0 +1,180 @@
+"use client";
+
+import {
+  useCallback,
+  useEffect,
+  useLayoutEffect,
+  useRef,
+  useState,
+  type FormEvent,
+  type ReactNode,
+} from "react";
+import { Search } from "lucide-react";
+import { Input } from "@/components/ui/input";
+import { cn } from "@/lib/utils";
+import {
+  computeVirtualWindow,
+  gridColumns,
+  parseBoardQuery,
+  scrollTopForIndex,
+} from "@/lib/utils/virtual-grid";
+import type { GeneratedBoard } from "@/lib/types";
+
+/** Scroll viewport height (px) */
+const VIEWPORT_HEIGHT = 640;
+/** Narrowest card before a column is dropped (px) */
+const MIN_CARD_WIDTH = 150;
+const MAX_COLUMNS = 6;
+/** Matches the grid's gap-3 (px) */
+const GAP = 12;
+/** Rows rendered above and below the viewport */
+const OVERSCAN_ROWS = 2;
+/** Card padding, border and badge around the cell grid (px), used until a row is measured */
+const CARD_CHROME_HEIGHT = 46;
+/** How long a jumped-to board stays highlighted (ms) */
+const HIGHLIGHT_MS = 2000;
+
+/**
+ * Scrolling board grid that only mounts the rows in view
+ *
+ * Cards in a row share one width and layout, so every row has the same
+ * height: the first rendered card is measured and its height sets the
+ * stride for the whole grid. DOM size stays at a few rows of cards no
+ * matter how many boards there are.
+ */
+export function VirtualBoardGrid({
+  boards,
+  boardRows,
+  boardCols,
+  renderBoard,
+}: {
+  boards: GeneratedBoard[];
+  boardRows: number;
+  boardCols: number;
+  renderBoard: (board: GeneratedBoard) => ReactNode;
+}) {
+  const viewportRef = useRef<HTMLDivElement>(null);
+  const observerRef = useRef<ResizeObserver | null>(null);
+  const [width, setWidth] = useState(0);
+  const [measuredHeight, setMeasuredHeight] = useState<number | null>(null);
+  const [scrollRow, setScrollRow] = useState(0);
+  const [query, setQuery] = useState("");
+  const [invalidQuery, setInvalidQuery] = useState(false);
+  const [highlighted, setHighlighted] = useState<number | null>(null);
+
+  // Track the viewport width (columns follow it)
+  useLayoutEffect(() => {
+    const viewport = viewportRef.current;
+    if (!viewport) return;
+    setWidth(viewport.clientWidth);
+    const observer = new ResizeObserver(() => setWidth(viewport.clientWidth));
+    observer.observe(viewport);
+    return () => observer.disconnect();
+  }, []);
+
+  // Measure the first rendered card; all rows share its height
+  const measureRef = useCallback((el: HTMLDivElement | null) => {
+    observerRef.current?.disconnect();
+    observerRef.current = null;
+    if (!el) return;
+    const observer = new ResizeObserver(() => setMeasuredHeight(el.offsetHeight));
+    observer.observe(el);
+    observerRef.current = observer;
+  }, []);
+
+  useEffect(() => {
+    if (highlighted === null) return;
+    const timer = setTimeout(() => setHighlighted(null), HIGHLIGHT_MS);
+    return () => clearTimeout(timer);
+  }, [highlighted]);
+
+  const columns = gridColumns(width, MIN_CARD_WIDTH, GAP, MAX_COLUMNS);
+  const cardWidth = (width - GAP * (columns - 1)) / columns;
+  const rowHeight =
+    measuredHeight ?? CARD_CHROME_HEIGHT + (cardWidth * boardRows) / boardCols;
+  const rowStride = rowHeight + GAP;
+
+  // Scroll state is kept as a row index, so scrolling within a row doesn't
+  // re-render; one extra row of viewport covers the part scrolled past
+  const range = computeVirtualWindow({
+    count: boards.length,
+    columns,
+    rowStride,
+    scrollTop: scrollRow * rowStride,
+    viewportHeight: VIEWPORT_HEIGHT + rowStride,
+    overscanRows: OVERSCAN_ROWS,
+  });
+
+  const handleScroll = () => {
+    const viewport = viewportRef.current;
+    if (viewport) setScrollRow(Math.floor(viewport.scrollTop / rowStride));
+  };
+
+  const handleJump = (e: FormEvent) => {
+    e.preventDefault();
+    const index = parseBoardQuery(query, boards.length);
+    setInvalidQuery(index < 0);
+    if (index < 0 || !viewportRef.current) return;
+    viewportRef.current.scrollTop = scrollTopForIndex(index, columns, rowStride);
+    setHighlighted(index);
+  };
+
+  const visible = boards.slice(range.startIndex, range.endIndex);
+
+  return (
+    <div className="space-y-3">
+      {/* Jump to board */}
+      <form onSubmit={handleJump} className="flex items-center gap-2 max-w-xs">
+        <div className="relative flex-1">
+          <Search className="absolute left-2.5 top-1/2 -translate-y-1/2 w-4 h-4 text-amber-400" />
+          <Input
+            value={query}
+            onChange={(e) => {
+              setQuery(e.target.value);
+              setInvalidQuery(false);
+            }}
+            placeholder={`Jump to board (1-${boards.length})`}
+            inputMode="numeric"
+            aria-label="Jump to board"
+            aria-invalid={invalidQuery}
+            className="pl-8 border-amber-200 focus:border-amber-400"
+          />
+        </div>
+      </form>
+
+      {/* Board grid (only the rows in view are mounted) */}
+      <div
+        ref={viewportRef}
+        onScroll={handleScroll}
+        className="overflow-y-auto overflow-x-hidden pr-1"
+        style={{ maxHeight: VIEWPORT_HEIGHT }}
+      >
+        <div className="relative" style={{ height: range.totalHeight }}>
+          <div
+            className="grid gap-3"
+            style={{
+              gridTemplateColumns: `repeat(${columns}, minmax(0, 1fr))`,
+              transform: `translateY(${range.offsetTop}px)`,
+            }}
+          >
+            {visible.map((board, k) => {
+              const index = range.startIndex + k;
+              return (
+                <div
+                  key={board.id}
+                  ref={k === 0 ? measureRef : undefined}
+                  className={cn(
+                    "rounded-lg",
+                    highlighted === index && "ring-2 ring-amber-500 ring-offset-2"
+                  )}
+                >
+                  {renderBoard(board)}
+                </div>
+              );
+            })}
+          </div>
+        </div>
+      </div>
+    </div>
+  );
+}
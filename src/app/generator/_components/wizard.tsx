@@ -1,7 +1,15 @@
 "use client";
 
+import { useEffect } from "react";
 import { motion, AnimatePresence } from "framer-motion";
-import { useGeneratorStore, useCurrentStep, useIsGenerating } from "@/stores/generator-store";
+import { Button } from "@/components/ui/button";
+import {
+  useGeneratorStore,
+  useCurrentStep,
+  useIsGenerating,
+  useProgress,
+  useStreamedBoards,
+} from "@/stores/generator-store";
 import { StepIndicator } from "./step-indicator";
 import { StepItems } from "./step-items";
 import { StepBoard } from "./step-board";
@@ -9,7 +17,7 @@ import { StepDistribution } from "./step-distribution";
 import { StepPreview } from "./step-preview";
 import { StepExport } from "./step-export";
 import { WizardNavigation } from "./wizard-navigation";
-import type { WizardStep } from "@/lib/types";
+import type { GenerationProgress, WizardStep } from "@/lib/types";
 
 const stepComponents: Record<WizardStep, React.ComponentType> = {
   items: StepItems,
@@ -19,11 +27,35 @@ const stepComponents: Record<WizardStep, React.ComponentType> = {
   export: StepExport,
 };
 
+/** Spinner caption for the latest streamed progress event */
+function describeProgress(progress: GenerationProgress | null): string {
+  switch (progress?.phase) {
+    case "model-built":
+      return "Solving...";
+    case "solved":
+      return "Reducing overlap...";
+    case "local-search":
+      return `Reducing overlap (max ${progress.maxOverlap} shared items)...`;
+    default:
+      return "Generating boards...";
+  }
+}
+
 export function Wizard() {
   const currentStep = useCurrentStep();
   const isGenerating = useIsGenerating();
+  const progress = useProgress();
+  const hasStreamedBoards = useStreamedBoards().length > 0;
+  const cancelGeneration = useGeneratorStore((s) => s.cancelGeneration);
   const StepComponent = stepComponents[currentStep];
 
+  // Leaving the wizard abandons any in-flight generation
+  useEffect(() => cancelGeneration, [cancelGeneration]);
+
+  // The preview renders streamed boards itself once they start arriving
+  const showSpinner =
+    isGenerating && !(currentStep === "preview" && hasStreamedBoards);
+
   return (
     <div className="bg-white rounded-2xl shadow-xl shadow-amber-900/5 border border-amber-100 overflow-hidden">
       {/* Step Indicator */}
@@ -39,11 +71,19 @@ export function Wizard() {
             exit={{ opacity: 0, x: -20 }}
             transition={{ duration: 0.2 }}
           >
-            {isGenerating ? (
+            {showSpinner ? (
               <div className="flex items-center justify-center h-64">
                 <div className="text-center">
                   <div className="inline-block w-12 h-12 border-4 border-amber-200 border-t-amber-600 rounded-full animate-spin mb-4" />
-                  <p className="text-amber-700">Generating boards...</p>
+                  <p className="text-amber-700">{describeProgress(progress)}</p>
+                  <Button
+                    variant="ghost"
+                    size="sm"
+                    onClick={cancelGeneration}
+                    className="mt-3 text-amber-600 hover:bg-amber-50"
+                  >
+                    Cancel
+                  </Button>
                 </div>
               </div>
             ) : (
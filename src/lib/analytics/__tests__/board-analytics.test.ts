@@ -0,0 +1,110 @@
+/**
+ * Board Analytics Tests
+ *
+ * Checks the bitset-based analytics against a direct Set-based count.
+ */
+
+import { describe, it, expect } from "vitest";
+import { boardAnalyticsInput, computeBoardAnalytics } from "../board-analytics";
+import type { GeneratedBoard, Item } from "@/lib/types";
+
+// ============================================================================
+// HELPERS
+// ============================================================================
+
+function createItems(count: number): Item[] {
+  return Array.from({ length: count }, (_, i) => ({
+    id: String(i + 1).padStart(3, "0"),
+    name: `Item ${i + 1}`,
+  }));
+}
+
+/** Boards with S distinct items each, picked by a fixed stride */
+function createBoards(items: Item[], numBoards: number, size: number): GeneratedBoard[] {
+  return Array.from({ length: numBoards }, (_, b) => {
+    const boardItems = Array.from(
+      { length: size },
+      (_, k) => items[(b * 5 + k * 7) % items.length]
+    );
+    return {
+      id: `board-${b + 1}`,
+      boardNumber: b + 1,
+      items: boardItems,
+      grid: [boardItems],
+    };
+  });
+}
+
+function naiveOverlap(a: GeneratedBoard, b: GeneratedBoard): number {
+  const ids = new Set(a.items.map((item) => item.id));
+  return b.items.filter((item) => ids.has(item.id)).length;
+}
+
+// ============================================================================
+// TESTS
+// ============================================================================
+
+describe("Board analytics", () => {
+  const items = createItems(60);
+  const boards = createBoards(items, 40, 16);
+  const analytics = computeBoardAnalytics(boardAnalyticsInput(boards, items, 16));
+
+  it("counts the boards carrying each item", () => {
+    const expected = items.map(
+      (item) => boards.filter((b) => b.items.some((i) => i.id === item.id)).length
+    );
+    expect(Array.from(analytics.itemCounts)).toEqual(expected);
+  });
+
+  it("matches a direct count of the overlap distribution", () => {
+    const expected = new Array(17).fill(0);
+    let max = 0;
+    for (let b1 = 0; b1 < boards.length; b1++) {
+      for (let b2 = b1 + 1; b2 < boards.length; b2++) {
+        const overlap = naiveOverlap(boards[b1], boards[b2]);
+        expected[overlap]++;
+        max = Math.max(max, overlap);
+      }
+    }
+
+    expect(Array.from(analytics.overlapCounts)).toEqual(expected);
+    expect(analytics.maxOverlap).toBe(max);
+  });
+
+  it("fills a symmetric heatmap with one cell per board pair", () => {
+    expect(analytics.heatmapSize).toBe(40);
+    expect(analytics.boardsPerCell).toBe(1);
+    expect(analytics.heatmap[3 * 40 + 17]).toBe(naiveOverlap(boards[3], boards[17]));
+    expect(analytics.heatmap[17 * 40 + 3]).toBe(analytics.heatmap[3 * 40 + 17]);
+    expect(analytics.heatmap[5 * 40 + 5]).toBe(0);
+  });
+
+  it("bins large results, keeping each cell's worst pair", () => {
+    const binned = computeBoardAnalytics(boardAnalyticsInput(boards, items, 16), {
+      maxHeatmapSize: 16,
+    });
+
+    expect(binned.boardsPerCell).toBe(3);
+    expect(binned.heatmapSize).toBe(14);
+    let worst = 0;
+    for (let b1 = 0; b1 < 3; b1++) {
+      for (let b2 = 3; b2 < 6; b2++) worst = Math.max(worst, naiveOverlap(boards[b1], boards[b2]));
+    }
+    expect(binned.heatmap[0 * 14 + 1]).toBe(worst);
+  });
+
+  it("lists the most similar pairs first", () => {
+    const { mostSimilar } = analytics;
+    expect(mostSimilar).toHaveLength(10);
+    expect(mostSimilar[0].overlap).toBe(analytics.maxOverlap);
+    for (let k = 1; k < mostSimilar.length; k++) {
+      expect(mostSimilar[k].overlap).toBeLessThanOrEqual(mostSimilar[k - 1].overlap);
+    }
+    const { first, second, overlap } = mostSimilar[0];
+    expect(naiveOverlap(boards[first], boards[second])).toBe(overlap);
+  });
+
+  it("rejects boards holding items missing from the table", () => {
+    expect(() => boardAnalyticsInput(boards, items.slice(0, 10), 16)).toThrow(/Unknown item/);
+  });
+});
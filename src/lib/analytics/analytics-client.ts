@@ -0,0 +1,88 @@
+/**
+ * Board Analytics Client
+ *
+ * Runs computeBoardAnalytics in a dedicated Web Worker so the all-pairs
+ * scan never blocks the main thread. Each run gets a fresh worker that is
+ * terminated when it answers or when the run is aborted. Board indices
+ * are transferred to the worker and the result arrays transferred back,
+ * so nothing is copied either way.
+ *
+ * Falls back to computing inline where Worker is unavailable.
+ */
+
+import {
+  computeBoardAnalytics,
+  type BoardAnalytics,
+  type BoardAnalyticsInput,
+} from "./board-analytics";
+
+// ============================================================================
+// TYPES
+// ============================================================================
+
+/** Message sent to the analytics worker */
+export interface AnalyticsWorkerRequest {
+  id: number;
+  input: BoardAnalyticsInput;
+}
+
+/** Message sent back by the analytics worker */
+export type AnalyticsWorkerResponse =
+  | { id: number; analytics: BoardAnalytics }
+  | { id: number; error: string };
+
+let nextRequestId = 0;
+
+// ============================================================================
+// CLIENT
+// ============================================================================
+
+/**
+ * Compute board analytics off the main thread
+ *
+ * `input.indices` is transferred and unusable afterwards.
+ *
+ * @throws DOMException "AbortError" if `signal` aborts first
+ */
+export function runBoardAnalytics(
+  input: BoardAnalyticsInput,
+  signal?: AbortSignal
+): Promise<BoardAnalytics> {
+  if (typeof Worker === "undefined") {
+    return Promise.resolve().then(() => computeBoardAnalytics(input));
+  }
+
+  return new Promise((resolve, reject) => {
+    if (signal?.aborted) {
+      reject(new DOMException("Analytics aborted", "AbortError"));
+      return;
+    }
+
+    const id = nextRequestId++;
+    const worker = new Worker(new URL("./analytics-worker.ts", import.meta.url));
+
+    const finish = () => {
+      worker.terminate();
+      signal?.removeEventListener("abort", onAbort);
+    };
+    const onAbort = () => {
+      finish();
+      reject(new DOMException("Analytics aborted", "AbortError"));
+    };
+
+    worker.addEventListener("message", (event: MessageEvent<AnalyticsWorkerResponse>) => {
+      if (event.data.id !== id) return;
+      finish();
+      if ("error" in event.data) reject(new Error(event.data.error));
+      else resolve(event.data.analytics);
+    });
+    worker.addEventListener("error", (event) => {
+      finish();
+      reject(new Error(event.message || "Analytics worker failed"));
+    });
+    signal?.addEventListener("abort", onAbort);
+
+    const request: AnalyticsWorkerRequest = { id, input };
+    worker.postMessage(request, [input.indices.buffer]);
+  });
+}
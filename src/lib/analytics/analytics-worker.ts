@@ -0,0 +1,31 @@
+/**
+ * Board Analytics Worker Entry
+ *
+ * Runs inside a browser Web Worker spawned by the analytics client.
+ * Computes analytics for one result per message and transfers the typed
+ * arrays back.
+ */
+
+import { computeBoardAnalytics } from "./board-analytics";
+import type { AnalyticsWorkerRequest, AnalyticsWorkerResponse } from "./analytics-client";
+
+self.addEventListener("message", (event: MessageEvent<AnalyticsWorkerRequest>) => {
+  const { id, input } = event.data;
+  try {
+    const analytics = computeBoardAnalytics(input);
+    const response: AnalyticsWorkerResponse = { id, analytics };
+    self.postMessage(response, {
+      transfer: [
+        analytics.itemCounts.buffer,
+        analytics.overlapCounts.buffer,
+        analytics.heatmap.buffer,
+      ],
+    });
+  } catch (error) {
+    const response: AnalyticsWorkerResponse = {
+      id,
+      error: error instanceof Error ? error.message : "Unknown error",
+    };
+    self.postMessage(response);
+  }
+});
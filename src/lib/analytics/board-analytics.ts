@@ -0,0 +1,175 @@
+/**
+ * Board Analytics
+ *
+ * Per-item and per-pair statistics for a generated result: how many
+ * boards carry each item, how pairwise overlaps are distributed, a
+ * board×board overlap heatmap and the most similar pairs. Boards are
+ * loaded into a BoardBitset so every pair costs ⌈N/32⌉ AND + popcount
+ * steps; 1,000 boards (~500k pairs) take tens of milliseconds.
+ *
+ * Pure and DOM-free: runs in the analytics Web Worker, and inline where
+ * workers are unavailable.
+ */
+
+import type { GeneratedBoard, Item } from "@/lib/types";
+import {
+  addItem,
+  createBoardBitset,
+  overlapCount,
+} from "@/lib/solver/board-bitset";
+
+// ============================================================================
+// TYPES
+// ============================================================================
+
+/** Boards as item indices (transferable to a worker) */
+export interface BoardAnalyticsInput {
+  numItems: number;
+  numBoards: number;
+  /** Cells per board */
+  boardSize: number;
+  /** Board b occupies indices[b × boardSize, (b + 1) × boardSize) */
+  indices: Uint16Array;
+}
+
+/** Two boards and the number of items they share (0-based positions) */
+export interface SimilarPair {
+  first: number;
+  second: number;
+  overlap: number;
+}
+
+export interface BoardAnalytics {
+  /** Boards carrying each item, by item index */
+  itemCounts: Uint32Array;
+  /** Board pairs per overlap value 0..boardSize */
+  overlapCounts: Uint32Array;
+  /** Heatmap side length (cells); min(numBoards, maxHeatmapSize) */
+  heatmapSize: number;
+  /** Boards per heatmap row / column */
+  boardsPerCell: number;
+  /** Largest overlap between distinct boards in each cell, row-major */
+  heatmap: Uint16Array;
+  maxOverlap: number;
+  /** Highest-overlap pairs, most similar first */
+  mostSimilar: SimilarPair[];
+}
+
+export interface BoardAnalyticsOptions {
+  /** Heatmap resolution cap; larger results are binned (default 1024) */
+  maxHeatmapSize?: number;
+  /** Similar pairs to report (default 10) */
+  topPairs?: number;
+}
+
+const DEFAULT_MAX_HEATMAP_SIZE = 1024;
+const DEFAULT_TOP_PAIRS = 10;
+
+// ============================================================================
+// INPUT
+// ============================================================================
+
+/**
+ * Pack boards as indices into an item table (matched by item id)
+ *
+ * @throws If a board holds an item missing from the table
+ */
+export function boardAnalyticsInput(
+  boards: GeneratedBoard[],
+  items: Item[],
+  boardSize: number
+): BoardAnalyticsInput {
+  const indexById = new Map(items.map((item, i) => [item.id, i]));
+  const indices = new Uint16Array(boards.length * boardSize);
+
+  boards.forEach((board, b) => {
+    board.items.slice(0, boardSize).forEach((item, k) => {
+      const index = indexById.get(item.id);
+      if (index === undefined) throw new Error(`Unknown item "${item.id}"`);
+      indices[b * boardSize + k] = index;
+    });
+  });
+
+  return {
+    numItems: items.length,
+    numBoards: boards.length,
+    boardSize,
+    indices,
+  };
+}
+
+// ============================================================================
+// ANALYTICS
+// ============================================================================
+
+/**
+ * Compute item frequencies, the overlap distribution and the heatmap
+ */
+export function computeBoardAnalytics(
+  { numItems, numBoards: B, boardSize: S, indices }: BoardAnalyticsInput,
+  options: BoardAnalyticsOptions = {}
+): BoardAnalytics {
+  const maxHeatmapSize = options.maxHeatmapSize ?? DEFAULT_MAX_HEATMAP_SIZE;
+  const topPairs = options.topPairs ?? DEFAULT_TOP_PAIRS;
+
+  const set = createBoardBitset(numItems, B);
+  const itemCounts = new Uint32Array(numItems);
+  for (let b = 0; b < B; b++) {
+    for (let k = 0; k < S; k++) {
+      const i = indices[b * S + k];
+      addItem(set, b, i);
+      itemCounts[i]++;
+    }
+  }
+
+  const boardsPerCell = Math.max(1, Math.ceil(B / maxHeatmapSize));
+  const heatmapSize = Math.ceil(B / boardsPerCell);
+  const heatmap = new Uint16Array(heatmapSize * heatmapSize);
+  const overlapCounts = new Uint32Array(S + 1);
+  const mostSimilar: SimilarPair[] = [];
+  let maxOverlap = 0;
+
+  for (let b1 = 0; b1 < B; b1++) {
+    const row = Math.floor(b1 / boardsPerCell);
+    for (let b2 = b1 + 1; b2 < B; b2++) {
+      const overlap = overlapCount(set, b1, b2);
+      overlapCounts[overlap]++;
+      if (overlap > maxOverlap) maxOverlap = overlap;
+
+      const col = Math.floor(b2 / boardsPerCell);
+      if (overlap > heatmap[row * heatmapSize + col]) {
+        heatmap[row * heatmapSize + col] = overlap;
+        heatmap[col * heatmapSize + row] = overlap;
+      }
+
+      if (
+        topPairs > 0 &&
+        (mostSimilar.length < topPairs ||
+          overlap > mostSimilar[mostSimilar.length - 1].overlap)
+      ) {
+        insertPair(mostSimilar, { first: b1, second: b2, overlap }, topPairs);
+      }
+    }
+  }
+
+  return {
+    itemCounts,
+    overlapCounts,
+    heatmapSize,
+    boardsPerCell,
+    heatmap,
+    maxOverlap,
+    mostSimilar,
+  };
+}
+
+/**
+ * Insert into a list sorted by descending overlap, keeping `limit` entries
+ * (earlier pairs win ties)
+ */
+function insertPair(pairs: SimilarPair[], pair: SimilarPair, limit: number): void {
+  let k = pairs.length;
+  while (k > 0 && pairs[k - 1].overlap < pair.overlap) k--;
+  pairs.splice(k, 0, pair);
+  if (pairs.length > limit) pairs.pop();
+}
@@ -0,0 +1,66 @@
+/**
+ * Combinatorics Tests
+ */
+
+import { describe, it, expect } from "vitest";
+import {
+  binomial,
+  binomialAtLeast,
+  binomialExact,
+  logBinomial,
+  logFactorial,
+} from "../combinatorics";
+
+describe("Combinatorics", () => {
+  describe("binomialExact", () => {
+    it("should compute exact values past 2^53", () => {
+      expect(binomialExact(36, 16)).toBe(BigInt(7307872110));
+      expect(binomialExact(100, 50).toString()).toBe(
+        "100891344545564193334812497256"
+      );
+      expect(binomialExact(3, 5)).toBe(BigInt(0));
+    });
+  });
+
+  describe("binomial", () => {
+    it("should be exact within the safe integer range", () => {
+      expect(binomial(36, 16)).toBe(7307872110);
+      expect(binomial(50, 25)).toBe(126410606437752);
+      expect(binomial(10, 0)).toBe(1);
+    });
+
+    it("should approximate huge values instead of losing them", () => {
+      expect(binomial(100, 50) / 1.0089134454556419e29).toBeCloseTo(1, 9);
+      expect(binomial(5000, 2500)).toBe(Infinity);
+    });
+  });
+
+  describe("logFactorial", () => {
+    it("should agree between the table and Stirling's series", () => {
+      let exact = 0;
+      for (let k = 1; k <= 5000; k++) exact += Math.log(k);
+
+      expect(logFactorial(5000)).toBeCloseTo(exact, 6);
+      expect(logFactorial(4097) - logFactorial(4096)).toBeCloseTo(Math.log(4097), 9);
+    });
+  });
+
+  describe("logBinomial", () => {
+    it("should stay finite for large n", () => {
+      expect(logBinomial(100_000, 50_000)).toBeCloseTo(69308.736, 2);
+      expect(logBinomial(5, 6)).toBe(-Infinity);
+    });
+  });
+
+  describe("binomialAtLeast", () => {
+    it("should decide exact ties correctly", () => {
+      expect(binomialAtLeast(5, 3, 10)).toBe(true);
+      expect(binomialAtLeast(5, 3, 11)).toBe(false);
+      expect(binomialAtLeast(60, 30, 118264581564861424)).toBe(true);
+    });
+
+    it("should handle counts beyond Number.MAX_VALUE", () => {
+      expect(binomialAtLeast(5000, 2500, 1e6)).toBe(true);
+    });
+  });
+});
@@ -0,0 +1,150 @@
+/**
+ * Constraints Engine Tests
+ *
+ * Memoization, single-pass frequency bounds and validation of very large
+ * configurations.
+ */
+
+import { describe, it, expect } from "vitest";
+import {
+  computeConstraints,
+  galeRyserViolation,
+  precheckFeasibility,
+  validateConstraints,
+} from "../engine";
+import type { GeneratorConfig } from "@/lib/types";
+
+// ============================================================================
+// HELPERS
+// ============================================================================
+
+function createConfig(
+  numItems: number,
+  numBoards: number,
+  rows: number,
+  cols: number,
+  prefix = "Item"
+): GeneratorConfig {
+  return {
+    items: Array.from({ length: numItems }, (_, i) => ({
+      id: String(i + 1).padStart(2, "0"),
+      name: `${prefix} ${i + 1}`,
+    })),
+    numBoards,
+    boardConfig: { rows, cols },
+    distribution: { type: "uniform" },
+  };
+}
+
+// ============================================================================
+// TESTS
+// ============================================================================
+
+describe("Constraints Engine", () => {
+  describe("memoization", () => {
+    it("should reuse results for configs with the same dimensions", () => {
+      const a = createConfig(36, 15, 4, 4, "Apple");
+      const b = createConfig(36, 15, 4, 4, "Banana");
+
+      expect(validateConstraints(b)).toBe(validateConstraints(a));
+      expect(computeConstraints(b)).toBe(computeConstraints(a));
+    });
+
+    it("should recompute when a dimension or the distribution changes", () => {
+      const base = createConfig(36, 15, 4, 4);
+      const custom: GeneratorConfig = {
+        ...base,
+        distribution: {
+          type: "grouped",
+          groups: [{ startIndex: 0, endIndex: 35, frequency: 6 }],
+        },
+      };
+
+      expect(validateConstraints(createConfig(36, 16, 4, 4))).not.toBe(
+        validateConstraints(base)
+      );
+      expect(computeConstraints(custom).frequencies[0]).toBe(6);
+      expect(computeConstraints(base).frequencies[0]).toBe(7);
+    });
+
+    it("should return the cached result when a slider returns to a value", () => {
+      const first = validateConstraints(createConfig(36, 20, 4, 4));
+      for (let B = 21; B <= 60; B++) validateConstraints(createConfig(36, B, 4, 4));
+
+      expect(validateConstraints(createConfig(36, 20, 4, 4))).toBe(first);
+    });
+  });
+
+  describe("computeConstraints", () => {
+    it("should report frequency bounds", () => {
+      // 15 × 16 = 240 slots over 36 items → 24 items × 7, 12 items × 6
+      const c = computeConstraints(createConfig(36, 15, 4, 4));
+
+      expect(c.sumFrequencies).toBe(240);
+      expect(c.maxFrequency).toBe(7);
+      expect(c.minFrequency).toBe(6);
+    });
+  });
+
+  describe("UNIQUE_BOARDS", () => {
+    it("should validate configurations whose board count overflows a double", () => {
+      // C(2000, 400) ≈ 10^431
+      const validations = validateConstraints(createConfig(2000, 1000, 20, 20));
+      const unique = validations.find((v) => v.constraint === "UNIQUE_BOARDS");
+
+      expect(unique?.isValid).toBe(true);
+      expect(unique?.message).toMatch(/e\+43\d possible boards/);
+    });
+  });
+
+  describe("precheckFeasibility", () => {
+    it("should pass a solvable configuration", () => {
+      expect(precheckFeasibility(createConfig(36, 15, 4, 4))).toEqual([]);
+    });
+
+    it("should return the blocking checks for an infeasible configuration", () => {
+      // 3 items on 2 boards of 4: each item needs 3 boards
+      const failures = precheckFeasibility(createConfig(3, 2, 2, 2));
+
+      expect(failures.map((v) => v.constraint)).toContain("MAX_FREQUENCY");
+      expect(failures.every((v) => v.severity === "error")).toBe(true);
+    });
+
+    it("should ignore warnings and non-blocking checks", () => {
+      // Low diversity, but solvable
+      expect(precheckFeasibility(createConfig(16, 10, 3, 3))).toEqual([]);
+    });
+
+    it("should flag negative custom frequencies", () => {
+      const config: GeneratorConfig = {
+        ...createConfig(4, 2, 1, 2),
+        distribution: {
+          type: "custom",
+          frequencies: [
+            { itemId: "01", frequency: 2 },
+            { itemId: "02", frequency: 2 },
+            { itemId: "03", frequency: 1 },
+            { itemId: "04", frequency: -1 },
+          ],
+        },
+      };
+
+      expect(precheckFeasibility(config)).toMatchObject([
+        { constraint: "DEGREE_SEQUENCE", isValid: false },
+      ]);
+    });
+  });
+
+  describe("galeRyserViolation", () => {
+    it("should accept realizable degree sequences", () => {
+      expect(galeRyserViolation([2, 2, 1, 1], 3, 2)).toBeNull();
+      expect(galeRyserViolation([3, 3, 3], 3, 3)).toBeNull();
+    });
+
+    it("should report the first violated prefix", () => {
+      expect(galeRyserViolation([4, 1, 1], 3, 2)).toBe(1);
+      expect(galeRyserViolation([2, 2, 1], 3, 2)).toBe(0);
+      expect(galeRyserViolation([3, 3, -1, 1], 3, 2)).toBe(0);
+    });
+  });
+});
@@ -0,0 +1,127 @@
+/**
+ * Request Validation Tests
+ *
+ * Body size caps, N/B caps and schema checks for /api/generate bodies.
+ */
+
+import { describe, it, expect } from "vitest";
+import {
+  type RequestLimits,
+  RequestValidationError,
+  readJsonBody,
+  validateGeneratorConfig,
+} from "../request-validation";
+import type { GeneratorConfig } from "@/lib/types";
+
+// ============================================================================
+// HELPERS
+// ============================================================================
+
+const LIMITS: RequestLimits = {
+  maxBodyBytes: 1024,
+  maxItems: 50,
+  maxBoards: 100,
+  maxBoardSize: 25,
+  maxAssignmentSize: 2000,
+  maxTimeBudgetMs: 30000,
+};
+
+function createConfig(numItems = 16, numBoards = 8): GeneratorConfig {
+  return {
+    items: Array.from({ length: numItems }, (_, i) => ({
+      id: String(i + 1),
+      name: `Item ${i + 1}`,
+    })),
+    numBoards,
+    boardConfig: { rows: 2, cols: 2 },
+    distribution: { type: "uniform" },
+  };
+}
+
+function rejection(fn: () => unknown): RequestValidationError {
+  try {
+    fn();
+  } catch (error) {
+    if (error instanceof RequestValidationError) return error;
+    throw error;
+  }
+  throw new Error("Expected a RequestValidationError");
+}
+
+function postRequest(body: string, headers: Record<string, string> = {}): Request {
+  return new Request("http://localhost/api/generate", {
+    method: "POST",
+    body,
+    headers,
+  });
+}
+
+// ============================================================================
+// TESTS
+// ============================================================================
+
+describe("validateGeneratorConfig", () => {
+  it("accepts a valid config unchanged", () => {
+    const config = {
+      ...createConfig(),
+      seed: 42,
+      solverMode: "quality",
+      timeBudgetMs: 5000,
+      optimizer: { type: "tabu", maxIterations: 100 },
+    };
+    expect(validateGeneratorConfig(config, LIMITS)).toBe(config);
+  });
+
+  it("rejects item and board counts over the caps with 413", () => {
+    expect(rejection(() => validateGeneratorConfig(createConfig(51), LIMITS)).status).toBe(413);
+    expect(rejection(() => validateGeneratorConfig(createConfig(16, 101), LIMITS)).status).toBe(413);
+    // 50 × 50 is within each cap but over the assignment cap
+    expect(rejection(() => validateGeneratorConfig(createConfig(50, 50), LIMITS)).status).toBe(413);
+  });
+
+  it("rejects oversized boards with 413", () => {
+    const config = { ...createConfig(), boardConfig: { rows: 6, cols: 5 } };
+    expect(rejection(() => validateGeneratorConfig(config, LIMITS)).status).toBe(413);
+  });
+
+  it.each([
+    ["a non-object", 42],
+    ["missing items", { ...createConfig(), items: undefined }],
+    ["an item without an id", { ...createConfig(), items: [{ name: "x" }] }],
+    ["duplicate ids", { ...createConfig(), items: [{ id: "1", name: "a" }, { id: "1", name: "b" }] }],
+    ["fractional boards", { ...createConfig(), numBoards: 2.5 }],
+    ["zero rows", { ...createConfig(), boardConfig: { rows: 0, cols: 4 } }],
+    ["an unknown distribution", { ...createConfig(), distribution: { type: "random" } }],
+    ["bad custom frequencies", { ...createConfig(), distribution: { type: "custom", frequencies: [{ itemId: "1", frequency: "2" }] } }],
+    ["an unknown solver mode", { ...createConfig(), solverMode: "best" }],
+    ["a time budget over the cap", { ...createConfig(), timeBudgetMs: 60000 }],
+    ["an unknown optimizer", { ...createConfig(), optimizer: { type: "genetic" } }],
+  ])("rejects %s with 422", (_, value) => {
+    expect(rejection(() => validateGeneratorConfig(value, LIMITS)).status).toBe(422);
+  });
+
+  it("reports every schema problem at once", () => {
+    const config = { ...createConfig(), numBoards: -1, solverMode: "best", seed: "x" };
+    expect(rejection(() => validateGeneratorConfig(config, LIMITS)).errors).toHaveLength(3);
+  });
+});
+
+describe("readJsonBody", () => {
+  it("parses a body within the limit", async () => {
+    await expect(readJsonBody(postRequest('{"a":1}'), 1024)).resolves.toEqual({ a: 1 });
+  });
+
+  it("rejects a declared Content-Length over the limit", async () => {
+    const request = postRequest("{}", { "content-length": "4096" });
+    await expect(readJsonBody(request, 1024)).rejects.toMatchObject({ status: 413 });
+  });
+
+  it("rejects a streamed body over the limit", async () => {
+    const body = JSON.stringify({ pad: "x".repeat(2048) });
+    await expect(readJsonBody(postRequest(body), 1024)).rejects.toMatchObject({ status: 413 });
+  });
+
+  it("rejects invalid JSON with 400", async () => {
+    await expect(readJsonBody(postRequest("{nope"), 1024)).rejects.toMatchObject({ status: 400 });
+  });
+});
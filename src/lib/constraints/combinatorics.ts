@@ -0,0 +1,112 @@
+/**
+ * Combinatorics
+ *
+ * Exact and log-space binomial coefficients for constraint validation.
+ * Floating-point products lose precision past 2^53 and overflow to
+ * Infinity for realistic item counts, so:
+ *
+ * - exact values come from BigInt products (binomialExact)
+ * - magnitudes come from ln(n!) — a cached table for small n, Stirling's
+ *   series beyond it — so ln C(n, k) is O(1) for any n
+ * - comparisons against a target are decided in log space, with exact
+ *   BigInt arithmetic only for near-ties
+ *
+ * BigInt is built with BigInt() calls (the TS target predates literals).
+ */
+
+// ============================================================================
+// LOG FACTORIALS
+// ============================================================================
+
+/** ln(k!) is tabulated up to this k; larger k use Stirling's series */
+const LOG_FACTORIAL_TABLE_LIMIT = 4096;
+
+/** ln(k!) for k = 0, 1, 2, … (grown on demand, never recomputed) */
+let logFactorials = new Float64Array([0]);
+
+const HALF_LOG_TWO_PI = 0.5 * Math.log(2 * Math.PI);
+
+/**
+ * ln(n!) in O(1) (amortized)
+ */
+export function logFactorial(n: number): number {
+  if (n < 0) return NaN;
+  if (n > LOG_FACTORIAL_TABLE_LIMIT) {
+    // Stirling: ln n! = n ln n − n + ½ ln(2πn) + 1/12n − 1/360n³ + 1/1260n⁵
+    const inv = 1 / n;
+    const inv2 = inv * inv;
+    return (
+      n * Math.log(n) -
+      n +
+      HALF_LOG_TWO_PI +
+      0.5 * Math.log(n) +
+      inv * (1 / 12 - inv2 * (1 / 360 - inv2 / 1260))
+    );
+  }
+  if (n >= logFactorials.length) {
+    const size = Math.min(
+      LOG_FACTORIAL_TABLE_LIMIT + 1,
+      Math.max(n + 1, logFactorials.length * 2)
+    );
+    const table = new Float64Array(size);
+    table.set(logFactorials);
+    for (let k = logFactorials.length; k < size; k++) {
+      table[k] = table[k - 1] + Math.log(k);
+    }
+    logFactorials = table;
+  }
+  return logFactorials[n];
+}
+
+/**
+ * ln C(n, k) (−Infinity when k is out of range)
+ */
+export function logBinomial(n: number, k: number): number {
+  if (k < 0 || k > n) return -Infinity;
+  if (k === 0 || k === n) return 0;
+  return logFactorial(n) - logFactorial(k) - logFactorial(n - k);
+}
+
+// ============================================================================
+// EXACT VALUES
+// ============================================================================
+
+/** ln(2^53): below this a binomial is exactly representable as a number */
+const LOG_MAX_SAFE = Math.log(Number.MAX_SAFE_INTEGER);
+
+/** Exact C(n, k) as a BigInt */
+export function binomialExact(n: number, k: number): bigint {
+  if (k < 0 || k > n) return BigInt(0);
+  if (k > n - k) k = n - k;
+
+  // Each partial product C(n − k + i, i) is an integer, so division is exact
+  let result = BigInt(1);
+  for (let i = 1; i <= k; i++) {
+    result = (result * BigInt(n - k + i)) / BigInt(i);
+  }
+  return result;
+}
+
+/**
+ * C(n, k) as a number: exact up to 2^53, otherwise the nearest double
+ * (Infinity beyond ~1.8e308)
+ */
+export function binomial(n: number, k: number): number {
+  if (k < 0 || k > n) return 0;
+  const log = logBinomial(n, k);
+  if (log < LOG_MAX_SAFE) return Number(binomialExact(n, k));
+  return Math.exp(log);
+}
+
+/**
+ * Whether C(n, k) ≥ target, exactly
+ *
+ * Decided in log space; only values within rounding error of the target
+ * are settled with BigInt arithmetic.
+ */
+export function binomialAtLeast(n: number, k: number, target: number): boolean {
+  if (target <= 0) return true;
+  const margin = logBinomial(n, k) - Math.log(target);
+  if (Math.abs(margin) > 1e-9) return margin > 0;
+  return binomialExact(n, k) >= BigInt(Math.ceil(target));
+}
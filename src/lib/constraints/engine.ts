@@ -9,27 +9,25 @@ import type {
   SystemConstraints,
   DistributionStrategy,
   FrequencyGroup,
+  ConstraintType,
 } from "@/lib/types";
 import { getBoardSize } from "@/lib/types";
+import { binomial, binomialAtLeast, logBinomial } from "./combinatorics";
+
+export { binomial, logBinomial } from "./combinatorics";
 
 // ============================================================================
 // MATH UTILITIES
 // ============================================================================
 
 /**
- * Calculate binomial coefficient C(n, k) = n! / (k! × (n-k)!)
- * Uses iterative approach to avoid overflow
+ * Format a count given by its natural log (works past Number.MAX_VALUE)
  */
-export function binomial(n: number, k: number): number {
-  if (k > n) return 0;
-  if (k === 0 || k === n) return 1;
-  if (k > n - k) k = n - k; // Optimize: C(n,k) = C(n, n-k)
-
-  let result = 1;
-  for (let i = 0; i < k; i++) {
-    result = (result * (n - i)) / (i + 1);
-  }
-  return Math.round(result);
+function formatLogCount(logValue: number): string {
+  if (logValue < Math.log(1e15)) return formatNumber(Math.round(Math.exp(logValue)));
+  const exponent = Math.floor(logValue / Math.LN10);
+  const mantissa = Math.exp(logValue - exponent * Math.LN10);
+  return `${mantissa.toFixed(1)}e+${exponent}`;
 }
 
 /**
@@ -123,9 +121,9 @@ export function autoDistribute(
     i < remainder ? baseFreq + 1 : baseFreq
   );
 
-  // Check constraints
-  const maxFreq = Math.max(...frequencies);
-  const minFreq = Math.min(...frequencies);
+  // Check constraints (frequencies are baseFreq + 1 then baseFreq)
+  const maxFreq = remainder > 0 ? baseFreq + 1 : baseFreq;
+  const minFreq = baseFreq;
 
   if (maxFreq > numBoards) {
     return {
@@ -171,10 +169,50 @@ export function autoDistribute(
 // SYSTEM CONSTRAINTS CALCULATION
 // ============================================================================
 
+/**
+ * Constraints depend only on counts and the distribution, never on item
+ * names, so results are memoized by (N, B, rows, cols, distribution).
+ * Dragging a slider back and forth then costs a map lookup per step.
+ */
+const CONSTRAINT_CACHE_SIZE = 128;
+
+const constraintCache = new Map<string, SystemConstraints>();
+const validationCache = new Map<string, ConstraintValidation[]>();
+
+function constraintKey(config: GeneratorConfig): string {
+  const { rows, cols } = config.boardConfig;
+  return `${config.items.length}|${config.numBoards}|${rows}|${cols}|${JSON.stringify(config.distribution)}`;
+}
+
+/** Bounded memo (Map insertion order gives LRU eviction) */
+function memoize<T>(cache: Map<string, T>, key: string, compute: () => T): T {
+  const cached = cache.get(key);
+  if (cached !== undefined) {
+    cache.delete(key);
+    cache.set(key, cached);
+    return cached;
+  }
+  const value = compute();
+  cache.set(key, value);
+  if (cache.size > CONSTRAINT_CACHE_SIZE) {
+    cache.delete(cache.keys().next().value!);
+  }
+  return value;
+}
+
 /**
  * Compute all system constraints from configuration
+ *
+ * Memoized: callers must treat the result (including `frequencies`) as
+ * read-only.
  */
 export function computeConstraints(config: GeneratorConfig): SystemConstraints {
+  return memoize(constraintCache, constraintKey(config), () =>
+    evaluateConstraints(config)
+  );
+}
+
+function evaluateConstraints(config: GeneratorConfig): SystemConstraints {
   const N = config.items.length;
   const B = config.numBoards;
   const R = config.boardConfig.rows;
@@ -183,7 +221,16 @@ export function computeConstraints(config: GeneratorConfig): SystemConstraints {
   const T = B * S;
 
   const frequencies = calculateFrequencies(N, B, S, config.distribution);
-  const sumFrequencies = frequencies.reduce((a, b) => a + b, 0);
+
+  // Sum, min and max in one pass (no spread into Math.min/max)
+  let sumFrequencies = 0;
+  let minFrequency = frequencies.length > 0 ? Infinity : 0;
+  let maxFrequency = frequencies.length > 0 ? -Infinity : 0;
+  for (const f of frequencies) {
+    sumFrequencies += f;
+    if (f < minFrequency) minFrequency = f;
+    if (f > maxFrequency) maxFrequency = f;
+  }
 
   return {
     N,
@@ -194,9 +241,12 @@ export function computeConstraints(config: GeneratorConfig): SystemConstraints {
     C,
     frequencies,
     sumFrequencies,
+    minFrequency,
+    maxFrequency,
     minPossibleSlots: N,
     maxPossibleSlots: N * B,
     possibleUniqueBoards: binomial(N, S),
+    logPossibleUniqueBoards: logBinomial(N, S),
   };
 }
 
@@ -206,11 +256,17 @@ export function computeConstraints(config: GeneratorConfig): SystemConstraints {
 
 /**
  * Validate all constraints for a configuration
- * Returns array of validation results
+ * Returns array of validation results (memoized like computeConstraints)
  */
 export function validateConstraints(
   config: GeneratorConfig
 ): ConstraintValidation[] {
+  return memoize(validationCache, constraintKey(config), () =>
+    evaluateValidations(config)
+  );
+}
+
+function evaluateValidations(config: GeneratorConfig): ConstraintValidation[] {
   const validations: ConstraintValidation[] = [];
   const c = computeConstraints(config);
 
@@ -239,7 +295,7 @@ export function validateConstraints(
   });
 
   // 3. MIN_FREQUENCY: All fᵢ ≥ 1
-  const minFreq = Math.min(...c.frequencies);
+  const minFreq = c.minFrequency;
   const minFreqValid = minFreq >= 1;
   validations.push({
     isValid: minFreqValid,
@@ -252,7 +308,7 @@ export function validateConstraints(
   });
 
   // 4. MAX_FREQUENCY: All fᵢ ≤ B
-  const maxFreq = Math.max(...c.frequencies);
+  const maxFreq = c.maxFrequency;
   const maxFreqValid = maxFreq <= c.B;
   validations.push({
     isValid: maxFreqValid,
@@ -277,28 +333,28 @@ export function validateConstraints(
   });
 
   // 6. UNIQUE_BOARDS: C(N, S) ≥ B
-  const uniqueBoardsValid = c.possibleUniqueBoards >= c.B;
+  const uniqueBoardsValid = binomialAtLeast(c.N, c.S, c.B);
   
   // Generate helpful suggestions when invalid
   let uniqueBoardsMessage: string;
   if (uniqueBoardsValid) {
-    uniqueBoardsMessage = `${formatNumber(c.possibleUniqueBoards)} possible boards ≥ ${c.B} required`;
+    uniqueBoardsMessage = `${formatLogCount(c.logPossibleUniqueBoards)} possible boards ≥ ${c.B} required`;
   } else {
     const suggestions: string[] = [];
     
     // Suggestion 1: Add more items
-    // Find minimum items needed for C(N, S) >= B
+    // Find minimum items needed for C(N, S) >= B (log space, exact on ties)
     let minItemsNeeded = c.N;
-    while (binomial(minItemsNeeded, c.S) < c.B && minItemsNeeded < c.S * 3) {
+    while (!binomialAtLeast(minItemsNeeded, c.S, c.B) && minItemsNeeded < c.S * 3) {
       minItemsNeeded++;
     }
-    if (minItemsNeeded > c.N && binomial(minItemsNeeded, c.S) >= c.B) {
+    if (minItemsNeeded > c.N && binomialAtLeast(minItemsNeeded, c.S, c.B)) {
       suggestions.push(`add ${minItemsNeeded - c.N} more items (${minItemsNeeded} total)`);
     }
     
     // Suggestion 2: Reduce board size
     let smallerBoardSize = c.S - 1;
-    while (smallerBoardSize > 0 && binomial(c.N, smallerBoardSize) < c.B) {
+    while (smallerBoardSize > 0 && !binomialAtLeast(c.N, smallerBoardSize, c.B)) {
       smallerBoardSize--;
     }
     if (smallerBoardSize > 0 && smallerBoardSize < c.S) {
@@ -364,4 +420,88 @@ export function validateConstraints(
   return validations;
 }
 
+// ============================================================================
+// SOLVER PRECHECK
+// ============================================================================
+
+/** Checks that make a configuration unsolvable (not merely low quality) */
+const SOLVER_BLOCKING: ConstraintType[] = [
+  "SLOT_BALANCE",
+  "MAX_FREQUENCY",
+  "FEASIBILITY",
+];
+
+/**
+ * Gale–Ryser test: can items with frequencies f be placed on B boards of
+ * S distinct items each?
+ *
+ * An items × boards 0-1 matrix with row sums f and column sums S exists
+ * iff ∑f = B·S and, with f sorted descending, the k most frequent items
+ * need no more than B·min(S, k) slots for every k. With equal board
+ * sizes this follows from SLOT_BALANCE and MAX_FREQUENCY for non-negative
+ * frequencies; it is kept as the general condition.
+ *
+ * @returns The first violated k (1-based), 0 when the sums differ, or
+ * null when the sequence is realizable
+ */
+export function galeRyserViolation(
+  frequencies: readonly number[],
+  B: number,
+  S: number
+): number | null {
+  if (frequencies.some((f) => f < 0)) return 0;
+  const sorted = [...frequencies].sort((a, b) => b - a);
+  let total = 0;
+  for (let k = 1; k <= sorted.length; k++) {
+    total += sorted[k - 1];
+    if (total > B * Math.min(S, k)) return k;
+  }
+  return total === B * S ? null : 0;
+}
+
+/**
+ * Closed-form feasibility precheck run before any solver work
+ *
+ * Returns the failing SLOT_BALANCE / MAX_FREQUENCY / FEASIBILITY checks,
+ * plus a DEGREE_SEQUENCE (Gale–Ryser) error when those pass but no
+ * assignment exists. An empty array means a solver can succeed.
+ */
+export function precheckFeasibility(
+  config: GeneratorConfig
+): ConstraintValidation[] {
+  const failures = validateConstraints(config).filter(
+    (v) => !v.isValid && SOLVER_BLOCKING.includes(v.constraint)
+  );
+  if (failures.length > 0) return failures;
+
+  const c = computeConstraints(config);
+  const k = galeRyserViolation(c.frequencies, c.B, c.S);
+  if (k === null) return [];
+
+  if (k === 0) {
+    return [
+      {
+        isValid: false,
+        constraint: "DEGREE_SEQUENCE",
+        message: `Frequencies must be non-negative and sum to B × S = ${c.T}`,
+        severity: "error",
+        details: { expected: c.T, actual: c.sumFrequencies },
+      },
+    ];
+  }
 
+  const needed = [...c.frequencies]
+    .sort((a, b) => b - a)
+    .slice(0, k)
+    .reduce((a, b) => a + b, 0);
+  const available = c.B * Math.min(c.S, k);
+  return [
+    {
+      isValid: false,
+      constraint: "DEGREE_SEQUENCE",
+      message: `The ${k} most frequent items need ${needed} slots, but ${c.B} boards × ${Math.min(c.S, k)} can hold only ${available}. Lower those frequencies or add boards.`,
+      severity: "error",
+      details: { expected: available, actual: needed },
+    },
+  ];
+}
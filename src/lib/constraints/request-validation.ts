@@ -0,0 +1,310 @@
+/**
+ * Generate Request Validation
+ *
+ * Checks untrusted /api/generate bodies before any allocation-heavy work:
+ * the body is read with a byte cap, then the parsed value is checked
+ * field by field against GeneratorConfig and the configured size caps.
+ * Feasibility (slot balance, frequencies) is left to the engine's
+ * precheckFeasibility, which runs next in the route.
+ *
+ * Status codes:
+ * - 400: body is not JSON
+ * - 413: body, item count, board count or board size over the caps
+ * - 422: well-formed JSON that isn't a valid GeneratorConfig
+ *
+ * Server-only: import from route handlers, never from client code.
+ */
+
+import type { GeneratorConfig } from "@/lib/types";
+
+// ============================================================================
+// TYPES
+// ============================================================================
+
+/** Size caps for one generate request */
+export interface RequestLimits {
+  /** Maximum request body size (bytes) */
+  maxBodyBytes: number;
+  /** Maximum items (N) */
+  maxItems: number;
+  /** Maximum boards (B) */
+  maxBoards: number;
+  /** Maximum cells per board (rows × cols) */
+  maxBoardSize: number;
+  /** Maximum assignment size N × B */
+  maxAssignmentSize: number;
+  /** Maximum solver/optimizer time budget (ms) */
+  maxTimeBudgetMs: number;
+}
+
+export type RequestValidationStatus = 400 | 413 | 422;
+
+/** A request rejected before generation (carries every problem found) */
+export class RequestValidationError extends Error {
+  readonly status: RequestValidationStatus;
+  readonly errors: string[];
+
+  constructor(status: RequestValidationStatus, errors: string[]) {
+    super(errors.join("; "));
+    this.name = "RequestValidationError";
+    this.status = status;
+    this.errors = errors;
+  }
+}
+
+// ============================================================================
+// CONFIGURATION
+// ============================================================================
+
+function envNumber(name: string, fallback: number): number {
+  const value = Number(process.env[name]);
+  return Number.isFinite(value) && value > 0 ? value : fallback;
+}
+
+export function defaultRequestLimits(): RequestLimits {
+  return {
+    maxBodyBytes: envNumber("GENERATE_MAX_BODY_BYTES", 1024 * 1024),
+    maxItems: envNumber("GENERATE_MAX_ITEMS", 2000),
+    maxBoards: envNumber("GENERATE_MAX_BOARDS", 10000),
+    maxBoardSize: envNumber("GENERATE_MAX_BOARD_SIZE", 100),
+    maxAssignmentSize: envNumber("GENERATE_MAX_ASSIGNMENT_SIZE", 2_000_000),
+    maxTimeBudgetMs: envNumber("GENERATE_MAX_TIME_BUDGET_MS", 60000),
+  };
+}
+
+const MAX_ID_LENGTH = 64;
+const MAX_NAME_LENGTH = 200;
+const MAX_IMAGE_LENGTH = 2048;
+
+// ============================================================================
+// BODY
+// ============================================================================
+
+/**
+ * Read and parse a JSON body, giving up as soon as it exceeds `maxBytes`
+ * (the Content-Length header is checked first when present)
+ */
+export async function readJsonBody(
+  request: Request,
+  maxBytes: number
+): Promise<unknown> {
+  const tooLarge = () =>
+    new RequestValidationError(413, [
+      `Request body exceeds ${maxBytes} bytes`,
+    ]);
+
+  const declared = Number(request.headers.get("content-length"));
+  if (declared > maxBytes) throw tooLarge();
+
+  const chunks: Uint8Array[] = [];
+  let received = 0;
+  if (request.body) {
+    const reader = request.body.getReader();
+    for (;;) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      received += value.byteLength;
+      if (received > maxBytes) {
+        await reader.cancel();
+        throw tooLarge();
+      }
+      chunks.push(value);
+    }
+  }
+
+  const bytes = new Uint8Array(received);
+  let offset = 0;
+  for (const chunk of chunks) {
+    bytes.set(chunk, offset);
+    offset += chunk.byteLength;
+  }
+
+  try {
+    return JSON.parse(new TextDecoder().decode(bytes));
+  } catch {
+    throw new RequestValidationError(400, ["Request body must be valid JSON"]);
+  }
+}
+
+// ============================================================================
+// CONFIG
+// ============================================================================
+
+function isRecord(value: unknown): value is Record<string, unknown> {
+  return !!value && typeof value === "object" && !Array.isArray(value);
+}
+
+function isCount(value: unknown): value is number {
+  return Number.isSafeInteger(value) && (value as number) >= 0;
+}
+
+function isOptionalString(value: unknown, maxLength: number): boolean {
+  return (
+    value === undefined || (typeof value === "string" && value.length <= maxLength)
+  );
+}
+
+/**
+ * Validate an untrusted value as a GeneratorConfig within `limits`
+ *
+ * Size caps are checked before anything proportional to N or B is
+ * walked. Throws RequestValidationError (413 for caps, 422 otherwise).
+ */
+export function validateGeneratorConfig(
+  value: unknown,
+  limits: RequestLimits = defaultRequestLimits()
+): GeneratorConfig {
+  if (!isRecord(value)) {
+    throw new RequestValidationError(422, ["Config must be a JSON object"]);
+  }
+
+  // Size caps first, from O(1) fields only
+  const oversize: string[] = [];
+  const { items, numBoards, boardConfig } = value;
+  const N = Array.isArray(items) ? items.length : 0;
+  const B = isCount(numBoards) ? numBoards : 0;
+  if (N > limits.maxItems) {
+    oversize.push(`${N} items exceeds the limit of ${limits.maxItems}`);
+  }
+  if (B > limits.maxBoards) {
+    oversize.push(`${B} boards exceeds the limit of ${limits.maxBoards}`);
+  }
+  if (N * B > limits.maxAssignmentSize) {
+    oversize.push(
+      `${N} items × ${B} boards exceeds the limit of ${limits.maxAssignmentSize}`
+    );
+  }
+  if (isRecord(boardConfig) && isCount(boardConfig.rows) && isCount(boardConfig.cols)) {
+    const size = boardConfig.rows * boardConfig.cols;
+    if (size > limits.maxBoardSize) {
+      oversize.push(`Board size ${size} exceeds the limit of ${limits.maxBoardSize}`);
+    }
+  }
+  if (oversize.length > 0) throw new RequestValidationError(413, oversize);
+
+  const errors: string[] = [];
+
+  if (!Array.isArray(items) || N === 0) {
+    errors.push("items must be a non-empty array");
+  } else {
+    const ids = new Set<string>();
+    items.forEach((item, i) => {
+      if (
+        !isRecord(item) ||
+        typeof item.id !== "string" ||
+        item.id.length === 0 ||
+        item.id.length > MAX_ID_LENGTH ||
+        typeof item.name !== "string" ||
+        item.name.length > MAX_NAME_LENGTH ||
+        !isOptionalString(item.image, MAX_IMAGE_LENGTH)
+      ) {
+        errors.push(`items[${i}] must have a string id and name`);
+      } else if (ids.has(item.id)) {
+        errors.push(`items[${i}] duplicates id "${item.id}"`);
+      } else {
+        ids.add(item.id);
+      }
+    });
+  }
+
+  if (!isCount(numBoards) || numBoards < 1) {
+    errors.push("numBoards must be a positive integer");
+  }
+
+  if (
+    !isRecord(boardConfig) ||
+    !isCount(boardConfig.rows) ||
+    !isCount(boardConfig.cols) ||
+    boardConfig.rows < 1 ||
+    boardConfig.cols < 1
+  ) {
+    errors.push("boardConfig must have positive integer rows and cols");
+  }
+
+  errors.push(...validateDistribution(value.distribution, N));
+  errors.push(...validateSolverOptions(value, limits));
+
+  if (errors.length > 0) throw new RequestValidationError(422, errors);
+  return value as unknown as GeneratorConfig;
+}
+
+function validateDistribution(distribution: unknown, N: number): string[] {
+  if (!isRecord(distribution)) return ["distribution must be an object"];
+
+  switch (distribution.type) {
+    case "uniform":
+      return [];
+    case "grouped": {
+      const { groups } = distribution;
+      if (!Array.isArray(groups) || groups.length > N) {
+        return ["distribution.groups must be an array of at most one group per item"];
+      }
+      const valid = groups.every(
+        (g) =>
+          isRecord(g) &&
+          isCount(g.startIndex) &&
+          isCount(g.endIndex) &&
+          isCount(g.frequency)
+      );
+      return valid
+        ? []
+        : ["distribution.groups entries need integer startIndex, endIndex and frequency"];
+    }
+    case "custom": {
+      const { frequencies } = distribution;
+      if (!Array.isArray(frequencies) || frequencies.length > N) {
+        return ["distribution.frequencies must be an array of at most one entry per item"];
+      }
+      const valid = frequencies.every(
+        (f) =>
+          isRecord(f) &&
+          typeof f.itemId === "string" &&
+          f.itemId.length <= MAX_ID_LENGTH &&
+          isCount(f.frequency)
+      );
+      return valid
+        ? []
+        : ["distribution.frequencies entries need a string itemId and integer frequency"];
+    }
+    default:
+      return ['distribution.type must be "uniform", "grouped" or "custom"'];
+  }
+}
+
+function validateSolverOptions(
+  config: Record<string, unknown>,
+  limits: RequestLimits
+): string[] {
+  const errors: string[] = [];
+  const { seed, solverMode, timeBudgetMs, optimizer, bypassCache } = config;
+  const isBudget = (v: unknown) =>
+    v === undefined ||
+    (typeof v === "number" && v > 0 && v <= limits.maxTimeBudgetMs);
+
+  if (seed !== undefined && !Number.isSafeInteger(seed)) {
+    errors.push("seed must be an integer");
+  }
+  if (solverMode !== undefined && solverMode !== "fast" && solverMode !== "quality") {
+    errors.push('solverMode must be "fast" or "quality"');
+  }
+  if (!isBudget(timeBudgetMs)) {
+    errors.push(`timeBudgetMs must be between 0 and ${limits.maxTimeBudgetMs}`);
+  }
+  if (optimizer !== undefined) {
+    if (
+      !isRecord(optimizer) ||
+      !["local", "annealing", "tabu"].includes(optimizer.type as string)
+    ) {
+      errors.push('optimizer.type must be "local", "annealing" or "tabu"');
+    } else if (
+      !isBudget(optimizer.timeBudgetMs) ||
+      (optimizer.maxIterations !== undefined && !isCount(optimizer.maxIterations))
+    ) {
+      errors.push("optimizer limits must be positive numbers within the time budget cap");
+    }
+  }
+  if (bypassCache !== undefined && typeof bypassCache !== "boolean") {
+    errors.push("bypassCache must be a boolean");
+  }
+  return errors;
+}
@@ -0,0 +1,172 @@
+/**
+ * Batch Generation Tests
+ *
+ * Uses a fake runner so grouping, relabelling, concurrency and error
+ * isolation can be checked without the solver.
+ */
+
+import { describe, it, expect, vi } from "vitest";
+import type { GenerationResult, GeneratorConfig, Item } from "@/lib/types";
+import { type BatchRunner, relabelResult, runBatch, solverInputKey } from "../batch";
+
+// ============================================================================
+// HELPERS
+// ============================================================================
+
+function createConfig(prefix: string, seed?: number, numBoards = 2): GeneratorConfig {
+  return {
+    items: Array.from({ length: 4 }, (_, i) => ({
+      id: String(i + 1).padStart(2, "0"),
+      name: `${prefix} ${i + 1}`,
+    })),
+    numBoards,
+    boardConfig: { rows: 1, cols: 2 },
+    distribution: { type: "uniform" },
+    seed,
+  };
+}
+
+/** Result whose boards hold the config's own item objects */
+function fakeResult(config: GeneratorConfig): GenerationResult {
+  const [a, b, c, d] = config.items;
+  return {
+    success: true,
+    boards: [
+      { id: "board-1", boardNumber: 1, items: [a, b], grid: [[a, b]] },
+      { id: "board-2", boardNumber: 2, items: [c, d], grid: [[c, d]] },
+    ],
+    stats: { seedUsed: config.seed ?? 0 } as GenerationResult["stats"],
+  };
+}
+
+function collect(configs: GeneratorConfig[], run: BatchRunner, concurrency = 2) {
+  const results = new Map<number, GenerationResult>();
+  const errors = new Map<number, unknown>();
+  const done = runBatch(configs, run, {
+    concurrency,
+    onResult: (index, result) => results.set(index, result),
+    onError: (index, error) => errors.set(index, error),
+  });
+  return { done, results, errors };
+}
+
+const names = (items: Item[]) => items.map((item) => item.name);
+
+// ============================================================================
+// TESTS
+// ============================================================================
+
+describe("Batch Generation", () => {
+  it("should share one solve between configs that differ only in item names", async () => {
+    const configs = [createConfig("Venue A", 7), createConfig("Venue B", 7)];
+    const run = vi.fn(async (config: GeneratorConfig) => fakeResult(config));
+
+    const { done, results } = collect(configs, run);
+    await done;
+
+    expect(run).toHaveBeenCalledTimes(1);
+    expect(names(results.get(0)!.boards[0].items)).toEqual(["Venue A 1", "Venue A 2"]);
+    expect(names(results.get(1)!.boards[0].items)).toEqual(["Venue B 1", "Venue B 2"]);
+    expect(names(results.get(1)!.boards[1].grid[0])).toEqual(["Venue B 3", "Venue B 4"]);
+  });
+
+  it("should solve unseeded or differently sized configs separately", async () => {
+    const configs = [
+      createConfig("A"),
+      createConfig("B"),
+      createConfig("C", 7),
+      createConfig("D", 7, 4),
+    ];
+    const run = vi.fn(async (config: GeneratorConfig) => fakeResult(config));
+
+    const { done, results } = collect(configs, run);
+    await done;
+
+    expect(run).toHaveBeenCalledTimes(4);
+    expect(results.size).toBe(4);
+  });
+
+  it("should keep at most `concurrency` solves in flight", async () => {
+    const configs = Array.from({ length: 6 }, (_, i) => createConfig(`V${i}`, i));
+    let inFlight = 0;
+    let peak = 0;
+    const run: BatchRunner = async (config) => {
+      peak = Math.max(peak, ++inFlight);
+      await new Promise((resolve) => setTimeout(resolve, 1));
+      inFlight--;
+      return fakeResult(config);
+    };
+
+    const { done, results } = collect(configs, run, 2);
+    await done;
+
+    expect(peak).toBe(2);
+    expect(results.size).toBe(6);
+  });
+
+  it("should report failures per config without stopping the batch", async () => {
+    const configs = [createConfig("A", 1), createConfig("B", 2)];
+    const run: BatchRunner = async (config) => {
+      if (config.seed === 1) throw new Error("boom");
+      return fakeResult(config);
+    };
+
+    const { done, results, errors } = collect(configs, run);
+    await done;
+
+    expect(errors.get(0)).toMatchObject({ message: "boom" });
+    expect(results.has(1)).toBe(true);
+  });
+
+  it("should report malformed entries per index and still finish", async () => {
+    const run = vi.fn<BatchRunner>(async (config) => fakeResult(config));
+    const entries = [null, { seed: 1 }, createConfig("A", 1), createConfig("B", 1)];
+
+    const { done, results, errors } = collect(entries as GeneratorConfig[], run);
+    await done;
+
+    expect(errors.get(0)).toMatchObject({ name: "RequestValidationError" });
+    expect(errors.get(1)).toMatchObject({ name: "RequestValidationError" });
+    expect([...results.keys()].sort()).toEqual([2, 3]);
+    expect(run).toHaveBeenCalledTimes(1);
+  });
+
+  it("should validate group members that are only relabelled", async () => {
+    const oversized = createConfig("B", 1);
+    oversized.items[0] = { ...oversized.items[0], name: "x".repeat(10_000) };
+    const run = vi.fn<BatchRunner>(async (config) => fakeResult(config));
+
+    const { done, results, errors } = collect([createConfig("A", 1), oversized], run);
+    await done;
+
+    expect(results.has(0)).toBe(true);
+    expect(errors.get(1)).toMatchObject({ name: "RequestValidationError" });
+  });
+
+  it("should fan progress out to every config in a group", async () => {
+    const configs = [createConfig("A", 3), createConfig("B", 3)];
+    const progress = vi.fn();
+
+    await runBatch(
+      configs,
+      async (config, onProgress) => {
+        onProgress({ phase: "solved", elapsedMs: 1 });
+        return fakeResult(config);
+      },
+      { concurrency: 1, onProgress: progress, onResult: () => {}, onError: () => {} }
+    );
+
+    expect(progress).toHaveBeenCalledTimes(2);
+  });
+
+  it("should key configs by solver inputs only", () => {
+    expect(solverInputKey(createConfig("A", 1))).toBe(solverInputKey(createConfig("B", 1)));
+    expect(solverInputKey(createConfig("A", 1))).not.toBe(solverInputKey(createConfig("A", 2)));
+    expect(solverInputKey(createConfig("A"))).toBeNull();
+  });
+
+  it("should relabel items by id", () => {
+    const result = relabelResult(fakeResult(createConfig("A", 1)), createConfig("B", 1));
+    expect(names(result.boards[1].items)).toEqual(["B 3", "B 4"]);
+  });
+});
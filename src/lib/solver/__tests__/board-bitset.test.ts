@@ -0,0 +1,78 @@
+/**
+ * Board Bitset Tests
+ *
+ * Validates membership, popcount and overlap summaries of the packed
+ * board representation, including item indices beyond one 32-bit word.
+ */
+
+import { describe, it, expect } from "vitest";
+import {
+  addItem,
+  boardItemIndices,
+  boardSize,
+  cloneBoardBitset,
+  createBoardBitset,
+  hasItem,
+  overlapCount,
+  popcount32,
+  removeItem,
+  summarizeOverlaps,
+} from "../board-bitset";
+
+describe("popcount32", () => {
+  it("should count set bits across the full word", () => {
+    expect(popcount32(0)).toBe(0);
+    expect(popcount32(1)).toBe(1);
+    expect(popcount32(0xffffffff)).toBe(32);
+    expect(popcount32(0x80000001)).toBe(2);
+    expect(popcount32(0b1011_0110)).toBe(5);
+  });
+});
+
+describe("BoardBitset", () => {
+  it("should use ⌈N/32⌉ words per board", () => {
+    const set = createBoardBitset(70, 3);
+    expect(set.words).toBe(3);
+    expect(set.bits.length).toBe(9);
+  });
+
+  it("should add, query and remove items across word boundaries", () => {
+    const set = createBoardBitset(70, 2);
+    for (const i of [0, 31, 32, 69]) addItem(set, 1, i);
+
+    expect(boardItemIndices(set, 1)).toEqual([0, 31, 32, 69]);
+    expect(boardItemIndices(set, 0)).toEqual([]);
+    expect(hasItem(set, 1, 31)).toBe(true);
+    expect(hasItem(set, 0, 31)).toBe(false);
+
+    removeItem(set, 1, 31);
+    expect(hasItem(set, 1, 31)).toBe(false);
+    expect(boardSize(set, 1)).toBe(3);
+  });
+
+  it("should count overlaps with AND + popcount", () => {
+    const set = createBoardBitset(40, 3);
+    [1, 5, 33, 39].forEach((i) => addItem(set, 0, i));
+    [5, 33, 38].forEach((i) => addItem(set, 1, i));
+    [2, 3].forEach((i) => addItem(set, 2, i));
+
+    expect(overlapCount(set, 0, 1)).toBe(2);
+    expect(overlapCount(set, 0, 2)).toBe(0);
+
+    const summary = summarizeOverlaps(set);
+    expect(summary.minOverlap).toBe(0);
+    expect(summary.maxOverlap).toBe(2);
+    expect(summary.totalOverlap).toBe(2);
+    expect(summary.pairCount).toBe(3);
+  });
+
+  it("should clone without sharing storage", () => {
+    const set = createBoardBitset(8, 1);
+    addItem(set, 0, 3);
+    const copy = cloneBoardBitset(set);
+    removeItem(copy, 0, 3);
+
+    expect(hasItem(set, 0, 3)).toBe(true);
+    expect(hasItem(copy, 0, 3)).toBe(false);
+  });
+});
@@ -0,0 +1,311 @@
+/**
+ * Decomposition Solver Tests
+ *
+ * Block solves are stubbed with the cyclic assignment (inline) or with
+ * in-process fake workers, so splitting and merging are checked without
+ * loading HiGHS or spawning threads.
+ */
+
+import { describe, it, expect } from "vitest";
+import { EventEmitter } from "node:events";
+import {
+  addItem,
+  boardItemIndices,
+  createBoardBitset,
+  hasItem,
+  summarizeOverlaps,
+} from "../board-bitset";
+import {
+  type BlockWorker,
+  type BlockWorkerRequest,
+  DECOMPOSITION_THRESHOLD,
+  cyclicAssignment,
+  separateDuplicateBoards,
+  shouldDecompose,
+  solveDecomposed,
+  splitFrequencies,
+} from "../decomposition";
+import { createSeededRandom } from "../highs-solver";
+
+// ============================================================================
+// HELPERS
+// ============================================================================
+
+/** Worker that answers every block with the cyclic assignment */
+class FakeBlockWorker extends EventEmitter {
+  received: BlockWorkerRequest[] = [];
+  terminated = false;
+
+  postMessage(message: BlockWorkerRequest): void {
+    this.received.push(message);
+    const { index, N, B, frequencies } = message;
+    queueMicrotask(() =>
+      this.emit("message", {
+        index,
+        bits: cyclicAssignment(N, B, frequencies).bits,
+      })
+    );
+  }
+
+  async terminate(): Promise<number> {
+    this.terminated = true;
+    return 0;
+  }
+}
+
+function uniformFrequencies(N: number, B: number, S: number): number[] {
+  const base = Math.floor((B * S) / N);
+  const extra = (B * S) % N;
+  return Array.from({ length: N }, (_, i) => base + (i < extra ? 1 : 0));
+}
+
+function expectValidAssignment(
+  assignment: ReturnType<typeof cyclicAssignment>,
+  S: number,
+  frequencies: number[]
+) {
+  for (let b = 0; b < assignment.numBoards; b++) {
+    expect(boardItemIndices(assignment, b)).toHaveLength(S);
+  }
+  const usage = frequencies.map((_, i) => {
+    let count = 0;
+    for (let b = 0; b < assignment.numBoards; b++) {
+      if (hasItem(assignment, b, i)) count++;
+    }
+    return count;
+  });
+  expect(usage).toEqual(frequencies);
+}
+
+function distinctBoards(assignment: ReturnType<typeof cyclicAssignment>): number {
+  const keys = new Set<string>();
+  for (let b = 0; b < assignment.numBoards; b++) {
+    keys.add(boardItemIndices(assignment, b).join(","));
+  }
+  return keys.size;
+}
+
+// ============================================================================
+// TESTS
+// ============================================================================
+
+describe("Decomposition Solver", () => {
+  describe("splitFrequencies", () => {
+    it("should give every block exactly B_k·S slots", () => {
+      const freq = uniformFrequencies(30, 100, 16);
+      const blocks = splitFrequencies(freq, 100, 16, 7)!;
+
+      expect(blocks).toHaveLength(7);
+      expect(blocks.reduce((sum, b) => sum + b.numBoards, 0)).toBe(100);
+      for (const block of blocks) {
+        const slots = block.frequencies.reduce((sum, f) => sum + f, 0);
+        expect(slots).toBe(block.numBoards * 16);
+        expect(Math.max(...block.frequencies)).toBeLessThanOrEqual(block.numBoards);
+      }
+    });
+
+    it("should split each item's frequency proportionally", () => {
+      const freq = [40, 30, 20, 10];
+      const blocks = splitFrequencies(freq, 50, 2, 5)!;
+
+      freq.forEach((f, i) => {
+        const shares = blocks.map((b) => b.frequencies[i]);
+        expect(shares.reduce((sum, x) => sum + x, 0)).toBe(f);
+        expect(Math.max(...shares) - Math.min(...shares)).toBeLessThanOrEqual(1);
+      });
+    });
+
+    it("should reject frequencies that don't fill the boards", () => {
+      expect(splitFrequencies([3, 3], 4, 2, 2)).toBeNull();
+      expect(splitFrequencies([5, 3], 4, 2, 2)).toBeNull();
+    });
+  });
+
+  describe("separateDuplicateBoards", () => {
+    it("should make identical boards distinct without changing frequencies", () => {
+      const assignment = createBoardBitset(12, 6);
+      for (let b = 0; b < 6; b++) {
+        for (let i = 0; i < 4; i++) addItem(assignment, b, b < 3 ? i : i + 4);
+      }
+      const freq = [3, 3, 3, 3, 3, 3, 3, 3, 0, 0, 0, 0];
+
+      expect(separateDuplicateBoards(assignment, createSeededRandom(3))).toBe(0);
+      expect(distinctBoards(assignment)).toBe(6);
+      expectValidAssignment(assignment, 4, freq);
+    });
+
+    it("should report duplicates that can't be separated", () => {
+      const assignment = cyclicAssignment(3, 4, [4, 4, 4]);
+      expect(separateDuplicateBoards(assignment, createSeededRandom(3))).toBe(3);
+    });
+  });
+
+  describe("cyclicAssignment", () => {
+    it("should build a valid assignment", () => {
+      const freq = uniformFrequencies(25, 40, 9);
+      expectValidAssignment(cyclicAssignment(25, 40, freq), 9, freq);
+    });
+  });
+
+  describe("solveDecomposed", () => {
+    it("should merge inline block solves into a valid assignment", async () => {
+      const freq = uniformFrequencies(40, 60, 16);
+      const solved: number[] = [];
+
+      const assignment = await solveDecomposed(40, 60, 16, freq, {
+        workers: 0,
+        solveBlock: async (N, B, S, f) => {
+          solved.push(B);
+          return cyclicAssignment(N, B, f);
+        },
+      });
+
+      expect(solved.length).toBeGreaterThanOrEqual(2);
+      expect(solved.reduce((sum, b) => sum + b, 0)).toBe(60);
+      expectValidAssignment(assignment!, 16, freq);
+    });
+
+    it("should return distinct boards at decomposition scale", async () => {
+      for (const [N, B, S] of [
+        [100, 5000, 16],
+        [200, 2000, 25],
+      ]) {
+        const freq = uniformFrequencies(N, B, S);
+        expect(shouldDecompose(N, B)).toBe(true);
+
+        const assignment = (await solveDecomposed(N, B, S, freq, {
+          workers: 0,
+          solveBlock: async (n, b, s, f) => cyclicAssignment(n, b, f),
+          random: createSeededRandom(42),
+        }))!;
+
+        expectValidAssignment(assignment, S, freq);
+        expect(distinctBoards(assignment)).toBe(B);
+        expect(summarizeOverlaps(assignment).maxOverlap).toBeLessThan(S);
+      }
+    });
+
+    it("should fall back to the cyclic layout for failed blocks", async () => {
+      const freq = uniformFrequencies(20, 30, 5);
+
+      const assignment = await solveDecomposed(20, 30, 5, freq, {
+        workers: 0,
+        solveBlock: async () => null,
+      });
+
+      expectValidAssignment(assignment!, 5, freq);
+    });
+
+    it("should solve blocks on workers and terminate them", async () => {
+      const freq = uniformFrequencies(30, 50, 8);
+      const workers: FakeBlockWorker[] = [];
+
+      const assignment = await solveDecomposed(30, 50, 8, freq, {
+        workers: 2,
+        solveBlock: async () => null,
+        createWorker: () => {
+          const worker = new FakeBlockWorker();
+          workers.push(worker);
+          return worker as unknown as BlockWorker;
+        },
+      });
+
+      expect(workers).toHaveLength(2);
+      expect(workers.every((w) => w.terminated)).toBe(true);
+      expectValidAssignment(assignment!, 8, freq);
+    });
+
+    it("should solve a failed worker's blocks inline", async () => {
+      const freq = uniformFrequencies(30, 50, 8);
+      const inline: number[] = [];
+      let spawned = 0;
+
+      const assignment = await solveDecomposed(30, 50, 8, freq, {
+        workers: 2,
+        solveBlock: async (N, B, S, f) => {
+          inline.push(B);
+          return cyclicAssignment(N, B, f);
+        },
+        createWorker: () => {
+          // Second worker errors on its first block
+          const worker = new FakeBlockWorker();
+          if (spawned++ === 1) {
+            worker.postMessage = (message) =>
+              queueMicrotask(() =>
+                worker.emit("message", { index: message.index, error: "boom" })
+              );
+          }
+          return worker as unknown as BlockWorker;
+        },
+      });
+
+      expect(inline.length).toBeGreaterThan(0);
+      expectValidAssignment(assignment!, 8, freq);
+    });
+
+    it("should solve inline when no worker can be spawned", async () => {
+      const freq = uniformFrequencies(20, 30, 5);
+      let inline = 0;
+
+      const assignment = await solveDecomposed(20, 30, 5, freq, {
+        workers: 2,
+        solveBlock: async (N, B, S, f) => {
+          inline++;
+          return cyclicAssignment(N, B, f);
+        },
+        createWorker: () => {
+          throw new Error("spawn failed");
+        },
+      });
+
+      expect(inline).toBeGreaterThanOrEqual(2);
+      expectValidAssignment(assignment!, 5, freq);
+    });
+
+    it("should solve inline unless DECOMPOSITION_WORKERS is set", async () => {
+      const freq = uniformFrequencies(20, 30, 5);
+      const saved = process.env.DECOMPOSITION_WORKERS;
+      let spawned = 0;
+      const options = {
+        solveBlock: async (N: number, B: number, S: number, f: number[]) =>
+          cyclicAssignment(N, B, f),
+        createWorker: () => {
+          spawned++;
+          return new FakeBlockWorker() as unknown as BlockWorker;
+        },
+      };
+
+      try {
+        delete process.env.DECOMPOSITION_WORKERS;
+        await solveDecomposed(20, 30, 5, freq, options);
+        expect(spawned).toBe(0);
+
+        process.env.DECOMPOSITION_WORKERS = "2";
+        await solveDecomposed(20, 30, 5, freq, options);
+        expect(spawned).toBe(2);
+      } finally {
+        if (saved === undefined) delete process.env.DECOMPOSITION_WORKERS;
+        else process.env.DECOMPOSITION_WORKERS = saved;
+      }
+    });
+
+    it("should reject when aborted", async () => {
+      const freq = uniformFrequencies(10, 10, 4);
+
+      await expect(
+        solveDecomposed(10, 10, 4, freq, {
+          workers: 0,
+          solveBlock: async (N, B, S, f) => cyclicAssignment(N, B, f),
+          signal: AbortSignal.abort(),
+        })
+      ).rejects.toBeDefined();
+    });
+  });
+
+  describe("shouldDecompose", () => {
+    it("should only decompose above the variable threshold", () => {
+      expect(shouldDecompose(36, 100)).toBe(false);
+      expect(shouldDecompose(100, DECOMPOSITION_THRESHOLD / 100 + 1)).toBe(true);
+    });
+  });
+});
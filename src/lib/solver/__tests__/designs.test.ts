@@ -0,0 +1,118 @@
+/**
+ * Combinatorial Design Tests
+ *
+ * Every construction is checked against a direct pairwise overlap count,
+ * so the reported max overlap is verified rather than trusted.
+ */
+
+import { describe, it, expect } from "vitest";
+import { boardSize, hasItem, summarizeOverlaps } from "../board-bitset";
+import {
+  constructDesign,
+  findDifferenceSet,
+  overlapLowerBound,
+} from "../designs";
+
+// ============================================================================
+// HELPERS
+// ============================================================================
+
+function uniform(N: number, B: number, S: number): number[] {
+  return Array(N).fill((B * S) / N);
+}
+
+/** Count how often each nonzero difference occurs in a set mod v */
+function differenceCounts(set: number[], v: number): number[] {
+  const counts = new Array(v).fill(0);
+  for (const x of set) {
+    for (const y of set) {
+      if (x !== y) counts[(((x - y) % v) + v) % v]++;
+    }
+  }
+  return counts.slice(1);
+}
+
+function expectConstruction(N: number, B: number, S: number) {
+  const frequencies = uniform(N, B, S);
+  const design = constructDesign(N, B, S, frequencies);
+  expect(design).not.toBeNull();
+
+  const { assignment, maxOverlap } = design!;
+  for (let b = 0; b < B; b++) expect(boardSize(assignment, b)).toBe(S);
+  for (let i = 0; i < N; i++) {
+    let count = 0;
+    for (let b = 0; b < B; b++) if (hasItem(assignment, b, i)) count++;
+    expect(count).toBe(frequencies[i]);
+  }
+  expect(summarizeOverlaps(assignment).maxOverlap).toBe(maxOverlap);
+  return design!;
+}
+
+// ============================================================================
+// TESTS
+// ============================================================================
+
+describe("Combinatorial Designs", () => {
+  describe("findDifferenceSet", () => {
+    it.each([
+      [7, 3, 1],
+      [11, 5, 2],
+      [13, 4, 1],
+      [31, 6, 1],
+      [43, 21, 10],
+      [57, 8, 1],
+      [31, 16, 8],
+    ])("should find a (%i, %i, %i) difference set", (v, k, lambda) => {
+      const found = findDifferenceSet(v, k);
+
+      expect(found).not.toBeNull();
+      expect(found!.set).toHaveLength(k);
+      expect(found!.lambda).toBe(lambda);
+      expect(new Set(differenceCounts(found!.set, v))).toEqual(new Set([lambda]));
+    });
+
+    it("should return null when no family matches", () => {
+      expect(findDifferenceSet(36, 16)).toBeNull();
+    });
+  });
+
+  describe("constructDesign", () => {
+    it("should meet the lower bound with a difference set", () => {
+      const design = expectConstruction(13, 13, 4);
+
+      expect(design.family).toBe("difference-set");
+      expect(design.maxOverlap).toBe(overlapLowerBound(13, 13, 4, uniform(13, 13, 4)));
+    });
+
+    it("should build disjoint boards when items are used at most once", () => {
+      const frequencies = [...Array(32).fill(1), ...Array(4).fill(0)];
+      const design = constructDesign(36, 2, 16, frequencies);
+
+      expect(design).toMatchObject({ family: "disjoint", maxOverlap: 0 });
+      expect(summarizeOverlaps(design!.assignment).maxOverlap).toBe(0);
+    });
+
+    it.each([
+      [54, 54, 16],
+      [54, 27, 16],
+      [48, 48, 16],
+      [100, 50, 8],
+    ])("should build a near-optimal family for N=%i, B=%i, S=%i", (N, B, S) => {
+      const design = expectConstruction(N, B, S);
+
+      expect(design.family).toBe("difference-family");
+      expect(design.maxOverlap).toBeLessThanOrEqual(
+        overlapLowerBound(N, B, S, uniform(N, B, S)) + 1
+      );
+    });
+
+    it("should not apply to unequal frequencies", () => {
+      const frequencies = [...Array(24).fill(7), ...Array(12).fill(6)];
+      expect(constructDesign(36, 15, 16, frequencies)).toBeNull();
+    });
+
+    it("should reject frequencies that don't fill the boards", () => {
+      expect(constructDesign(13, 13, 4, uniform(13, 12, 4))).toBeNull();
+    });
+  });
+});
@@ -7,12 +7,8 @@
  * 3. Determinism - seeded generation produces consistent results
  */
 
-import { describe, it, expect, beforeEach, afterEach } from "vitest";
-import {
-  generateBoardsWithHiGHS,
-  setSeed,
-  resetSeed,
-} from "../highs-solver";
+import { describe, it, expect } from "vitest";
+import { generateBoardsWithHiGHS } from "../highs-solver";
 import { validateConstraints, binomial } from "@/lib/constraints/engine";
 import type { GeneratorConfig, Item } from "@/lib/types";
 
@@ -58,10 +54,6 @@ function getSignatures(
 // ============================================================================
 
 describe("Pigeonhole Principle", () => {
-  beforeEach(() => {
-    resetSeed();
-  });
-
   it("should handle near-maximum theoretical boards (N=20, S=4, B=C(20,4)=4845 is max)", async () => {
     // C(20,4) = 4845 possible unique boards
     // Let's request a reasonable fraction of the max
@@ -123,10 +115,6 @@ describe("Pigeonhole Principle", () => {
 // ============================================================================
 
 describe("Impossible Configurations", () => {
-  beforeEach(() => {
-    resetSeed();
-  });
-
   it("should fail gracefully when boards requested > C(N,S)", async () => {
     // C(5,4) = 5 possible unique boards, requesting 10
     const config = createConfig(5, 10, 2, 2);
@@ -252,10 +240,6 @@ describe("Impossible Configurations", () => {
 // ============================================================================
 
 describe("Determinism with Seeds", () => {
-  afterEach(() => {
-    resetSeed();
-  });
-
   it("should produce identical results with the same seed via config", async () => {
     // Pass seed via config (the user-facing API)
     const config1 = { ...createConfig(20, 5, 3, 3), seed: 12345 };
@@ -333,6 +317,30 @@ describe("Determinism with Seeds", () => {
     expect(results[1]).toEqual(results[2]);
   });
 
+  it("should stay deterministic when seeded solves run concurrently", async () => {
+    const visualOrder = (boards: { items: Item[] }[]) =>
+      boards.map((b) => b.items.map((i) => i.id).join(","));
+
+    const configA = {
+      ...createConfig(20, 8, 3, 3),
+      seed: 7,
+      optimizer: { type: "annealing" as const, maxIterations: 2000 },
+    };
+    const configB = { ...createConfig(20, 8, 3, 3), seed: 8 };
+
+    const soloA = await generateBoardsWithHiGHS(configA);
+    const soloB = await generateBoardsWithHiGHS(configB);
+
+    // Interleave the two solves on the same process
+    const [concurrentA, concurrentB] = await Promise.all([
+      generateBoardsWithHiGHS(configA),
+      generateBoardsWithHiGHS(configB),
+    ]);
+
+    expect(visualOrder(concurrentA.boards)).toEqual(visualOrder(soloA.boards));
+    expect(visualOrder(concurrentB.boards)).toEqual(visualOrder(soloB.boards));
+  });
+
   it("should generate random seed when not provided", async () => {
     const config = createConfig(15, 3, 3, 3); // No seed
 
@@ -356,10 +364,6 @@ describe("Determinism with Seeds", () => {
 // ============================================================================
 
 describe("Stress Tests", () => {
-  beforeEach(() => {
-    resetSeed();
-  });
-
   it("should handle large board count efficiently (100 boards)", async () => {
     const config = createConfig(54, 100, 4, 4);
 
@@ -418,10 +422,6 @@ describe("Stress Tests", () => {
 // ============================================================================
 
 describe("Solver Failure Recovery", () => {
-  beforeEach(() => {
-    resetSeed();
-  });
-
   it("should fallback to greedy when HiGHS fails", async () => {
     // This test verifies the fallback mechanism exists
     // In normal conditions HiGHS should work, but we check the result type
@@ -447,5 +447,163 @@ describe("Solver Failure Recovery", () => {
 
     expect(hasError).toBe(true);
   });
+
+  it("should reject an infeasible config before solving", async () => {
+    // 3 items on 2 boards of 4 slots: every item would need 3 boards
+    const progress: string[] = [];
+
+    const result = await generateBoardsWithHiGHS(createConfig(3, 2, 2, 2), {
+      onProgress: (p) => progress.push(p.phase),
+    });
+
+    expect(result.success).toBe(false);
+    expect(result.errors?.join(" ")).toContain("exceed max frequency");
+    expect(progress).toEqual([]);
+  });
+});
+
+// ============================================================================
+// KNOWN DESIGNS
+// ============================================================================
+
+describe("Known Designs", () => {
+  // 13 items on 13 boards of 4: the (13, 4, 1) difference set applies
+  const designConfig = createConfig(13, 13, 2, 2);
+
+  it("should use a design in fast mode", async () => {
+    const result = await generateBoardsWithHiGHS({ ...designConfig, seed: 3 });
+
+    expect(result.stats.solverUsed).toBe("design");
+    expect(result.stats.construction).toBeDefined();
+  });
+
+  it("should not let a design override quality mode", async () => {
+    const result = await generateBoardsWithHiGHS({
+      ...designConfig,
+      seed: 3,
+      solverMode: "quality",
+      timeBudgetMs: 200,
+    });
+
+    expect(result.success).toBe(true);
+    expect(result.stats.solverUsed).not.toBe("design");
+    expect(result.stats.construction).toBeUndefined();
+  });
+
+  it("should not let a design override a chosen optimizer", async () => {
+    const result = await generateBoardsWithHiGHS({
+      ...designConfig,
+      seed: 3,
+      optimizer: { type: "tabu", maxIterations: 50 },
+    });
+
+    expect(result.stats.solverUsed).not.toBe("design");
+  });
+});
+
+// ============================================================================
+// TIMING BREAKDOWN
+// ============================================================================
+
+describe("Timing Breakdown", () => {
+  it("should report per-phase timings within the total", async () => {
+    const result = await generateBoardsWithHiGHS(createConfig(36, 15, 4, 4));
+    const { timings, generationTimeMs } = result.stats;
+
+    expect(timings).toBeDefined();
+    const phases = Object.values(timings!);
+    expect(phases.every((ms) => ms >= 0)).toBe(true);
+    expect(timings!.boardsMs).toBeGreaterThan(0);
+    expect(timings!.statsMs).toBeGreaterThan(0);
+
+    const sum = phases.reduce((total, ms) => total + ms, 0);
+    expect(sum).toBeLessThanOrEqual(generationTimeMs + 1);
+  });
+
+  it("should report optimizer counters for the selected strategy", async () => {
+    const result = await generateBoardsWithHiGHS({
+      ...createConfig(36, 15, 4, 4),
+      seed: 7,
+      optimizer: { type: "tabu", maxIterations: 200 },
+    });
+    const { optimizer, solverUsed } = result.stats;
+
+    // The greedy fallback skips the post-solve optimizer
+    if (solverUsed === "greedy") {
+      expect(optimizer).toBeUndefined();
+      return;
+    }
+    expect(optimizer?.strategy).toBe("tabu");
+    expect(optimizer!.iterations).toBeLessThanOrEqual(200);
+    expect(optimizer!.swapsAccepted).toBeLessThanOrEqual(optimizer!.swapsAttempted);
+  });
 });
 
+// ============================================================================
+// CANCELLATION
+// ============================================================================
+
+describe("Cancellation", () => {
+  it("should reject without solving when the signal is already aborted", async () => {
+    const progress: string[] = [];
+
+    await expect(
+      generateBoardsWithHiGHS(createConfig(36, 15, 4, 4), {
+        signal: AbortSignal.abort(),
+        onProgress: (p) => progress.push(p.phase),
+      })
+    ).rejects.toThrow();
+    expect(progress).toEqual([]);
+  });
+
+  it("should stop a solve that is aborted mid-generation", async () => {
+    const controller = new AbortController();
+    const progress: string[] = [];
+
+    await expect(
+      generateBoardsWithHiGHS(createConfig(36, 15, 4, 4), {
+        signal: controller.signal,
+        onProgress: (p) => {
+          progress.push(p.phase);
+          if (p.phase === "model-built") controller.abort();
+        },
+      })
+    ).rejects.toThrow();
+
+    // No solve or optimizer work is reported after the abort
+    expect(progress).toEqual(["model-built"]);
+  });
+
+  it("should stop a solve aborted from a timer while it runs", async () => {
+    // Large enough to take far longer than the timer on any solver path
+    const controller = new AbortController();
+    const timer = setTimeout(() => controller.abort(), 20);
+
+    await expect(
+      generateBoardsWithHiGHS(
+        { ...createConfig(100, 1000, 4, 4), seed: 1 },
+        { signal: controller.signal }
+      )
+    ).rejects.toThrow();
+    clearTimeout(timer);
+  });
+
+  it("should stop a quality solve well before its time budget", async () => {
+    const controller = new AbortController();
+    const startTime = performance.now();
+
+    await expect(
+      generateBoardsWithHiGHS(
+        { ...createConfig(36, 15, 4, 4), solverMode: "quality", timeBudgetMs: 10_000 },
+        {
+          signal: controller.signal,
+          onProgress: (p) => {
+            if (p.phase === "model-built") controller.abort();
+          },
+        }
+      )
+    ).rejects.toThrow();
+
+    expect(performance.now() - startTime).toBeLessThan(5_000);
+  });
+});
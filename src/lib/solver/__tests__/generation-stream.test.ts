@@ -0,0 +1,95 @@
+/**
+ * Generation Stream Tests
+ *
+ * Reads the NDJSON response the way a socket drains it, one macrotask at
+ * a time, to check that progress is flushed while generation runs.
+ */
+
+import { describe, it, expect } from "vitest";
+import type { GenerationStreamEvent, GeneratorConfig } from "@/lib/types";
+import { streamGeneration } from "../generation-stream";
+import { generateBoardsWithHiGHS } from "../highs-solver";
+
+// ============================================================================
+// HELPERS
+// ============================================================================
+
+const CONFIG: GeneratorConfig = {
+  items: Array.from({ length: 36 }, (_, i) => ({
+    id: `item-${i + 1}`,
+    name: `Item ${i + 1}`,
+  })),
+  numBoards: 15,
+  boardConfig: { rows: 4, cols: 4 },
+  distribution: { type: "uniform" },
+  seed: 11,
+};
+
+interface Received {
+  type: GenerationStreamEvent["type"];
+  /** Whether generation had finished when the line was read */
+  generated: boolean;
+}
+
+/**
+ * Drain a response, hopping to the macrotask queue before every read (as
+ * socket writes do) and noting whether generation had finished by then
+ */
+async function drain(response: Response, isGenerated: () => boolean) {
+  const reader = response.body!.getReader();
+  const decoder = new TextDecoder();
+  const received: Received[] = [];
+  let buffer = "";
+
+  for (;;) {
+    await new Promise((resolve) => setImmediate(resolve));
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    const lines = buffer.split("\n");
+    buffer = lines.pop()!;
+    for (const line of lines) {
+      const event = JSON.parse(line) as GenerationStreamEvent;
+      received.push({ type: event.type, generated: isGenerated() });
+    }
+  }
+  return received;
+}
+
+// ============================================================================
+// TESTS
+// ============================================================================
+
+describe("Generation stream", () => {
+  for (const compact of [false, true]) {
+    it(`should flush progress before the ${compact ? "packed" : "full"} boards`, async () => {
+      let generated = false;
+      const response = streamGeneration(CONFIG, compact, async (send) => {
+        const result = await generateBoardsWithHiGHS(CONFIG, {
+          onProgress: (progress) => send({ type: "progress", progress }),
+        });
+        generated = true;
+        return result;
+      });
+
+      const received = await drain(response, () => generated);
+      const firstProgress = received.find((event) => event.type === "progress");
+      const firstBoards = received.findIndex(
+        (event) => event.type === "board" || event.type === "boards"
+      );
+
+      expect(firstProgress?.generated).toBe(false);
+      expect(received.indexOf(firstProgress!)).toBeLessThan(firstBoards);
+      expect(received[received.length - 1].type).toBe("done");
+    });
+  }
+
+  it("should end with an error event when generation throws", async () => {
+    const response = streamGeneration(CONFIG, false, async () => {
+      throw new Error("boom");
+    });
+
+    const received = await drain(response, () => true);
+    expect(received.map((event) => event.type)).toEqual(["error"]);
+  });
+});
@@ -0,0 +1,80 @@
+/**
+ * Greedy Assignment Engine Tests
+ */
+
+import { describe, it, expect } from "vitest";
+import {
+  type BoardBitset,
+  boardSize,
+  hasItem,
+  summarizeOverlaps,
+} from "../board-bitset";
+import { cyclicAssignment } from "../decomposition";
+import { greedyAssignment } from "../greedy";
+
+// ============================================================================
+// HELPERS
+// ============================================================================
+
+function uniformFrequencies(N: number, B: number, S: number): number[] {
+  const base = Math.floor((B * S) / N);
+  const extra = (B * S) % N;
+  return Array.from({ length: N }, (_, i) => base + (i < extra ? 1 : 0));
+}
+
+function itemUsage(assignment: BoardBitset): number[] {
+  return Array.from({ length: assignment.numItems }, (_, i) => {
+    let count = 0;
+    for (let b = 0; b < assignment.numBoards; b++) {
+      if (hasItem(assignment, b, i)) count++;
+    }
+    return count;
+  });
+}
+
+// ============================================================================
+// TESTS
+// ============================================================================
+
+describe("Greedy Assignment", () => {
+  it("should fill every board and meet uniform frequencies", () => {
+    const freq = uniformFrequencies(36, 50, 16);
+    const assignment = greedyAssignment(36, 50, 16, freq);
+
+    for (let b = 0; b < 50; b++) {
+      expect(boardSize(assignment, b)).toBe(16);
+    }
+    expect(itemUsage(assignment)).toEqual(freq);
+  });
+
+  it("should meet skewed frequencies exactly", () => {
+    // Items 0-1 on every board, the rest spread
+    const freq = [20, 20, 12, 12, 12, 12, 12, 12, 4, 4];
+    const assignment = greedyAssignment(10, 20, 6, freq);
+
+    expect(itemUsage(assignment)).toEqual(freq);
+  });
+
+  it("should spread co-occurrences better than a cyclic layout", () => {
+    const freq = uniformFrequencies(40, 60, 16);
+    const greedy = summarizeOverlaps(greedyAssignment(40, 60, 16, freq));
+    const cyclic = summarizeOverlaps(cyclicAssignment(40, 60, freq));
+
+    expect(greedy.maxOverlap).toBeLessThan(cyclic.maxOverlap);
+  });
+
+  it("should be deterministic", () => {
+    const freq = uniformFrequencies(30, 25, 9);
+    const a = greedyAssignment(30, 25, 9, freq);
+    const b = greedyAssignment(30, 25, 9, freq);
+
+    expect(Array.from(a.bits)).toEqual(Array.from(b.bits));
+  });
+
+  it("should leave boards short when frequencies can't fill them", () => {
+    const assignment = greedyAssignment(4, 3, 3, [1, 1, 1, 1]);
+
+    expect(itemUsage(assignment)).toEqual([1, 1, 1, 1]);
+    expect(boardSize(assignment, 2)).toBe(0);
+  });
+});
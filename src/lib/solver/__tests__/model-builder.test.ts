@@ -0,0 +1,116 @@
+/**
+ * Model Builder Tests
+ *
+ * Validates the sparse assignment model, its LP serialization and the
+ * index-based mapping of solver columns back to (item, board) pairs.
+ */
+
+import { describe, it, expect } from "vitest";
+import {
+  buildAssignmentModel,
+  buildOverlapModel,
+  columnIndex,
+  lambdaColumn,
+  modelToLp,
+  readPrimalValues,
+  type SolutionColumn,
+} from "../model-builder";
+
+describe("buildAssignmentModel", () => {
+  const N = 4;
+  const B = 3;
+  const S = 2;
+  const freq = [2, 2, 1, 1];
+  const model = buildAssignmentModel(N, B, S, freq);
+
+  it("should have one column per (item, board) and one row per item and board", () => {
+    expect(model.numCols).toBe(N * B);
+    expect(model.numRows).toBe(N + B);
+    expect(model.rowStart[model.numRows]).toBe(2 * N * B);
+  });
+
+  it("should put every board of an item in its frequency row", () => {
+    const row = Array.from(
+      model.colIndex.subarray(model.rowStart[1], model.rowStart[2])
+    );
+    expect(row).toEqual([0, 1, 2].map((b) => columnIndex(1, b, B)));
+    expect(model.rowLower[1]).toBe(2);
+    expect(model.rowUpper[1]).toBe(2);
+  });
+
+  it("should put every item of a board in its board row", () => {
+    const r = N + 2;
+    const row = Array.from(
+      model.colIndex.subarray(model.rowStart[r], model.rowStart[r + 1])
+    );
+    expect(row).toEqual([0, 1, 2, 3].map((i) => columnIndex(i, 2, B)));
+    expect(model.rowLower[r]).toBe(S);
+  });
+});
+
+describe("modelToLp", () => {
+  it("should emit compact, index-named LP text", () => {
+    const { lp } = modelToLp(buildAssignmentModel(2, 2, 1, [1, 1]));
+
+    expect(lp).toContain("obj: 0");
+    expect(lp).toContain(" r0: x0 + x1 = 1");
+    expect(lp).toContain(" r2: x0 + x2 = 1");
+    expect(lp).toContain("Binary\n x0\n x1\n x2\n x3");
+    expect(lp.trim().endsWith("End")).toBe(true);
+  });
+
+  it("should map columns in order of first appearance", () => {
+    const model = buildAssignmentModel(2, 2, 1, [1, 1]);
+    const { columnOrder } = modelToLp(model);
+    expect(Array.from(columnOrder)).toEqual([0, 1, 2, 3]);
+
+    // An objective term moves its column to the front
+    model.objective[3] = 1;
+    const reordered = modelToLp(model).columnOrder;
+    expect(Array.from(reordered)).toEqual([3, 0, 1, 2]);
+  });
+});
+
+describe("readPrimalValues", () => {
+  it("should place primal values by solver column index", () => {
+    const columnOrder = new Uint32Array([3, 0, 1, 2]);
+    const columns: Record<string, SolutionColumn> = {
+      x3: { Index: 0, Primal: 1 },
+      x0: { Index: 1, Primal: 0 },
+      x1: { Index: 2, Primal: 1 },
+      x2: { Index: 3, Primal: 0 },
+    };
+
+    expect(Array.from(readPrimalValues(columns, columnOrder))).toEqual([
+      0, 1, 0, 1,
+    ]);
+  });
+});
+
+describe("buildOverlapModel", () => {
+  const N = 3;
+  const B = 3;
+  const model = buildOverlapModel(N, B, 2, [2, 2, 2], [[0, 2]], 1);
+  const lambda = lambdaColumn(N, B);
+
+  it("should minimize λ with the given lower bound", () => {
+    expect(model.objective[lambda]).toBe(1);
+    expect(model.colLower[lambda]).toBe(1);
+    expect(model.colUpper[lambda]).toBe(2);
+    expect(model.integrality[lambda]).toBe(0);
+  });
+
+  it("should add N linking rows and one bound row per cut pair", () => {
+    expect(model.numCols).toBe(N * B + 1 + N);
+    expect(model.numRows).toBe(N + B + N + 1);
+
+    const { lp } = modelToLp(model);
+    expect(lp).toContain(`obj: x${lambda}`);
+    // Item 1 on boards 0 and 2 links to its y column
+    expect(lp).toContain(`x3 + x5 - x${lambda + 2} <= 1`);
+    expect(lp).toContain(
+      `x${lambda + 1} + x${lambda + 2} + x${lambda + 3} - x${lambda} <= 0`
+    );
+    expect(lp).toContain(`1 <= x${lambda} <= 2`);
+  });
+});
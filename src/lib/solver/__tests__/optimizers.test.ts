@@ -0,0 +1,180 @@
+/**
+ * Overlap Optimizer Tests
+ *
+ * Every optimizer must preserve board sizes and item frequencies, never
+ * report a max overlap that differs from the resulting boards, and be
+ * reproducible for a given random source.
+ */
+
+import { describe, it, expect } from "vitest";
+import type { OptimizerStrategy } from "@/lib/types";
+import { runOptimizer } from "../optimizers";
+import { MAX_MATRIX_BOARDS } from "../overlap-matrix";
+import {
+  type BoardBitset,
+  addItem,
+  boardItemIndices,
+  boardSize,
+  createBoardBitset,
+  summarizeOverlaps,
+} from "../board-bitset";
+
+// ============================================================================
+// HELPERS
+// ============================================================================
+
+/** Deterministic LCG so tests don't depend on solver internals */
+function lcg(seed: number): () => number {
+  let state = seed >>> 0;
+  return () => {
+    state = (Math.imul(state, 1664525) + 1013904223) >>> 0;
+    return state / 4294967296;
+  };
+}
+
+/**
+ * Boards built from overlapping windows of the item list: board b holds
+ * items b·step … b·step + S − 1 (mod N), which leaves neighbours sharing
+ * most of their items.
+ */
+function windowedBoards(N: number, B: number, S: number, step: number): BoardBitset {
+  const set = createBoardBitset(N, B);
+  for (let b = 0; b < B; b++) {
+    for (let j = 0; j < S; j++) addItem(set, b, (b * step + j) % N);
+  }
+  return set;
+}
+
+function itemFrequencies(set: BoardBitset): number[] {
+  const counts = new Array(set.numItems).fill(0);
+  for (let b = 0; b < set.numBoards; b++) {
+    for (const i of boardItemIndices(set, b)) counts[i]++;
+  }
+  return counts;
+}
+
+const STRATEGIES: OptimizerStrategy[] = [
+  { type: "local" },
+  { type: "annealing", maxIterations: 5000 },
+  { type: "tabu", maxIterations: 500 },
+];
+
+// ============================================================================
+// TESTS
+// ============================================================================
+
+describe("Overlap optimizers", () => {
+  const N = 30;
+  const B = 30;
+  const S = 10;
+
+  for (const strategy of STRATEGIES) {
+    describe(strategy.type, () => {
+      it("should preserve board sizes and item frequencies", async () => {
+        const set = windowedBoards(N, B, S, 1);
+        const before = itemFrequencies(set);
+
+        await runOptimizer(strategy, set, S, lcg(7));
+
+        expect(itemFrequencies(set)).toEqual(before);
+        for (let b = 0; b < B; b++) expect(boardSize(set, b)).toBe(S);
+      });
+
+      it("should report the max overlap of the resulting boards", async () => {
+        const set = windowedBoards(N, B, S, 1);
+        const result = await runOptimizer(strategy, set, S, lcg(7));
+
+        expect(result.maxOverlap).toBe(summarizeOverlaps(set).maxOverlap);
+      });
+
+      it("should not increase the max overlap", async () => {
+        const set = windowedBoards(N, B, S, 1);
+        const before = summarizeOverlaps(set).maxOverlap;
+
+        const result = await runOptimizer(strategy, set, S, lcg(7));
+        expect(result.maxOverlap).toBeLessThanOrEqual(before);
+      });
+
+      it("should be reproducible for the same random source", async () => {
+        const a = windowedBoards(N, B, S, 1);
+        const b = windowedBoards(N, B, S, 1);
+
+        await runOptimizer(strategy, a, S, lcg(123));
+        await runOptimizer(strategy, b, S, lcg(123));
+
+        expect(Array.from(a.bits)).toEqual(Array.from(b.bits));
+      });
+
+      it("should report progress as the max overlap drops", async () => {
+        const set = windowedBoards(N, B, S, 1);
+        const before = summarizeOverlaps(set).maxOverlap;
+        const reported: number[] = [];
+
+        const result = await runOptimizer(strategy, set, S, lcg(7), {
+          onProgress: (_, maxOverlap) => reported.push(maxOverlap),
+        });
+
+        expect(reported[0]).toBe(before);
+        expect(reported[reported.length - 1]).toBe(result.maxOverlap);
+        for (let k = 1; k < reported.length; k++) {
+          expect(reported[k]).toBeLessThan(reported[k - 1]);
+        }
+      });
+
+      it("should stop immediately once aborted, leaving valid boards", async () => {
+        const set = windowedBoards(N, B, S, 1);
+        const before = itemFrequencies(set);
+
+        const result = await runOptimizer(strategy, set, S, lcg(7), {
+          signal: AbortSignal.abort(),
+        });
+
+        expect(result.iterations).toBe(0);
+        expect(itemFrequencies(set)).toEqual(before);
+      });
+    });
+  }
+
+  it("should stop when aborted from a timer while running", async () => {
+    for (const type of ["annealing", "tabu"] as const) {
+      const controller = new AbortController();
+      const timer = setTimeout(() => controller.abort(), 20);
+      const startTime = performance.now();
+
+      const result = await runOptimizer(
+        { type, maxIterations: 1e9, timeBudgetMs: 10_000 },
+        windowedBoards(N, B, S, 1),
+        S,
+        lcg(7),
+        { signal: controller.signal }
+      );
+      clearTimeout(timer);
+
+      expect(controller.signal.aborted).toBe(true);
+      expect(result.iterations).toBeGreaterThan(0);
+      expect(performance.now() - startTime).toBeLessThan(1_000);
+    }
+  });
+
+  it("should leave boards past MAX_MATRIX_BOARDS untouched", async () => {
+    const set = windowedBoards(40, MAX_MATRIX_BOARDS + 1, 4, 3);
+    const before = Array.from(set.bits);
+
+    const result = await runOptimizer({ type: "local" }, set, 4, lcg(7));
+
+    expect(result.iterations).toBe(0);
+    expect(result.maxOverlap).toBe(summarizeOverlaps(set).maxOverlap);
+    expect(Array.from(set.bits)).toEqual(before);
+  });
+
+  it("annealing and tabu should beat the start on heavily overlapping boards", async () => {
+    for (const strategy of STRATEGIES.slice(1)) {
+      const set = windowedBoards(N, B, S, 1);
+      const before = summarizeOverlaps(set).maxOverlap;
+
+      const result = await runOptimizer(strategy, set, S, lcg(99));
+      expect(result.maxOverlap).toBeLessThan(before);
+      expect(result.swapsAccepted).toBeGreaterThan(0);
+    }
+  });
+});
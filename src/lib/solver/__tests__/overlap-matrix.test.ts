@@ -0,0 +1,104 @@
+/**
+ * Overlap Matrix Tests
+ *
+ * Checks that incremental updates and the bucket index always agree with
+ * a full recomputation of pairwise overlaps.
+ */
+
+import { describe, it, expect } from "vitest";
+import {
+  MAX_MATRIX_BOARDS,
+  createOverlapMatrix,
+  getOverlap,
+  moveItem,
+  pairsWithOverlap,
+} from "../overlap-matrix";
+import { type BoardBitset, addItem, createBoardBitset } from "../board-bitset";
+
+// 5 items × 4 boards, 3 items per board
+const ASSIGNMENT = [
+  [1, 1, 1, 0],
+  [1, 1, 0, 1],
+  [1, 0, 1, 1],
+  [0, 1, 1, 0],
+  [0, 0, 0, 1],
+];
+
+function bruteOverlap(assignment: number[][], b1: number, b2: number): number {
+  return assignment.filter((row) => row[b1] === 1 && row[b2] === 1).length;
+}
+
+function clone(assignment: number[][]): number[][] {
+  return assignment.map((row) => [...row]);
+}
+
+function toBitset(assignment: number[][]): BoardBitset {
+  const set = createBoardBitset(assignment.length, assignment[0].length);
+  assignment.forEach((row, i) =>
+    row.forEach((value, b) => {
+      if (value === 1) addItem(set, b, i);
+    })
+  );
+  return set;
+}
+
+describe("OverlapMatrix", () => {
+  it("should match brute-force overlaps on construction", () => {
+    const m = createOverlapMatrix(toBitset(ASSIGNMENT), 3);
+
+    for (let b1 = 0; b1 < 4; b1++) {
+      for (let b2 = 0; b2 < 4; b2++) {
+        if (b1 === b2) continue;
+        expect(getOverlap(m, b1, b2)).toBe(bruteOverlap(ASSIGNMENT, b1, b2));
+      }
+    }
+    expect(m.max).toBe(2);
+  });
+
+  it("should list the worst pairs from the bucket index", () => {
+    const m = createOverlapMatrix(toBitset(ASSIGNMENT), 3);
+    const worst = pairsWithOverlap(m, m.max, 10);
+
+    expect(worst.length).toBeGreaterThan(0);
+    for (const [b1, b2] of worst) {
+      expect(bruteOverlap(ASSIGNMENT, b1, b2)).toBe(m.max);
+    }
+  });
+
+  it("should stay consistent after moving items", () => {
+    const assignment = clone(ASSIGNMENT);
+    const m = createOverlapMatrix(toBitset(assignment), 3);
+
+    // Swap item 0 (board 0 → 3) with item 4 (board 3 → 0)
+    moveItem(m, (c) => assignment[0][c] === 1, 0, 3);
+    moveItem(m, (c) => assignment[4][c] === 1, 3, 0);
+    assignment[0][0] = 0;
+    assignment[0][3] = 1;
+    assignment[4][3] = 0;
+    assignment[4][0] = 1;
+
+    let expectedMax = 0;
+    for (let b1 = 0; b1 < 4; b1++) {
+      for (let b2 = b1 + 1; b2 < 4; b2++) {
+        const expected = bruteOverlap(assignment, b1, b2);
+        expect(getOverlap(m, b1, b2)).toBe(expected);
+        expectedMax = Math.max(expectedMax, expected);
+      }
+    }
+    expect(m.max).toBe(expectedMax);
+
+    const bucketTotal = Array.from(m.counts).reduce((a, b) => a + b, 0);
+    expect(bucketTotal).toBe(6);
+  });
+
+  it("should refuse board counts past MAX_MATRIX_BOARDS", () => {
+    const set = createBoardBitset(4, MAX_MATRIX_BOARDS + 1);
+    expect(() => createOverlapMatrix(set, 2)).toThrow(RangeError);
+  });
+
+  it("should handle a single board without pairs", () => {
+    const m = createOverlapMatrix(toBitset([[1], [1]]), 2);
+    expect(m.max).toBe(0);
+    expect(pairsWithOverlap(m, 0, 10)).toEqual([]);
+  });
+});
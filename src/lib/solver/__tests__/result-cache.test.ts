@@ -0,0 +1,226 @@
+/**
+ * Result Cache Tests
+ *
+ * Verifies canonical keys, LRU eviction, the disk tier and the
+ * seed/bypass rules without running the solver.
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from "vitest";
+import { mkdtemp, readdir, rm } from "node:fs/promises";
+import { tmpdir } from "node:os";
+import { join } from "node:path";
+import type { GenerationResult, GeneratorConfig } from "@/lib/types";
+import { createBoard } from "@/lib/utils/board-layout";
+import {
+  configCacheKey,
+  configureResultCache,
+  getCachedResult,
+  getResultCacheStats,
+  isReproducible,
+  resetResultCache,
+  setCachedResult,
+  withResultCache,
+} from "../result-cache";
+
+// ============================================================================
+// HELPERS
+// ============================================================================
+
+function createConfig(seed?: number): GeneratorConfig {
+  return {
+    items: [
+      { id: "a", name: "A" },
+      { id: "b", name: "B" },
+    ],
+    numBoards: 2,
+    boardConfig: { rows: 1, cols: 1 },
+    distribution: { type: "uniform" },
+    seed,
+  };
+}
+
+function createResult(seedUsed: number): GenerationResult {
+  return {
+    success: true,
+    boards: [],
+    stats: {
+      totalSlots: 2,
+      totalItems: 2,
+      minOverlap: 0,
+      maxOverlap: 0,
+      avgOverlap: 0,
+      generationTimeMs: 5,
+      solverInitTimeMs: 0,
+      solveTimeMs: 1,
+      solverUsed: "highs",
+      frequencies: {},
+      seedUsed,
+    },
+  };
+}
+
+// ============================================================================
+// TESTS
+// ============================================================================
+
+describe("Result Cache", () => {
+  beforeEach(() => {
+    resetResultCache();
+    configureResultCache({ diskDir: null });
+  });
+
+  describe("configCacheKey", () => {
+    it("should ignore object key order", () => {
+      const config = createConfig(1);
+      const reordered = {
+        seed: 1,
+        distribution: { type: "uniform" },
+        boardConfig: { cols: 1, rows: 1 },
+        numBoards: 2,
+        items: config.items.map(({ name, id }) => ({ name, id })),
+      } as GeneratorConfig;
+
+      expect(configCacheKey(reordered)).toBe(configCacheKey(config));
+    });
+
+    it("should treat omitted defaults and the bypass flag as no change", () => {
+      const config = createConfig(1);
+      const explicit: GeneratorConfig = {
+        ...config,
+        solverMode: "fast",
+        timeBudgetMs: 5000,
+        optimizer: { type: "local" },
+        bypassCache: true,
+      };
+
+      expect(configCacheKey(explicit)).toBe(configCacheKey(config));
+    });
+
+    it("should change with the seed and the solver settings", () => {
+      const base = configCacheKey(createConfig(1));
+
+      expect(configCacheKey(createConfig(2))).not.toBe(base);
+      expect(
+        configCacheKey({ ...createConfig(1), optimizer: { type: "tabu" } })
+      ).not.toBe(base);
+      expect(
+        configCacheKey({ ...createConfig(1), solverMode: "quality" })
+      ).not.toBe(base);
+    });
+  });
+
+  describe("memory tier", () => {
+    it("should evict the least recently used entry", async () => {
+      configureResultCache({ maxEntries: 2 });
+
+      await setCachedResult("a", createResult(1));
+      await setCachedResult("b", createResult(2));
+      await getCachedResult("a"); // a is now most recent
+      await setCachedResult("c", createResult(3));
+
+      expect(await getCachedResult("b")).toBeNull();
+      expect(await getCachedResult("a")).not.toBeNull();
+      expect(await getCachedResult("c")).not.toBeNull();
+      expect(getResultCacheStats()).toMatchObject({ entries: 2, hits: 3, misses: 1 });
+    });
+  });
+
+  describe("disk tier", () => {
+    let dir: string;
+
+    beforeEach(async () => {
+      dir = await mkdtemp(join(tmpdir(), "result-cache-"));
+    });
+
+    afterEach(async () => {
+      await rm(dir, { recursive: true, force: true });
+    });
+
+    it("should serve results after the memory tier is cleared", async () => {
+      configureResultCache({ diskDir: dir });
+      await setCachedResult("key", createResult(7));
+
+      resetResultCache();
+      configureResultCache({ diskDir: dir });
+
+      expect(await getCachedResult("key")).toEqual(createResult(7));
+      expect(getResultCacheStats().diskHits).toBe(1);
+    });
+
+    it("should stay within its byte budget", async () => {
+      const size = JSON.stringify(createResult(1)).length;
+      configureResultCache({ diskDir: dir, maxDiskBytes: size * 2 });
+
+      for (let i = 0; i < 5; i++) await setCachedResult(`k${i}`, createResult(i));
+
+      expect((await readdir(dir)).length).toBeLessThanOrEqual(2);
+    });
+
+    it("should restore grid views on boards read back from disk", async () => {
+      const config = createConfig(1);
+      const [a, b] = config.items;
+      const generated = createResult(1);
+      generated.boards = [createBoard(0, [a], 1), createBoard(1, [b], 1)];
+      configureResultCache({ diskDir: dir });
+      await withResultCache(config, async () => generated);
+
+      resetResultCache();
+      configureResultCache({ diskDir: dir });
+      const cached = await withResultCache(config, async () => createResult(2));
+
+      expect(cached.stats.cacheHit).toBe(true);
+      expect(cached.boards.map((board) => board.grid)).toEqual([[[a]], [[b]]]);
+    });
+  });
+
+  describe("withResultCache", () => {
+    it("should generate once and report later calls as hits", async () => {
+      const generate = vi.fn(async () => createResult(1));
+
+      const first = await withResultCache(createConfig(1), generate);
+      const second = await withResultCache(createConfig(1), generate);
+
+      expect(generate).toHaveBeenCalledTimes(1);
+      expect(first.stats.cacheHit).toBe(false);
+      expect(second.stats.cacheHit).toBe(true);
+    });
+
+    it("should always generate for unseeded or bypassed configs", async () => {
+      const generate = vi.fn(async () => createResult(1));
+
+      await withResultCache(createConfig(), generate);
+      await withResultCache(createConfig(), generate);
+      await withResultCache({ ...createConfig(1), bypassCache: true }, generate);
+      await withResultCache({ ...createConfig(1), bypassCache: true }, generate);
+
+      expect(generate).toHaveBeenCalledTimes(4);
+    });
+
+    it("should always generate for wall-clock-limited solves", async () => {
+      const generate = vi.fn(async () => createResult(1));
+      const timeLimited: GeneratorConfig[] = [
+        { ...createConfig(1), solverMode: "quality", timeBudgetMs: 500 },
+        { ...createConfig(1), optimizer: { type: "annealing" } },
+        { ...createConfig(1), optimizer: { type: "tabu", maxIterations: 100 } },
+      ];
+
+      for (const config of timeLimited) {
+        expect(isReproducible(config)).toBe(false);
+        await withResultCache(config, generate);
+        await withResultCache(config, generate);
+      }
+
+      expect(generate).toHaveBeenCalledTimes(6);
+      expect(isReproducible(createConfig(1))).toBe(true);
+    });
+
+    it("should not cache failed generations", async () => {
+      const generate = vi.fn(async () => ({ ...createResult(1), success: false }));
+
+      await withResultCache(createConfig(1), generate);
+      await withResultCache(createConfig(1), generate);
+
+      expect(generate).toHaveBeenCalledTimes(2);
+    });
+  });
+});
@@ -0,0 +1,113 @@
+/**
+ * Solver Pool Tests
+ *
+ * Verifies warm-instance reuse, recycling and idle eviction using a
+ * mocked highs module (no WASM is loaded).
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from "vitest";
+
+const { highsLoader } = vi.hoisted(() => ({
+  highsLoader: vi.fn(async () => ({ solve: vi.fn() })),
+}));
+
+vi.mock("highs", () => ({ default: highsLoader }));
+
+import {
+  acquireSolver,
+  configureSolverPool,
+  getSolverPoolStats,
+  resetSolverPool,
+} from "../solver-pool";
+
+describe("Solver Pool", () => {
+  beforeEach(() => {
+    resetSolverPool();
+    highsLoader.mockClear();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+    resetSolverPool();
+  });
+
+  it("should reuse a released instance instead of instantiating again", async () => {
+    const first = await acquireSolver();
+    expect(first.cold).toBe(true);
+    first.release();
+
+    const second = await acquireSolver();
+    expect(second.cold).toBe(false);
+    expect(second.solver).toBe(first.solver);
+    second.release();
+
+    expect(highsLoader).toHaveBeenCalledTimes(1);
+  });
+
+  it("should create extra instances when all are checked out", async () => {
+    const a = await acquireSolver();
+    const b = await acquireSolver();
+
+    expect(a.solver).not.toBe(b.solver);
+    expect(getSolverPoolStats().inUse).toBe(2);
+
+    a.release();
+    b.release();
+    expect(getSolverPoolStats().inUse).toBe(0);
+  });
+
+  it("should not keep more idle instances than maxSize", async () => {
+    configureSolverPool({ maxSize: 1 });
+
+    const a = await acquireSolver();
+    const b = await acquireSolver();
+    a.release();
+    b.release();
+
+    expect(getSolverPoolStats().idle).toBe(1);
+  });
+
+  it("should discard instances released after an error", async () => {
+    const lease = await acquireSolver();
+    lease.release({ discard: true });
+
+    expect(getSolverPoolStats().idle).toBe(0);
+
+    const next = await acquireSolver();
+    expect(next.cold).toBe(true);
+    next.release();
+  });
+
+  it("should recycle an instance after maxUsesPerInstance solves", async () => {
+    configureSolverPool({ maxUsesPerInstance: 2 });
+
+    const first = await acquireSolver();
+    first.release();
+    const second = await acquireSolver();
+    second.release();
+
+    expect(getSolverPoolStats().idle).toBe(0);
+    expect(highsLoader).toHaveBeenCalledTimes(1);
+  });
+
+  it("should evict idle instances after idleTimeoutMs", async () => {
+    vi.useFakeTimers();
+    configureSolverPool({ idleTimeoutMs: 1000 });
+
+    const lease = await acquireSolver();
+    lease.release();
+    expect(getSolverPoolStats().idle).toBe(1);
+
+    vi.advanceTimersByTime(1001);
+    expect(getSolverPoolStats().idle).toBe(0);
+  });
+
+  it("should ignore double release", async () => {
+    const lease = await acquireSolver();
+    lease.release();
+    lease.release();
+
+    expect(getSolverPoolStats().inUse).toBe(0);
+    expect(getSolverPoolStats().idle).toBe(1);
+  });
+});
@@ -0,0 +1,368 @@
+/**
+ * Generation Worker Pool Tests
+ *
+ * Drives the pool with in-process fake workers so queueing, timeouts and
+ * cancellation can be checked without spawning threads.
+ */
+
+import { describe, it, expect, afterEach, vi } from "vitest";
+import { EventEmitter } from "node:events";
+import type { GenerationResult, GeneratorConfig } from "@/lib/types";
+import {
+  GenerationWorkerPool,
+  defaultWorkerPoolOptions,
+  type GenerationWorker,
+  type WorkerRequest,
+  type WorkerResponse,
+} from "../worker-pool";
+
+// ============================================================================
+// HELPERS
+// ============================================================================
+
+/** Worker that holds jobs until the test completes them */
+class FakeWorker extends EventEmitter {
+  received: WorkerRequest[] = [];
+  terminated = false;
+  /** Whether to announce a loaded entry module (like generation-worker.ts) */
+  loads = true;
+
+  postMessage(message: WorkerRequest): void {
+    if (this.loads && this.received.length === 0) this.emit("message", { ready: true });
+    this.received.push(message);
+  }
+
+  complete(response?: Partial<WorkerResponse>): void {
+    const { id } = this.received[this.received.length - 1];
+    this.emit("message", { id, result: RESULT, ...response });
+  }
+
+  async terminate(): Promise<number> {
+    this.terminated = true;
+    this.emit("exit", 1);
+    return 1;
+  }
+}
+
+const CONFIG = {
+  numBoards: 1,
+  items: [],
+  boardConfig: { rows: 1, cols: 2 },
+} as unknown as GeneratorConfig;
+
+/** Small real config for jobs that fall back to in-process generation */
+const SOLVABLE_CONFIG: GeneratorConfig = {
+  items: Array.from({ length: 6 }, (_, i) => ({ id: String(i + 1), name: `Item ${i + 1}` })),
+  numBoards: 3,
+  boardConfig: { rows: 1, cols: 2 },
+  distribution: { type: "uniform" },
+  seed: 1,
+};
+const RESULT = { success: true, boards: [] } as unknown as GenerationResult;
+
+function createPool(size: number, maxQueue = 4, jobTimeoutMs = 1000) {
+  const workers: FakeWorker[] = [];
+  const pool = new GenerationWorkerPool({
+    size,
+    maxQueue,
+    jobTimeoutMs,
+    createWorker: () => {
+      const worker = new FakeWorker();
+      workers.push(worker);
+      return worker as unknown as GenerationWorker;
+    },
+  });
+  return { pool, workers };
+}
+
+/** Inline generation that the test settles; rejects once its signal aborts */
+interface InlineCall {
+  signal: AbortSignal;
+  resolve: (result: GenerationResult) => void;
+  reject: (error: Error) => void;
+}
+
+function createInlinePool(maxQueue = 4, jobTimeoutMs = 1000) {
+  const calls: InlineCall[] = [];
+  const pool = new GenerationWorkerPool({
+    size: 0,
+    maxQueue,
+    jobTimeoutMs,
+    generateInline: (_config, { signal }) =>
+      new Promise((resolve, reject) => {
+        calls.push({ signal: signal!, resolve, reject });
+        signal!.addEventListener("abort", () => reject(signal!.reason));
+      }),
+  });
+  return { pool, calls };
+}
+
+// ============================================================================
+// TESTS
+// ============================================================================
+
+describe("Generation Worker Pool", () => {
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it("should run a job on a worker and reuse it for the next one", async () => {
+    const { pool, workers } = createPool(2);
+
+    const first = pool.run(CONFIG);
+    workers[0].complete();
+    await expect(first).resolves.toEqual(RESULT);
+
+    const second = pool.run(CONFIG);
+    workers[0].complete();
+    await expect(second).resolves.toEqual(RESULT);
+
+    expect(workers).toHaveLength(1);
+    expect(pool.getStats()).toMatchObject({ workers: 1, busy: 0, completed: 2 });
+  });
+
+  it("should restore grid views on boards cloned from a worker", async () => {
+    const { pool, workers } = createPool(1);
+    const items = [
+      { id: "1", name: "Item 1" },
+      { id: "2", name: "Item 2" },
+    ];
+
+    const job = pool.run(CONFIG);
+    workers[0].complete({
+      result: { ...RESULT, boards: [{ id: "board-1", boardNumber: 1, items }] },
+    } as Partial<WorkerResponse>);
+    const result = await job;
+
+    expect(result.boards[0].grid).toEqual([items]);
+  });
+
+  it("should queue jobs beyond the pool size and report queue depth", async () => {
+    const { pool, workers } = createPool(1);
+
+    const first = pool.run(CONFIG);
+    const second = pool.run(CONFIG);
+    expect(pool.getStats()).toMatchObject({ busy: 1, queueDepth: 1 });
+
+    workers[0].complete();
+    await first;
+    expect(pool.getStats().queueDepth).toBe(0);
+    expect(workers[0].received).toHaveLength(2);
+
+    workers[0].complete();
+    await expect(second).resolves.toEqual(RESULT);
+  });
+
+  it("should forward progress messages to the job's listener", async () => {
+    const { pool, workers } = createPool(1);
+    const progress = vi.fn();
+
+    const job = pool.run(CONFIG, { onProgress: progress });
+    const { id } = workers[0].received[0];
+    workers[0].emit("message", {
+      id,
+      progress: { phase: "model-built", elapsedMs: 1 },
+    });
+    workers[0].emit("message", {
+      id,
+      progress: { phase: "local-search", elapsedMs: 2, iteration: 0, maxOverlap: 5 },
+    });
+    workers[0].complete();
+
+    await expect(job).resolves.toEqual(RESULT);
+    expect(progress).toHaveBeenCalledTimes(2);
+  });
+
+  it("should reject with QUEUE_FULL once the queue is at capacity", async () => {
+    const { pool } = createPool(1, 1);
+
+    const pending = [pool.run(CONFIG), pool.run(CONFIG)];
+    pending.forEach((job) => job.catch(() => {}));
+
+    await expect(pool.run(CONFIG)).rejects.toMatchObject({ code: "QUEUE_FULL" });
+    expect(pool.getStats().rejected).toBe(1);
+
+    await pool.shutdown();
+  });
+
+  it("should time out a running job and replace its worker", async () => {
+    vi.useFakeTimers();
+    const { pool, workers } = createPool(1, 4, 500);
+
+    const job = pool.run(CONFIG);
+    const next = pool.run(CONFIG);
+    vi.advanceTimersByTime(500);
+
+    await expect(job).rejects.toMatchObject({ code: "TIMEOUT" });
+    expect(workers[0].terminated).toBe(true);
+
+    // The queued job moves to a fresh worker
+    expect(workers).toHaveLength(2);
+    workers[1].complete();
+    await expect(next).resolves.toEqual(RESULT);
+    expect(pool.getStats()).toMatchObject({ timedOut: 1, completed: 1 });
+  });
+
+  it("should cancel a queued job without touching the running one", async () => {
+    const { pool, workers } = createPool(1);
+    const controller = new AbortController();
+
+    const running = pool.run(CONFIG);
+    const queued = pool.run(CONFIG, { signal: controller.signal });
+    controller.abort();
+
+    await expect(queued).rejects.toMatchObject({ code: "CANCELLED" });
+    expect(pool.getStats().queueDepth).toBe(0);
+    expect(workers[0].terminated).toBe(false);
+
+    workers[0].complete();
+    await expect(running).resolves.toEqual(RESULT);
+  });
+
+  it("should cancel a running job by terminating its worker", async () => {
+    const { pool, workers } = createPool(1);
+    const controller = new AbortController();
+
+    const job = pool.run(CONFIG, { signal: controller.signal });
+    controller.abort();
+
+    await expect(job).rejects.toMatchObject({ code: "CANCELLED" });
+    expect(workers[0].terminated).toBe(true);
+    expect(pool.getStats()).toMatchObject({ workers: 0, cancelled: 1 });
+  });
+
+  it("should reject immediately when the signal is already aborted", async () => {
+    const { pool, workers } = createPool(1);
+
+    await expect(
+      pool.run(CONFIG, { signal: AbortSignal.abort() })
+    ).rejects.toMatchObject({ code: "CANCELLED" });
+    expect(workers).toHaveLength(0);
+  });
+
+  it("should surface worker errors as WORKER_FAILED", async () => {
+    const { pool, workers } = createPool(1);
+
+    const job = pool.run(CONFIG);
+    workers[0].complete({ error: "boom" } as Partial<WorkerResponse>);
+
+    await expect(job).rejects.toMatchObject({
+      code: "WORKER_FAILED",
+      message: "boom",
+    });
+    expect(pool.getStats().failed).toBe(1);
+  });
+
+  it("should fail the running job when its worker crashes", async () => {
+    const { pool, workers } = createPool(1);
+
+    const job = pool.run(CONFIG);
+    workers[0].emit("exit", 1);
+
+    await expect(job).rejects.toMatchObject({ code: "WORKER_FAILED" });
+    expect(pool.getStats().workers).toBe(0);
+  });
+
+  it("should generate in-process unless GENERATION_WORKERS is set", () => {
+    const saved = process.env.GENERATION_WORKERS;
+    try {
+      delete process.env.GENERATION_WORKERS;
+      expect(defaultWorkerPoolOptions().size).toBe(0);
+      process.env.GENERATION_WORKERS = "3";
+      expect(defaultWorkerPoolOptions().size).toBe(3);
+    } finally {
+      if (saved === undefined) delete process.env.GENERATION_WORKERS;
+      else process.env.GENERATION_WORKERS = saved;
+    }
+  });
+
+  it("should run inline jobs one at a time behind a bounded queue", async () => {
+    const { pool, calls } = createInlinePool(1);
+
+    const first = pool.run(CONFIG);
+    const second = pool.run(CONFIG);
+    await expect(pool.run(CONFIG)).rejects.toMatchObject({ code: "QUEUE_FULL" });
+    expect(calls).toHaveLength(1);
+    expect(pool.getStats()).toMatchObject({
+      capacity: 1,
+      busy: 1,
+      queueDepth: 1,
+      rejected: 1,
+    });
+
+    calls[0].resolve(RESULT);
+    await expect(first).resolves.toEqual(RESULT);
+    expect(calls).toHaveLength(2);
+
+    calls[1].reject(new Error("boom"));
+    await expect(second).rejects.toMatchObject({ message: "boom" });
+    expect(pool.getStats()).toMatchObject({ busy: 0, completed: 1, failed: 1 });
+  });
+
+  it("should time out an inline job by aborting its solve", async () => {
+    vi.useFakeTimers();
+    const { pool, calls } = createInlinePool(4, 500);
+
+    const job = pool.run(CONFIG);
+    const next = pool.run(CONFIG);
+    vi.advanceTimersByTime(500);
+
+    await expect(job).rejects.toMatchObject({ code: "TIMEOUT" });
+    expect(calls[0].signal.aborted).toBe(true);
+
+    // The queued job starts once the aborted solve has unwound
+    expect(calls).toHaveLength(2);
+    calls[1].resolve(RESULT);
+    await expect(next).resolves.toEqual(RESULT);
+    expect(pool.getStats()).toMatchObject({ timedOut: 1, completed: 1, failed: 0 });
+  });
+
+  it("should cancel a running inline job through its signal", async () => {
+    const { pool, calls } = createInlinePool();
+    const controller = new AbortController();
+
+    const job = pool.run(CONFIG, { signal: controller.signal });
+    controller.abort();
+
+    await expect(job).rejects.toMatchObject({ code: "CANCELLED" });
+    expect(calls[0].signal.aborted).toBe(true);
+    expect(pool.getStats()).toMatchObject({ cancelled: 1, failed: 0 });
+  });
+
+  it("should generate in-process when a worker can't be created", async () => {
+    const pool = new GenerationWorkerPool({
+      size: 2,
+      createWorker: () => {
+        throw new Error("Cannot find module generation-worker.ts");
+      },
+    });
+
+    const result = await pool.run(SOLVABLE_CONFIG);
+
+    expect(result.success).toBe(true);
+    expect(pool.getStats().fellBackInline).toBe(true);
+  });
+
+  it("should fall back in-process when a worker dies before loading", async () => {
+    const workers: FakeWorker[] = [];
+    const pool = new GenerationWorkerPool({
+      size: 1,
+      createWorker: () => {
+        const worker = new FakeWorker();
+        worker.loads = false;
+        workers.push(worker);
+        return worker as unknown as GenerationWorker;
+      },
+    });
+
+    const job = pool.run(SOLVABLE_CONFIG);
+    workers[0].emit("exit", 1);
+    const result = await job;
+
+    expect(result.success).toBe(true);
+    expect(pool.getStats()).toMatchObject({ fellBackInline: true, failed: 0 });
+
+    await pool.run(SOLVABLE_CONFIG);
+    expect(workers).toHaveLength(1);
+  });
+});
@@ -0,0 +1,172 @@
+/**
+ * Batch Generation
+ *
+ * Runs many configs from one request. Configs whose solver inputs match
+ * (same item ids, board count and size, distribution, solver settings and
+ * seed) differ only in item names and images, so each such group is
+ * solved once and the result is relabelled for the other members. The
+ * remaining groups run concurrently, bounded so a batch never floods the
+ * worker pool's queue.
+ *
+ * Server-only: import from route handlers, never from client code.
+ */
+
+import type {
+  GeneratedBoard,
+  GenerationProgress,
+  GenerationResult,
+  GeneratorConfig,
+  Item,
+} from "@/lib/types";
+import { validateGeneratorConfig } from "@/lib/constraints/request-validation";
+import { createBoard } from "@/lib/utils/board-layout";
+import { configCacheKey } from "./result-cache";
+
+// ============================================================================
+// TYPES
+// ============================================================================
+
+/** Solves one config (the route wraps the result cache and worker pool) */
+export type BatchRunner = (
+  config: GeneratorConfig,
+  onProgress: (progress: GenerationProgress) => void
+) => Promise<GenerationResult>;
+
+export interface BatchOptions {
+  /** Groups solved at the same time */
+  concurrency: number;
+  /** Stops dispatching further groups when aborted */
+  signal?: AbortSignal;
+  /**
+   * Checks one raw entry, throwing if it is unusable (defaults to
+   * validateGeneratorConfig with the default request limits)
+   */
+  validate?: (entry: unknown) => GeneratorConfig;
+  onProgress?: (index: number, progress: GenerationProgress) => void;
+  onResult: (index: number, result: GenerationResult) => void;
+  onError: (index: number, error: unknown) => void;
+}
+
+// ============================================================================
+// CONFIGURATION
+// ============================================================================
+
+function envNumber(name: string, fallback: number): number {
+  const value = Number(process.env[name]);
+  return Number.isFinite(value) && value > 0 ? value : fallback;
+}
+
+/** Maximum configs accepted in one batch request */
+export const MAX_BATCH_SIZE = envNumber("GENERATION_BATCH_LIMIT", 32);
+
+// ============================================================================
+// SHARING
+// ============================================================================
+
+/**
+ * Key identifying configs that produce the same assignment
+ *
+ * Item names and images never reach the solver, so only ids are kept.
+ * Unseeded configs each ask for a fresh random layout and are never
+ * shared (returns null).
+ */
+export function solverInputKey(config: GeneratorConfig): string | null {
+  if (config.seed === undefined) return null;
+  return configCacheKey({
+    ...config,
+    items: config.items.map(({ id }) => ({ id }) as Item),
+  });
+}
+
+/**
+ * Swap a result's items for the matching items (by id) of another config
+ * with the same solver inputs
+ */
+export function relabelResult(
+  result: GenerationResult,
+  target: GeneratorConfig
+): GenerationResult {
+  const byId = new Map(target.items.map((item) => [item.id, item]));
+  const relabel = (item: Item) => byId.get(item.id) ?? item;
+
+  const boards: GeneratedBoard[] = result.boards.map((board, position) =>
+    createBoard(position, board.items.map(relabel), target.boardConfig.cols)
+  );
+  return { ...result, boards };
+}
+
+// ============================================================================
+// EXECUTION
+// ============================================================================
+
+/**
+ * Run every config, reporting each result (or error) as soon as its group
+ * finishes. Resolves once all groups have settled.
+ *
+ * Every entry is validated before grouping; invalid entries are reported
+ * through `onError` and never solved or shared.
+ */
+export async function runBatch(
+  entries: unknown[],
+  run: BatchRunner,
+  {
+    concurrency,
+    signal,
+    validate = (entry) => validateGeneratorConfig(entry),
+    onProgress,
+    onResult,
+    onError,
+  }: BatchOptions
+): Promise<void> {
+  const configs: GeneratorConfig[] = [];
+
+  // Group valid indices by solver inputs (first member is solved)
+  const groups: number[][] = [];
+  const byKey = new Map<string, number[]>();
+  entries.forEach((entry, index) => {
+    let config: GeneratorConfig;
+    try {
+      config = validate(entry);
+    } catch (error) {
+      onError(index, error);
+      return;
+    }
+    configs[index] = config;
+
+    const key = solverInputKey(config);
+    const existing = key !== null ? byKey.get(key) : undefined;
+    if (existing) {
+      existing.push(index);
+      return;
+    }
+    const group = [index];
+    groups.push(group);
+    if (key !== null) byKey.set(key, group);
+  });
+
+  let next = 0;
+  const runGroup = async (group: number[]) => {
+    const [leader] = group;
+    try {
+      signal?.throwIfAborted();
+      const result = await run(configs[leader], (progress) => {
+        for (const index of group) onProgress?.(index, progress);
+      });
+      for (const index of group) {
+        onResult(
+          index,
+          index === leader ? result : relabelResult(result, configs[index])
+        );
+      }
+    } catch (error) {
+      for (const index of group) onError(index, error);
+    }
+  };
+
+  const lane = async () => {
+    while (next < groups.length) await runGroup(groups[next++]);
+  };
+
+  const lanes = Math.max(1, Math.min(concurrency, groups.length));
+  await Promise.all(Array.from({ length: lanes }, () => lane()));
+}
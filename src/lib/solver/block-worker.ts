@@ -0,0 +1,31 @@
+/**
+ * Decomposition Block Worker Entry
+ *
+ * Runs inside a worker_thread spawned by the decomposition solver.
+ * Solves one block's assignment sub-problem at a time and transfers the
+ * resulting board bitset back.
+ */
+
+import { parentPort } from "node:worker_threads";
+import { solveAssignment } from "./highs-solver";
+import type { BlockWorkerRequest, BlockWorkerResponse } from "./decomposition";
+
+parentPort?.on(
+  "message",
+  async ({ index, N, B, S, frequencies }: BlockWorkerRequest) => {
+    try {
+      const assignment = await solveAssignment(N, B, S, frequencies);
+      const response: BlockWorkerResponse = {
+        index,
+        bits: assignment?.bits ?? null,
+      };
+      parentPort?.postMessage(response, assignment ? [assignment.bits.buffer] : []);
+    } catch (error) {
+      const response: BlockWorkerResponse = {
+        index,
+        error: error instanceof Error ? error.message : "Unknown error",
+      };
+      parentPort?.postMessage(response);
+    }
+  }
+);
@@ -0,0 +1,151 @@
+/**
+ * Bitset Board Representation
+ *
+ * Stores which items sit on which board as ⌈N/32⌉ Uint32 words per board,
+ * all in one contiguous buffer. Pairwise overlap is an AND plus popcount
+ * over the board words, and a 1,000-board × 100-item run needs ~16 KB
+ * instead of 100k boxed numbers plus a Set per board.
+ */
+
+// ============================================================================
+// TYPES
+// ============================================================================
+
+/** Item membership for every board */
+export interface BoardBitset {
+  numItems: number;
+  numBoards: number;
+  /** Words per board: ⌈numItems / 32⌉ */
+  words: number;
+  /** Board b occupies bits[b × words, (b + 1) × words) */
+  bits: Uint32Array;
+}
+
+// ============================================================================
+// CONSTRUCTION
+// ============================================================================
+
+/**
+ * Create an empty bitset for N items on B boards
+ */
+export function createBoardBitset(N: number, B: number): BoardBitset {
+  const words = Math.ceil(N / 32);
+  return {
+    numItems: N,
+    numBoards: B,
+    words,
+    bits: new Uint32Array(words * B),
+  };
+}
+
+/**
+ * Deep copy (used to keep an incumbent while optimizing)
+ */
+export function cloneBoardBitset(set: BoardBitset): BoardBitset {
+  return { ...set, bits: set.bits.slice() };
+}
+
+// ============================================================================
+// MEMBERSHIP
+// ============================================================================
+
+export function hasItem(set: BoardBitset, b: number, i: number): boolean {
+  return (set.bits[b * set.words + (i >>> 5)] & (1 << (i & 31))) !== 0;
+}
+
+export function addItem(set: BoardBitset, b: number, i: number): void {
+  set.bits[b * set.words + (i >>> 5)] |= 1 << (i & 31);
+}
+
+export function removeItem(set: BoardBitset, b: number, i: number): void {
+  set.bits[b * set.words + (i >>> 5)] &= ~(1 << (i & 31));
+}
+
+/**
+ * Item indices on board b, in ascending order
+ */
+export function boardItemIndices(set: BoardBitset, b: number): number[] {
+  const items: number[] = [];
+  const offset = b * set.words;
+  for (let w = 0; w < set.words; w++) {
+    let word = set.bits[offset + w];
+    while (word !== 0) {
+      const bit = 31 - Math.clz32(word & -word);
+      items.push(w * 32 + bit);
+      word &= word - 1;
+    }
+  }
+  return items;
+}
+
+/**
+ * Number of items on board b
+ */
+export function boardSize(set: BoardBitset, b: number): number {
+  const offset = b * set.words;
+  let count = 0;
+  for (let w = 0; w < set.words; w++) count += popcount32(set.bits[offset + w]);
+  return count;
+}
+
+// ============================================================================
+// OVERLAP
+// ============================================================================
+
+/**
+ * Population count of a 32-bit word (SWAR)
+ */
+export function popcount32(x: number): number {
+  x = x - ((x >>> 1) & 0x55555555);
+  x = (x & 0x33333333) + ((x >>> 2) & 0x33333333);
+  x = (x + (x >>> 4)) & 0x0f0f0f0f;
+  return Math.imul(x, 0x01010101) >>> 24;
+}
+
+/**
+ * Number of items shared by boards b1 and b2
+ */
+export function overlapCount(set: BoardBitset, b1: number, b2: number): number {
+  const { bits, words } = set;
+  const o1 = b1 * words;
+  const o2 = b2 * words;
+  let count = 0;
+  for (let w = 0; w < words; w++) count += popcount32(bits[o1 + w] & bits[o2 + w]);
+  return count;
+}
+
+/** Summary of all pairwise overlaps */
+export interface OverlapSummary {
+  minOverlap: number;
+  maxOverlap: number;
+  totalOverlap: number;
+  pairCount: number;
+}
+
+/**
+ * Min / max / total overlap over every pair of boards
+ */
+export function summarizeOverlaps(set: BoardBitset): OverlapSummary {
+  const B = set.numBoards;
+  let minOverlap = Infinity;
+  let maxOverlap = 0;
+  let totalOverlap = 0;
+  let pairCount = 0;
+
+  for (let b1 = 0; b1 < B; b1++) {
+    for (let b2 = b1 + 1; b2 < B; b2++) {
+      const overlap = overlapCount(set, b1, b2);
+      if (overlap < minOverlap) minOverlap = overlap;
+      if (overlap > maxOverlap) maxOverlap = overlap;
+      totalOverlap += overlap;
+      pairCount++;
+    }
+  }
+
+  return {
+    minOverlap: pairCount > 0 ? minOverlap : 0,
+    maxOverlap,
+    totalOverlap,
+    pairCount,
+  };
+}
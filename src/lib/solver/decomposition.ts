@@ -0,0 +1,463 @@
+/**
+ * Decomposition Solver for Large Board Counts
+ *
+ * The assignment ILP has N×B binaries, so thousands of boards make a
+ * single HiGHS model impractical. Instead the boards are split into K
+ * blocks, each block gets a proportional share of every item's frequency,
+ * the block sub-problems are solved independently (inline, or in parallel
+ * on worker threads), and the merged assignment is handed to the overlap
+ * optimizer to fix cross-block overlap.
+ *
+ * Block workers are opt-in (DECOMPOSITION_WORKERS > 0), like generation
+ * workers: the block-worker entry is a .ts module that must be emitted by
+ * the build. They are only spawned from the main thread, since a
+ * generation worker already occupies one core of the pool. Blocks a
+ * worker fails to answer are solved inline.
+ *
+ * Frequency split: lay the B·S item slots out item by item and deal slot
+ * u to board position u mod B; position p belongs to block p mod K. An
+ * item's slots land on consecutive positions, so every block receives
+ * ⌊f/K⌋ or ⌈f/K⌉ of them, each block's slots sum to exactly B_k·S, and no
+ * item appears more than B_k times in a block.
+ *
+ * Blocks with equal shares are the same sub-problem, and a deterministic
+ * solver answers them with the same boards. Each block is therefore
+ * solved under its own random permutation of item labels, and the merged
+ * assignment is made duplicate-free (a duplicate board would overlap
+ * another in all S cells) by item swaps before it is returned.
+ *
+ * Server-only: import from route handlers or workers, never from client code.
+ */
+
+import { Worker, isMainThread } from "node:worker_threads";
+import { createDevLogger } from "@/lib/utils/dev-logger";
+import { yieldToEventLoop } from "@/lib/utils/event-loop";
+import {
+  type BoardBitset,
+  addItem,
+  boardItemIndices,
+  createBoardBitset,
+  removeItem,
+} from "./board-bitset";
+
+const log = createDevLogger("Decomposition");
+
+// ============================================================================
+// TYPES
+// ============================================================================
+
+/** One block's sub-problem */
+export interface BlockProblem {
+  numBoards: number;
+  frequencies: number[];
+}
+
+/** Solves one block (returns null when the block can't be solved) */
+export type BlockSolver = (
+  N: number,
+  B: number,
+  S: number,
+  frequencies: number[]
+) => Promise<BoardBitset | null>;
+
+/** Message sent to a block worker */
+export interface BlockWorkerRequest {
+  index: number;
+  N: number;
+  B: number;
+  S: number;
+  frequencies: number[];
+}
+
+/** Message sent back by a block worker */
+export type BlockWorkerResponse =
+  | { index: number; bits: Uint32Array | null }
+  | { index: number; error: string };
+
+/** Minimal worker surface used for blocks (satisfied by worker_threads) */
+export interface BlockWorker {
+  postMessage(message: BlockWorkerRequest): void;
+  on(event: "message", listener: (message: BlockWorkerResponse) => void): unknown;
+  on(event: "error", listener: (error: Error) => void): unknown;
+  on(event: "exit", listener: (code: number) => void): unknown;
+  terminate(): Promise<number>;
+}
+
+export interface DecompositionOptions {
+  /** In-process block solver (used when `workers` is 0, and for blocks
+   * a worker failed to solve) */
+  solveBlock: BlockSolver;
+  /** Worker threads for block solves (0 = solve blocks inline; defaults
+   * to DECOMPOSITION_WORKERS on the main thread and 0 inside a worker) */
+  workers?: number;
+  /** Creates a block worker (injectable for tests) */
+  createWorker?: () => BlockWorker;
+  /** Cancels outstanding block solves */
+  signal?: AbortSignal;
+  /** Random source for label permutations and duplicate repair
+   * (defaults to Math.random; pass the request's seeded source) */
+  random?: () => number;
+}
+
+// ============================================================================
+// CONFIGURATION
+// ============================================================================
+
+function envNumber(name: string, fallback: number): number {
+  const value = Number(process.env[name]);
+  return Number.isFinite(value) && value > 0 ? value : fallback;
+}
+
+/** Decompose once the assignment model would exceed this many binaries */
+export const DECOMPOSITION_THRESHOLD = envNumber(
+  "DECOMPOSITION_THRESHOLD",
+  50_000
+);
+
+/** Target number of binaries per block model */
+export const DECOMPOSITION_BLOCK_VARIABLES = envNumber(
+  "DECOMPOSITION_BLOCK_VARIABLES",
+  20_000
+);
+
+/**
+ * Whether an N-item, B-board problem should be decomposed
+ */
+export function shouldDecompose(N: number, B: number): boolean {
+  return N * B > DECOMPOSITION_THRESHOLD;
+}
+
+/** Block worker threads (opt-in; read per call so tests can set it) */
+function defaultWorkerCount(): number {
+  return isMainThread ? envNumber("DECOMPOSITION_WORKERS", 0) : 0;
+}
+
+function createThreadWorker(): BlockWorker {
+  return new Worker(new URL("./block-worker.ts", import.meta.url));
+}
+
+// ============================================================================
+// SPLITTING
+// ============================================================================
+
+/**
+ * Split B boards into K blocks with proportional per-item frequencies
+ *
+ * Requires ∑f = B·S and f_i ≤ B (otherwise returns null).
+ */
+export function splitFrequencies(
+  frequencies: number[],
+  B: number,
+  S: number,
+  K: number
+): BlockProblem[] | null {
+  const total = frequencies.reduce((sum, f) => sum + f, 0);
+  if (total !== B * S || frequencies.some((f) => f < 0 || f > B)) return null;
+
+  const blocks: BlockProblem[] = Array.from({ length: K }, (_, k) => ({
+    numBoards: Math.floor(B / K) + (k < B % K ? 1 : 0),
+    frequencies: new Array(frequencies.length).fill(0),
+  }));
+
+  let slot = 0;
+  frequencies.forEach((f, i) => {
+    for (let n = 0; n < f; n++, slot++) {
+      blocks[(slot % B) % K].frequencies[i]++;
+    }
+  });
+
+  return blocks;
+}
+
+/**
+ * Feasible assignment that deals each item's slots to consecutive boards
+ * (same layout as the split; used when a block solve fails)
+ */
+export function cyclicAssignment(
+  N: number,
+  B: number,
+  frequencies: number[]
+): BoardBitset {
+  const assignment = createBoardBitset(N, B);
+  let slot = 0;
+  frequencies.forEach((f, i) => {
+    for (let n = 0; n < f; n++, slot++) addItem(assignment, slot % B, i);
+  });
+  return assignment;
+}
+
+/**
+ * Random permutation of 0..N-1 (label j of a block stands for item π(j))
+ */
+function shuffledLabels(N: number, random: () => number): number[] {
+  const labels = Array.from({ length: N }, (_, i) => i);
+  for (let i = N - 1; i > 0; i--) {
+    const j = Math.floor(random() * (i + 1));
+    [labels[i], labels[j]] = [labels[j], labels[i]];
+  }
+  return labels;
+}
+
+/**
+ * Place block assignments back into one B-board assignment
+ * (block k's board j goes to board offset_k + j, label l to item π_k(l))
+ */
+function mergeBlocks(
+  N: number,
+  B: number,
+  parts: BoardBitset[],
+  labels: number[][]
+): BoardBitset {
+  const merged = createBoardBitset(N, B);
+  let offset = 0;
+  parts.forEach((part, k) => {
+    for (let b = 0; b < part.numBoards; b++) {
+      for (const label of boardItemIndices(part, b)) {
+        addItem(merged, offset + b, labels[k][label]);
+      }
+    }
+    offset += part.numBoards;
+  });
+  return merged;
+}
+
+/** Swap attempts per duplicate board before giving up on it */
+const MAX_SEPARATION_ATTEMPTS = 200;
+
+function boardKey(assignment: BoardBitset, b: number): string {
+  const { words, bits } = assignment;
+  return bits.subarray(b * words, (b + 1) * words).join(",");
+}
+
+function pick<T>(values: T[], random: () => number): T {
+  return values[Math.floor(random() * values.length)];
+}
+
+/**
+ * Make every board distinct by swapping items between duplicate boards
+ * and other boards (in place; board sizes and item frequencies are kept)
+ *
+ * Each duplicate swaps one of its items with an item of a random distinct
+ * board; the swap is kept only when both resulting boards are new. Cost
+ * is O(B·words) to index the boards plus a few swaps per duplicate, so it
+ * scales to any board count. Returns the number of duplicates left (0
+ * unless the item pool can't form B distinct boards).
+ */
+export function separateDuplicateBoards(
+  assignment: BoardBitset,
+  random: () => number
+): number {
+  const owners = new Map<string, number>();
+  const distinct: number[] = [];
+  const duplicates: number[] = [];
+
+  for (let b = 0; b < assignment.numBoards; b++) {
+    const key = boardKey(assignment, b);
+    if (owners.has(key)) {
+      duplicates.push(b);
+    } else {
+      owners.set(key, b);
+      distinct.push(b);
+    }
+  }
+
+  let remaining = 0;
+  for (const d of duplicates) {
+    let separated = false;
+    for (let attempt = 0; attempt < MAX_SEPARATION_ATTEMPTS; attempt++) {
+      const key = boardKey(assignment, d);
+      if (!owners.has(key)) {
+        owners.set(key, d);
+        separated = true;
+        break;
+      }
+
+      const o = pick(distinct, random);
+      const dItems = boardItemIndices(assignment, d);
+      const oItems = boardItemIndices(assignment, o);
+      const give = dItems.filter((i) => !oItems.includes(i));
+      const take = oItems.filter((i) => !dItems.includes(i));
+      if (give.length === 0 || take.length === 0) continue;
+
+      const x = pick(give, random);
+      const y = pick(take, random);
+      const oKey = boardKey(assignment, o);
+      removeItem(assignment, d, x);
+      addItem(assignment, d, y);
+      removeItem(assignment, o, y);
+      addItem(assignment, o, x);
+
+      const newDKey = boardKey(assignment, d);
+      const newOKey = boardKey(assignment, o);
+      if (newDKey !== newOKey && !owners.has(newDKey) && !owners.has(newOKey)) {
+        owners.delete(oKey);
+        owners.set(newOKey, o);
+        owners.set(newDKey, d);
+        separated = true;
+        break;
+      }
+
+      removeItem(assignment, o, x);
+      addItem(assignment, o, y);
+      removeItem(assignment, d, y);
+      addItem(assignment, d, x);
+    }
+
+    if (separated) distinct.push(d);
+    else remaining++;
+  }
+
+  if (remaining > 0) {
+    log.warn(`${remaining} duplicate boards could not be separated`);
+  }
+  return remaining;
+}
+
+// ============================================================================
+// BLOCK EXECUTION
+// ============================================================================
+
+/**
+ * Solve blocks on worker threads
+ *
+ * Never rejects on a worker failure: the failed worker's block and every
+ * block not yet answered are left undefined for the caller to solve
+ * inline. Rejects only when `signal` aborts.
+ */
+function solveBlocksInWorkers(
+  N: number,
+  S: number,
+  blocks: BlockProblem[],
+  workerCount: number,
+  createWorker: () => BlockWorker,
+  signal?: AbortSignal
+): Promise<Array<BoardBitset | null | undefined>> {
+  return new Promise((resolve, reject) => {
+    const results: Array<BoardBitset | null | undefined> = new Array(blocks.length);
+    const words = Math.ceil(N / 32);
+    const workers: BlockWorker[] = [];
+    let next = 0;
+    let completed = 0;
+    let settled = false;
+
+    const finish = (error?: unknown) => {
+      if (settled) return;
+      settled = true;
+      signal?.removeEventListener("abort", onAbort);
+      for (const worker of workers) void worker.terminate();
+      if (error) reject(error);
+      else resolve(results);
+    };
+    const onAbort = () => finish(signal?.reason);
+    const fail = (error: unknown) => {
+      if (settled) return;
+      log.warn("Block worker failed; solving remaining blocks inline", error);
+      finish();
+    };
+
+    const dispatch = (worker: BlockWorker) => {
+      if (next >= blocks.length) return;
+      const index = next++;
+      worker.postMessage({
+        index,
+        N,
+        B: blocks[index].numBoards,
+        S,
+        frequencies: blocks[index].frequencies,
+      });
+    };
+
+    if (signal?.aborted) return finish(signal.reason);
+    signal?.addEventListener("abort", onAbort, { once: true });
+
+    try {
+      for (let w = 0; w < Math.min(workerCount, blocks.length); w++) {
+        workers.push(createWorker());
+      }
+    } catch (error) {
+      return fail(error);
+    }
+
+    for (const worker of workers) {
+      worker.on("message", (message: BlockWorkerResponse) => {
+        if (settled) return;
+        if ("error" in message) return fail(new Error(message.error));
+        results[message.index] = message.bits
+          ? {
+              numItems: N,
+              numBoards: blocks[message.index].numBoards,
+              words,
+              bits: message.bits,
+            }
+          : null;
+        if (++completed === blocks.length) finish();
+        else dispatch(worker);
+      });
+      worker.on("error", fail);
+      worker.on("exit", (code: number) =>
+        fail(new Error(`Block worker exited with code ${code}`))
+      );
+      dispatch(worker);
+    }
+  });
+}
+
+// ============================================================================
+// ENTRY POINT
+// ============================================================================
+
+/**
+ * Solve a large assignment problem block by block
+ *
+ * Returns the merged assignment with no two boards alike (cross-block
+ * overlap not yet optimized), or null when the frequencies don't describe
+ * a feasible problem.
+ */
+export async function solveDecomposed(
+  N: number,
+  B: number,
+  S: number,
+  frequencies: number[],
+  options: DecompositionOptions
+): Promise<BoardBitset | null> {
+  const K = Math.max(2, Math.ceil((N * B) / DECOMPOSITION_BLOCK_VARIABLES));
+  const split = splitFrequencies(frequencies, B, S, Math.min(K, B));
+  if (!split) return null;
+
+  // Solve every block under its own item labelling
+  const random = options.random ?? Math.random;
+  const labels = split.map(() => shuffledLabels(N, random));
+  const blocks = split.map((block, k) => ({
+    numBoards: block.numBoards,
+    frequencies: labels[k].map((item) => block.frequencies[item]),
+  }));
+
+  const workers = options.workers ?? defaultWorkerCount();
+  const solved =
+    workers > 0
+      ? await solveBlocksInWorkers(
+          N,
+          S,
+          blocks,
+          workers,
+          options.createWorker ?? createThreadWorker,
+          options.signal
+        )
+      : new Array<BoardBitset | null | undefined>(blocks.length);
+
+  // Blocks left unsolved (all of them when running inline)
+  for (let k = 0; k < blocks.length; k++) {
+    if (solved[k] !== undefined) continue;
+    await yieldToEventLoop();
+    options.signal?.throwIfAborted();
+    solved[k] = await options.solveBlock(N, blocks[k].numBoards, S, blocks[k].frequencies);
+  }
+
+  const parts = solved.map(
+    (part, k) =>
+      part ?? cyclicAssignment(N, blocks[k].numBoards, blocks[k].frequencies)
+  );
+  const merged = mergeBlocks(N, B, parts, labels);
+  separateDuplicateBoards(merged, random);
+  return merged;
+}
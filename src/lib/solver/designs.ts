@@ -0,0 +1,376 @@
+/**
+ * Constructive Combinatorial Designs
+ *
+ * For many (N, S, B) layouts a low-overlap assignment can be written down
+ * directly instead of searched for:
+ *
+ * - disjoint: every item used at most once (B·S ≤ N), overlap 0.
+ * - difference set: a cyclic (v, k, λ) difference set D ⊂ ℤ_v developed
+ *   into its v translates; any two translates share exactly λ items,
+ *   which meets the averaging bound. Paley (quadratic residues, p ≡ 3
+ *   mod 4) and Singer (projective planes, prime q) sets plus their
+ *   complements are generated on demand.
+ * - difference family: m base blocks in ℤ_N developed by a stride g
+ *   (g | N, g | S), built greedily so that every translate difference is
+ *   represented as few times as possible. Overlap between two boards is
+ *   exactly one entry of the difference table, so the construction's max
+ *   overlap is known without comparing boards.
+ *
+ * Constructions apply only when every item has the same frequency (or at
+ * most one use), and are accepted only when they come within
+ * DESIGN_SLACK of the averaging lower bound; otherwise the caller falls
+ * back to HiGHS.
+ */
+
+import { type BoardBitset, addItem, createBoardBitset } from "./board-bitset";
+
+// ============================================================================
+// TYPES
+// ============================================================================
+
+/** Design family used for a construction */
+export type DesignFamily = "disjoint" | "difference-set" | "difference-family";
+
+export interface Construction {
+  family: DesignFamily;
+  /** Human-readable parameters, e.g. "(13, 4, 1) Singer difference set" */
+  name: string;
+  assignment: BoardBitset;
+  /** Exact max overlap between any two boards */
+  maxOverlap: number;
+}
+
+/** Accept a construction within this many items of the lower bound */
+const DESIGN_SLACK = 1;
+
+/** Skip the greedy difference family beyond this many count updates */
+const MAX_FAMILY_WORK = 20_000_000;
+
+/** Largest prime q for Singer difference sets (v = q² + q + 1) */
+const MAX_SINGER_ORDER = 31;
+
+// ============================================================================
+// BOUNDS
+// ============================================================================
+
+/**
+ * Lower bound on the max overlap for the given frequencies
+ *
+ * Item i is shared by C(f_i, 2) board pairs, so the average pair overlap
+ * is ∑C(f_i, 2) / C(B, 2); and two S-sets from N items share ≥ 2S − N.
+ */
+export function overlapLowerBound(
+  N: number,
+  B: number,
+  S: number,
+  frequencies: number[]
+): number {
+  if (B < 2) return 0;
+  const shared = frequencies.reduce((sum, f) => sum + (f * (f - 1)) / 2, 0);
+  const average = Math.ceil(shared / ((B * (B - 1)) / 2) - 1e-9);
+  return Math.max(0, 2 * S - N, average);
+}
+
+// ============================================================================
+// DIFFERENCE SETS
+// ============================================================================
+
+function isPrime(n: number): boolean {
+  if (n < 2) return false;
+  for (let d = 2; d * d <= n; d++) {
+    if (n % d === 0) return false;
+  }
+  return true;
+}
+
+/** Quadratic residues mod p: a (p, (p−1)/2, (p−3)/4) set for p ≡ 3 mod 4 */
+function paleySet(p: number): number[] {
+  const residues = new Set<number>();
+  for (let x = 1; x < p; x++) residues.add((x * x) % p);
+  return [...residues].sort((a, b) => a - b);
+}
+
+/**
+ * Multiply two elements of GF(q³) = GF(q)[x] / (x³ − c2·x² − c1·x − c0)
+ * (coefficients stored low to high)
+ */
+function cubicMultiply(
+  a: number[],
+  b: number[],
+  modulus: number[],
+  q: number
+): number[] {
+  const product = [0, 0, 0, 0, 0];
+  for (let i = 0; i < 3; i++) {
+    for (let j = 0; j < 3; j++) product[i + j] += a[i] * b[j];
+  }
+  for (let d = 4; d >= 3; d--) {
+    const top = product[d] % q;
+    product[d] = 0;
+    for (let k = 0; k < 3; k++) product[d - 3 + k] += top * modulus[k];
+  }
+  return [product[0] % q, product[1] % q, product[2] % q];
+}
+
+/**
+ * Singer (q² + q + 1, q + 1, 1) set for prime q: exponents i of a
+ * primitive element α of GF(q³) with α^i in the plane spanned by {1, α}
+ */
+function singerSet(q: number): number[] | null {
+  const v = q * q + q + 1;
+  const order = q * q * q - 1;
+
+  for (let c0 = 1; c0 < q; c0++) {
+    for (let c1 = 0; c1 < q; c1++) {
+      for (let c2 = 0; c2 < q; c2++) {
+        // Walk powers of x; primitive iff the first return to 1 is at q³ − 1
+        const modulus = [c0, c1, c2];
+        const inPlane: number[] = [];
+        let power = [1, 0, 0];
+        let i = 0;
+        do {
+          if (power[2] === 0 && i < v) inPlane.push(i);
+          power = cubicMultiply(power, [0, 1, 0], modulus, q);
+          i++;
+        } while (!(power[0] === 1 && power[1] === 0 && power[2] === 0));
+
+        if (i === order) return inPlane;
+      }
+    }
+  }
+  return null;
+}
+
+function complementSet(set: number[], v: number): number[] {
+  const members = new Set(set);
+  return Array.from({ length: v }, (_, x) => x).filter((x) => !members.has(x));
+}
+
+/**
+ * A known cyclic difference set with v = N and k = S, if any
+ */
+export function findDifferenceSet(
+  N: number,
+  S: number
+): { set: number[]; lambda: number; name: string } | null {
+  const candidates: Array<{
+    set: () => number[] | null;
+    k: number;
+    lambda: number;
+    name: string;
+  }> = [];
+
+  if (N % 4 === 3 && isPrime(N)) {
+    candidates.push({
+      set: () => paleySet(N),
+      k: (N - 1) / 2,
+      lambda: (N - 3) / 4,
+      name: "Paley",
+    });
+  }
+
+  const q = Math.round((Math.sqrt(4 * N - 3) - 1) / 2);
+  if (q * q + q + 1 === N && q <= MAX_SINGER_ORDER && isPrime(q)) {
+    candidates.push({ set: () => singerSet(q), k: q + 1, lambda: 1, name: "Singer" });
+  }
+
+  for (const candidate of candidates) {
+    const { k, lambda } = candidate;
+    if (S === k) {
+      const set = candidate.set();
+      if (set) {
+        return {
+          set,
+          lambda,
+          name: `(${N}, ${k}, ${lambda}) ${candidate.name} difference set`,
+        };
+      }
+    }
+    if (S === N - k) {
+      const set = candidate.set();
+      const complementLambda = N - 2 * k + lambda;
+      if (set) {
+        return {
+          set: complementSet(set, N),
+          lambda: complementLambda,
+          name: `(${N}, ${N - k}, ${complementLambda}) ${candidate.name} complement`,
+        };
+      }
+    }
+  }
+  return null;
+}
+
+// ============================================================================
+// DIFFERENCE FAMILIES
+// ============================================================================
+
+/**
+ * Greedily build m base blocks in ℤ_N (S/g elements per residue class mod
+ * g) whose stride-g translates have a flat difference table
+ *
+ * Board (i, a) = D_i + g·a. Boards (i, a) and (j, c) share
+ * counts[i][j][c − a] items, where counts[i][j][s] is the number of pairs
+ * (x ∈ D_i, y ∈ D_j) with x − y ≡ g·s (mod N).
+ */
+function buildDifferenceFamily(
+  N: number,
+  S: number,
+  g: number,
+  m: number
+): { blocks: number[][]; maxOverlap: number } {
+  const shifts = N / g;
+  const perClass = S / g;
+  const counts = new Uint32Array(m * m * shifts);
+  const at = (i: number, j: number, s: number) => (i * m + j) * shifts + s;
+  const blocks: number[][] = [];
+
+  for (let i = 0; i < m; i++) {
+    const block: number[] = [];
+    const inBlock = new Uint8Array(N);
+    const classFill = new Uint32Array(g);
+
+    while (block.length < S) {
+      let bestX = -1;
+      let bestMax = Infinity;
+      let bestSum = Infinity;
+
+      for (let x = 0; x < N; x++) {
+        if (inBlock[x] || classFill[x % g] >= perClass) continue;
+        let max = 0;
+        let sum = 0;
+        for (let j = 0; j <= i; j++) {
+          for (const y of j === i ? block : blocks[j]) {
+            if ((x - y) % g !== 0) continue;
+            const s = ((((x - y) % N) + N) % N) / g;
+            const value = counts[at(i, j, s)] + (j === i && 2 * s === shifts ? 2 : 1);
+            if (value > max) max = value;
+            sum += value;
+          }
+        }
+        if (max < bestMax || (max === bestMax && sum < bestSum)) {
+          bestX = x;
+          bestMax = max;
+          bestSum = sum;
+        }
+      }
+
+      for (let j = 0; j <= i; j++) {
+        for (const y of j === i ? block : blocks[j]) {
+          if ((bestX - y) % g !== 0) continue;
+          const s = ((((bestX - y) % N) + N) % N) / g;
+          const back = (shifts - s) % shifts;
+          counts[at(i, j, s)]++;
+          counts[at(j, i, back)]++;
+        }
+      }
+      block.push(bestX);
+      inBlock[bestX] = 1;
+      classFill[bestX % g]++;
+    }
+    blocks.push(block);
+  }
+
+  // Distinct boards: every (i, j, s) except a board with itself
+  let maxOverlap = 0;
+  for (let i = 0; i < m; i++) {
+    for (let j = 0; j < m; j++) {
+      for (let s = 0; s < shifts; s++) {
+        if (i === j && s === 0) continue;
+        maxOverlap = Math.max(maxOverlap, counts[at(i, j, s)]);
+      }
+    }
+  }
+  return { blocks, maxOverlap };
+}
+
+/** Develop base blocks into boards D_i + g·a (block-major order) */
+function developBlocks(N: number, blocks: number[][], g: number): BoardBitset {
+  const shifts = N / g;
+  const assignment = createBoardBitset(N, blocks.length * shifts);
+  blocks.forEach((block, i) => {
+    for (let a = 0; a < shifts; a++) {
+      for (const x of block) addItem(assignment, i * shifts + a, (x + g * a) % N);
+    }
+  });
+  return assignment;
+}
+
+// ============================================================================
+// ENTRY POINT
+// ============================================================================
+
+function disjointDesign(
+  N: number,
+  B: number,
+  S: number,
+  frequencies: number[]
+): Construction {
+  const assignment = createBoardBitset(N, B);
+  let slot = 0;
+  frequencies.forEach((f, i) => {
+    if (f === 1) addItem(assignment, Math.floor(slot++ / S), i);
+  });
+  return { family: "disjoint", name: "disjoint boards", assignment, maxOverlap: 0 };
+}
+
+/**
+ * Try the known design families for (N, S, B) and the target frequencies
+ *
+ * @returns The best construction within DESIGN_SLACK of the lower bound,
+ * or null when none applies
+ */
+export function constructDesign(
+  N: number,
+  B: number,
+  S: number,
+  frequencies: number[]
+): Construction | null {
+  if (B < 1 || S < 1 || frequencies.length !== N) return null;
+  const total = frequencies.reduce((sum, f) => sum + f, 0);
+  if (total !== B * S) return null;
+
+  if (frequencies.every((f) => f === 0 || f === 1)) {
+    return disjointDesign(N, B, S, frequencies);
+  }
+
+  // Cyclic constructions need every item used equally often
+  const r = frequencies[0];
+  if (frequencies.some((f) => f !== r) || r > B) return null;
+
+  const bound = overlapLowerBound(N, B, S, frequencies);
+  const candidates: Construction[] = [];
+
+  const differenceSet = B === N ? findDifferenceSet(N, S) : null;
+  if (differenceSet) {
+    candidates.push({
+      family: "difference-set",
+      name: differenceSet.name,
+      assignment: developBlocks(N, [differenceSet.set], 1),
+      maxOverlap: differenceSet.lambda,
+    });
+  }
+
+  if (!differenceSet || differenceSet.lambda > bound) {
+    for (let g = 1; g <= S; g++) {
+      if (N % g !== 0 || S % g !== 0 || B % (N / g) !== 0) continue;
+      const m = B / (N / g);
+      if (m * S * N * m * S > MAX_FAMILY_WORK) continue;
+
+      const { blocks, maxOverlap } = buildDifferenceFamily(N, S, g, m);
+      if (maxOverlap >= S) continue;
+      candidates.push({
+        family: "difference-family",
+        name: `cyclic difference family in ℤ${N} (${m} base block${m > 1 ? "s" : ""}, stride ${g})`,
+        assignment: developBlocks(N, blocks, g),
+        maxOverlap,
+      });
+    }
+  }
+
+  const best = candidates.reduce<Construction | null>(
+    (acc, c) => (!acc || c.maxOverlap < acc.maxOverlap ? c : acc),
+    null
+  );
+  return best && best.maxOverlap <= bound + DESIGN_SLACK ? best : null;
+}
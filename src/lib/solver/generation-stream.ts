@@ -0,0 +1,100 @@
+/**
+ * Streamed Generation Responses
+ *
+ * Wraps one generation in an NDJSON response for the generate route.
+ * Progress lines are enqueued as the solver reports them; because the
+ * solver yields to the event loop between phases and optimizer chunks,
+ * they reach the client while generation is still running, even when it
+ * runs inline on the request thread.
+ *
+ * Server-only: import from route handlers, never from client code.
+ */
+
+import type {
+  GenerationResult,
+  GenerationStreamEvent,
+  GeneratorConfig,
+} from "@/lib/types";
+import {
+  PACKED_BOARDS_PER_EVENT,
+  packBoards,
+} from "@/lib/utils/board-codec";
+import { toPlainBoard } from "@/lib/utils/board-layout";
+import { createDevLogger } from "@/lib/utils/dev-logger";
+import { yieldToEventLoop } from "@/lib/utils/event-loop";
+import { NDJSON_CONTENT_TYPE, encodeNdjsonLine } from "@/lib/utils/ndjson";
+
+const log = createDevLogger("GenerationStream");
+
+/**
+ * Stream a generation as NDJSON: progress events while solving, then one
+ * event per board, then a final "done" (or "error") event
+ *
+ * Only progress is incremental: the solver returns the whole assignment
+ * at once, so no board is sent until `run` has finished and the boards
+ * then follow back to back. What streaming buys is early progress and
+ * incremental parsing and rendering on the client, not an earlier first
+ * board.
+ *
+ * Compact streams send the item table once ("items") and then packed
+ * boards in chunks ("boards") instead of one "board" event per board,
+ * yielding between chunks so large results flush as they are packed.
+ */
+export function streamGeneration(
+  config: GeneratorConfig,
+  compact: boolean,
+  run: (onProgress: (event: GenerationStreamEvent) => void) => Promise<GenerationResult>
+): Response {
+  let closed = false;
+
+  const stream = new ReadableStream<Uint8Array>({
+    async start(controller) {
+      const send = (event: GenerationStreamEvent) => {
+        if (!closed) controller.enqueue(encodeNdjsonLine(event));
+      };
+
+      try {
+        const result = await run(send);
+        if (compact) {
+          const { items, boardConfig } = config;
+          send({ type: "items", items, boardConfig });
+          const { boards } = result;
+          for (let start = 0; start < boards.length; start += PACKED_BOARDS_PER_EVENT) {
+            if (start > 0) await yieldToEventLoop();
+            const chunk = boards.slice(start, start + PACKED_BOARDS_PER_EVENT);
+            send({ type: "boards", start, boards: packBoards(chunk, items) });
+          }
+        } else {
+          for (const board of result.boards) {
+            send({ type: "board", board: toPlainBoard(board) });
+          }
+        }
+        send({
+          type: "done",
+          success: result.success,
+          stats: result.stats,
+          errors: result.errors,
+        });
+      } catch (error) {
+        log.error("Streaming generation failed", error);
+        send({
+          type: "error",
+          error: error instanceof Error ? error.message : String(error),
+        });
+      } finally {
+        if (!closed) controller.close();
+        closed = true;
+      }
+    },
+    cancel() {
+      closed = true;
+    },
+  });
+
+  return new Response(stream, {
+    headers: {
+      "Content-Type": NDJSON_CONTENT_TYPE,
+      "Cache-Control": "no-cache",
+    },
+  });
+}
@@ -0,0 +1,31 @@
+/**
+ * Generation Worker Entry
+ *
+ * Runs inside a worker_thread spawned by the generation worker pool.
+ * Receives one job at a time, forwards progress events while it runs, and
+ * posts back the result or an error. Posts `{ ready: true }` once loaded,
+ * so the pool can tell a worker that never started from one that crashed.
+ */
+
+import { parentPort } from "node:worker_threads";
+import { generateBoardsWithHiGHS } from "./highs-solver";
+import type { WorkerReady, WorkerRequest, WorkerResponse } from "./worker-pool";
+
+parentPort?.on("message", async ({ id, config }: WorkerRequest) => {
+  let response: WorkerResponse;
+  try {
+    const result = await generateBoardsWithHiGHS(config, {
+      onProgress: (progress) =>
+        parentPort?.postMessage({ id, progress } satisfies WorkerResponse),
+    });
+    response = { id, result };
+  } catch (error) {
+    response = {
+      id,
+      error: error instanceof Error ? error.message : "Unknown error",
+    };
+  }
+  parentPort?.postMessage(response);
+});
+
+parentPort?.postMessage({ ready: true } satisfies WorkerReady);
@@ -0,0 +1,123 @@
+/**
+ * Greedy Assignment Engine
+ *
+ * Fallback used when HiGHS can't produce an assignment. Boards are filled
+ * one at a time, always taking items with the largest remaining need
+ * (which keeps every frequency reachable) and, among equally needy items,
+ * the one that has co-occurred least with the items already on the board.
+ *
+ * Remaining need lives in a bucket queue (doubly linked lists keyed by
+ * need), so no per-board filtering or sorting is required. Co-occurrence
+ * is an incremental N×N counter; each board keeps a running score per
+ * item (co-occurrence with the board so far), updated in O(N) per pick.
+ * Total cost is O(B·S·N) with no allocation inside the loop.
+ */
+
+import { type BoardBitset, addItem, createBoardBitset } from "./board-bitset";
+
+// ============================================================================
+// BUCKET QUEUE
+// ============================================================================
+
+/** Items bucketed by remaining need (doubly linked lists, -1 = none) */
+interface NeedQueue {
+  head: Int32Array;
+  next: Int32Array;
+  prev: Int32Array;
+  /** Highest bucket that may be non-empty */
+  top: number;
+}
+
+function createNeedQueue(N: number, maxNeed: number): NeedQueue {
+  return {
+    head: new Int32Array(maxNeed + 1).fill(-1),
+    next: new Int32Array(N).fill(-1),
+    prev: new Int32Array(N).fill(-1),
+    top: 0,
+  };
+}
+
+function queueInsert(q: NeedQueue, item: number, need: number): void {
+  const first = q.head[need];
+  q.prev[item] = -1;
+  q.next[item] = first;
+  if (first !== -1) q.prev[first] = item;
+  q.head[need] = item;
+  if (need > q.top) q.top = need;
+}
+
+function queueRemove(q: NeedQueue, item: number, need: number): void {
+  const p = q.prev[item];
+  const n = q.next[item];
+  if (p !== -1) q.next[p] = n;
+  else q.head[need] = n;
+  if (n !== -1) q.prev[n] = p;
+}
+
+// ============================================================================
+// ENTRY POINT
+// ============================================================================
+
+/**
+ * Build an assignment that meets the target frequencies (when feasible)
+ * while spreading co-occurrences
+ *
+ * If the frequencies can't fill every board (∑f < B·S), trailing boards
+ * are left short, matching the previous greedy behavior.
+ */
+export function greedyAssignment(
+  N: number,
+  B: number,
+  S: number,
+  frequencies: number[]
+): BoardBitset {
+  const assignment = createBoardBitset(N, B);
+  const need = Int32Array.from(frequencies, (f) => Math.max(0, f));
+  const queue = createNeedQueue(
+    N,
+    need.reduce((max, f) => Math.max(max, f), 0)
+  );
+  for (let i = N - 1; i >= 0; i--) {
+    if (need[i] > 0) queueInsert(queue, i, need[i]);
+  }
+
+  const cooccurrence = new Uint32Array(N * N);
+  const score = new Uint32Array(N);
+  const picked = new Int32Array(S);
+
+  for (let b = 0; b < B; b++) {
+    score.fill(0);
+    let count = 0;
+
+    while (count < S) {
+      while (queue.top > 0 && queue.head[queue.top] === -1) queue.top--;
+      if (queue.top === 0) break;
+
+      // Least co-occurring item among those with the most remaining need
+      let best = queue.head[queue.top];
+      for (let i = queue.next[best]; i !== -1; i = queue.next[i]) {
+        if (score[i] < score[best]) best = i;
+      }
+
+      queueRemove(queue, best, need[best]);
+      addItem(assignment, b, best);
+      picked[count++] = best;
+
+      const row = best * N;
+      for (let j = 0; j < N; j++) score[j] += cooccurrence[row + j];
+    }
+
+    // Items stay out of the queue until the board is complete (no repeats)
+    for (let k = 0; k < count; k++) {
+      const item = picked[k];
+      if (--need[item] > 0) queueInsert(queue, item, need[item]);
+      for (let l = 0; l < k; l++) {
+        const other = picked[l];
+        cooccurrence[item * N + other]++;
+        cooccurrence[other * N + item]++;
+      }
+    }
+  }
+
+  return assignment;
+}
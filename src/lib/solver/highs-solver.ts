@@ -9,12 +9,52 @@ import type {
   GeneratorConfig,
   GeneratedBoard,
   GenerationResult,
+  GenerationProgress,
   GenerationStats,
+  GenerationTimings,
   Item,
+  OptimizerStats,
+  OptimizerStrategy,
+  SolverMode,
+  SolverUsed,
 } from "@/lib/types";
-import { getBoardSize } from "@/lib/types";
-import { calculateFrequencies } from "@/lib/constraints/engine";
+import { DEFAULT_QUALITY_TIME_BUDGET_MS, getBoardSize } from "@/lib/types";
+import {
+  calculateFrequencies,
+  precheckFeasibility,
+} from "@/lib/constraints/engine";
 import { createDevLogger } from "@/lib/utils/dev-logger";
+import { createBoard } from "@/lib/utils/board-layout";
+import { yieldToEventLoop } from "@/lib/utils/event-loop";
+import {
+  acquireSolver,
+  type HighsInstance,
+  type SolverLease,
+} from "./solver-pool";
+import {
+  type SparseModel,
+  buildAssignmentModel,
+  buildOverlapModel,
+  lambdaColumn,
+  modelToLp,
+  readPrimalValues,
+} from "./model-builder";
+import {
+  type BoardBitset,
+  addItem,
+  boardItemIndices,
+  createBoardBitset,
+  overlapCount,
+  summarizeOverlaps,
+} from "./board-bitset";
+import {
+  type OptimizerControl,
+  localSearchOptimization,
+  runOptimizer,
+} from "./optimizers";
+import { shouldDecompose, solveDecomposed } from "./decomposition";
+import { constructDesign } from "./designs";
+import { greedyAssignment } from "./greedy";
 
 const log = createDevLogger("HiGHS");
 
@@ -24,13 +64,12 @@ const log = createDevLogger("HiGHS");
 
 /**
  * Simple seeded random number generator (Mulberry32)
- * Provides deterministic randomness when a seed is provided
+ *
+ * Each generation creates its own instance and passes it down explicitly,
+ * so concurrent solves never share a random stream. Exported for
+ * benchmarks.
  */
-function createSeededRandom(seed?: number): () => number {
-  if (seed === undefined) {
-    return Math.random;
-  }
-  
+export function createSeededRandom(seed: number): () => number {
   let state = seed;
   return function() {
     state |= 0;
@@ -41,367 +80,608 @@ function createSeededRandom(seed?: number): () => number {
   };
 }
 
-// Module-level random function (can be seeded for tests)
-let randomFn: () => number = Math.random;
-
-/**
- * Set a seed for deterministic generation (useful for tests)
- * Call with undefined to reset to Math.random
- */
-export function setSeed(seed?: number): void {
-  randomFn = createSeededRandom(seed);
-}
-
-/**
- * Reset to non-deterministic random
- */
-export function resetSeed(): void {
-  randomFn = Math.random;
-}
-
-interface SolverResult {
+/** Outcome of one solver stage (exported for benchmarks) */
+export interface SolverResult {
   success: boolean;
-  assignment: number[][];
+  /** Item membership per board (empty when unsuccessful) */
+  assignment: BoardBitset;
   maxOverlap: number;
+  /** Proven lower bound on max overlap ("quality" mode only) */
+  lowerBound?: number;
   solveTimeMs: number;
-  solverUsed: "highs" | "greedy";
+  /** Time spent obtaining a HiGHS instance (0 for greedy) */
+  instantiationTimeMs: number;
+  solverUsed: SolverUsed;
+  /** Design that produced the assignment (solverUsed "design") */
+  construction?: string;
+  /** Counters from the post-solve optimizer, when one ran */
+  optimizer?: OptimizerStats;
 }
 
 /**
- * Fisher-Yates shuffle using seeded random
+ * Fisher-Yates shuffle using the request's random source
  */
-function shuffleArray<T>(array: T[]): T[] {
+function shuffleArray<T>(array: T[], random: () => number): T[] {
   const result = [...array];
   for (let i = result.length - 1; i > 0; i--) {
-    const j = Math.floor(randomFn() * (i + 1));
+    const j = Math.floor(random() * (i + 1));
     [result[i], result[j]] = [result[j], result[i]];
   }
   return result;
 }
 
+/** Options for a HiGHS solve */
+interface HighsSolveOptions {
+  mode: SolverMode;
+  /** Wall-clock budget for "quality" mode (ms) */
+  timeBudgetMs: number;
+  /** Overlap optimizer applied to the solver's assignment */
+  optimizer: OptimizerStrategy;
+  /** Random source for stochastic optimizers */
+  random: () => number;
+  /** Progress sink (elapsed time is filled in by the caller) */
+  report: ProgressReporter;
+  /** Cancels the solve between phases and inside optimizer loops */
+  signal?: AbortSignal;
+  /** Per-phase time accumulator for this generation */
+  timings: GenerationTimings;
+}
+
+/** Emits a progress event relative to the start of the generation */
+type ProgressReporter = (progress: Omit<GenerationProgress, "elapsedMs">) => void;
+
+// ============================================================================
+// PHASE TIMING
+// ============================================================================
+
+function createTimings(): GenerationTimings {
+  return {
+    precheckMs: 0,
+    constructionMs: 0,
+    solverInitMs: 0,
+    modelBuildMs: 0,
+    solveMs: 0,
+    parseMs: 0,
+    localSearchMs: 0,
+    boardsMs: 0,
+    statsMs: 0,
+  };
+}
+
 /**
- * Build HiGHS LP format model
+ * Run `fn`, adding its wall-clock time to one phase
  */
-function buildModel(N: number, B: number, S: number, freq: number[]): string {
-  const lines: string[] = [];
-
-  lines.push("Minimize");
-  lines.push(" obj: 0");
-  lines.push("");
-  lines.push("Subject To");
-
-  for (let i = 0; i < N; i++) {
-    const terms: string[] = [];
-    for (let b = 0; b < B; b++) {
-      terms.push(`x_${i}_${b}`);
-    }
-    lines.push(` freq_${i}: ${terms.join(" + ")} = ${freq[i]}`);
+function timed<T>(
+  timings: GenerationTimings,
+  phase: keyof GenerationTimings,
+  fn: () => T
+): T {
+  const start = performance.now();
+  try {
+    return fn();
+  } finally {
+    timings[phase] += performance.now() - start;
   }
+}
 
-  for (let b = 0; b < B; b++) {
-    const terms: string[] = [];
-    for (let i = 0; i < N; i++) {
-      terms.push(`x_${i}_${b}`);
-    }
-    lines.push(` board_${b}: ${terms.join(" + ")} = ${S}`);
+/**
+ * Await `fn`, adding its wall-clock time to one phase
+ */
+async function timedAsync<T>(
+  timings: GenerationTimings,
+  phase: keyof GenerationTimings,
+  fn: () => Promise<T>
+): Promise<T> {
+  const start = performance.now();
+  try {
+    return await fn();
+  } finally {
+    timings[phase] += performance.now() - start;
   }
+}
 
-  lines.push("");
-  lines.push("Binary");
-  for (let i = 0; i < N; i++) {
-    for (let b = 0; b < B; b++) {
-      lines.push(` x_${i}_${b}`);
-    }
-  }
+/** Optimizer hooks: "local-search" progress events plus the abort signal */
+function optimizerControl(
+  report: ProgressReporter,
+  signal?: AbortSignal
+): OptimizerControl {
+  return {
+    onProgress: (iteration, maxOverlap) =>
+      report({ phase: "local-search", iteration, maxOverlap }),
+    signal,
+  };
+}
+
+/** Upper bound on lazily added pair cuts per quality solve */
+const MAX_OVERLAP_CUTS = 400;
 
-  lines.push("");
-  lines.push("End");
+/** Cuts added per round (worst violating pairs first) */
+const CUTS_PER_ROUND = 40;
+
+type HighsOptions = Parameters<HighsInstance["solve"]>[1];
+
+/**
+ * Run one sparse model through a HiGHS instance
+ *
+ * Serialization, the solve and column parsing are timed separately.
+ *
+ * @returns Solver status and primal values by model column
+ */
+function runModel(
+  solver: HighsInstance,
+  model: SparseModel,
+  highsOptions: HighsOptions = {},
+  timings: GenerationTimings = createTimings()
+): { status: string; primal: Float64Array } {
+  const { lp, columnOrder } = timed(timings, "modelBuildMs", () => modelToLp(model));
+  const result = timed(timings, "solveMs", () => solver.solve(lp, highsOptions));
+  return {
+    status: result.Status,
+    primal: timed(timings, "parseMs", () =>
+      readPrimalValues(result.Columns, columnOrder)
+    ),
+  };
+}
 
-  return lines.join("\n");
+/**
+ * Run the configured overlap optimizer, recording its time and counters
+ */
+async function optimizeAssignment(
+  assignment: BoardBitset,
+  S: number,
+  options: HighsSolveOptions
+): Promise<{ maxOverlap: number; optimizer: OptimizerStats }> {
+  const { maxOverlap, ...counters } = await timedAsync(
+    options.timings,
+    "localSearchMs",
+    () =>
+      runOptimizer(
+        options.optimizer,
+        assignment,
+        S,
+        options.random,
+        optimizerControl(options.report, options.signal)
+      )
+  );
+  return { maxOverlap, optimizer: { strategy: options.optimizer.type, ...counters } };
 }
 
 /**
- * Local search optimization to reduce overlap
+ * Decode the x[i,b] block of a primal vector (column j = i × B + b)
  */
-function localSearchOptimization(
-  assignment: number[][],
-  boardItems: Set<number>[],
-  N: number,
-  B: number
-): void {
-  const maxIterations = 50;
-  const maxSwapAttempts = 20;
-
-  for (let iter = 0; iter < maxIterations; iter++) {
-    let currentMaxOverlap = 0;
-    let worstPair: [number, number] = [-1, -1];
-
-    for (let b1 = 0; b1 < B; b1++) {
-      for (let b2 = b1 + 1; b2 < B; b2++) {
-        let overlap = 0;
-        for (let i = 0; i < N; i++) {
-          if (assignment[i][b1] === 1 && assignment[i][b2] === 1) overlap++;
-        }
-        if (overlap > currentMaxOverlap) {
-          currentMaxOverlap = overlap;
-          worstPair = [b1, b2];
-        }
-      }
+function primalToBitset(primal: Float64Array, N: number, B: number): BoardBitset {
+  const assignment = createBoardBitset(N, B);
+  for (let j = 0; j < N * B; j++) {
+    if (primal[j] > 0.5) {
+      const i = Math.floor(j / B);
+      addItem(assignment, j - i * B, i);
     }
+  }
+  return assignment;
+}
 
-    if (currentMaxOverlap <= 6 || worstPair[0] === -1) break;
+/**
+ * Check board sizes and item frequencies (used for time-limited solves,
+ * whose status alone doesn't say whether an incumbent was found)
+ */
+function isValidAssignment(
+  assignment: BoardBitset,
+  S: number,
+  frequencies: number[]
+): boolean {
+  const counts = new Array(assignment.numItems).fill(0);
+  for (let b = 0; b < assignment.numBoards; b++) {
+    const items = boardItemIndices(assignment, b);
+    if (items.length !== S) return false;
+    for (const i of items) counts[i]++;
+  }
+  return counts.every((count, i) => count === frequencies[i]);
+}
 
-    const [b1, b2] = worstPair;
-    let improved = false;
-    let attempts = 0;
+/**
+ * Board pairs whose overlap exceeds `bound`, worst first
+ */
+function violatingPairs(
+  assignment: BoardBitset,
+  bound: number,
+  limit: number
+): Array<[number, number]> {
+  const B = assignment.numBoards;
+  const found: Array<[number, number, number]> = [];
+  for (let b1 = 0; b1 < B; b1++) {
+    for (let b2 = b1 + 1; b2 < B; b2++) {
+      const overlap = overlapCount(assignment, b1, b2);
+      if (overlap > bound) found.push([b1, b2, overlap]);
+    }
+  }
+  found.sort((p, q) => q[2] - p[2]);
+  return found.slice(0, limit).map(([b1, b2]) => [b1, b2]);
+}
 
-    const sharedItems: number[] = [];
-    for (let i = 0; i < N; i++) {
-      if (assignment[i][b1] === 1 && assignment[i][b2] === 1) {
-        sharedItems.push(i);
-      }
+/**
+ * Minimize the max pairwise overlap with lazily added pair cuts
+ *
+ * Each round solves the assignment model with a minimized bound λ over
+ * the pairs cut so far. λ* is a valid lower bound on the true optimum;
+ * if the solution's real max overlap matches it, the solution is optimal.
+ * Otherwise the worst violating pairs are cut and the model is re-solved.
+ * The best incumbent seen is kept when the budget runs out.
+ *
+ * Yields to the event loop between rounds, so a client disconnect or job
+ * timeout can abort the solve while it runs.
+ *
+ * @throws The signal's reason when aborted before or between HiGHS calls
+ */
+async function solveMinMaxOverlap(
+  solver: HighsInstance,
+  N: number,
+  B: number,
+  S: number,
+  frequencies: number[],
+  timeBudgetMs: number,
+  report: ProgressReporter,
+  timings: GenerationTimings,
+  signal?: AbortSignal
+): Promise<{ assignment: BoardBitset; lowerBound: number } | null> {
+  // Every HiGHS call is capped at what is left of the budget, and the
+  // signal is checked around each one (a running call can't be interrupted)
+  const deadline = performance.now() + timeBudgetMs;
+  const remainingSeconds = () =>
+    Math.max(0.001, (deadline - performance.now()) / 1000);
+
+  // Any two boards share at least 2S − N items
+  let lowerBound = Math.max(0, 2 * S - N);
+
+  const initialModel = timed(timings, "modelBuildMs", () =>
+    buildAssignmentModel(N, B, S, frequencies)
+  );
+  report({ phase: "model-built" });
+  await yieldToEventLoop();
+  signal?.throwIfAborted();
+  const initial = runModel(
+    solver,
+    initialModel,
+    { time_limit: remainingSeconds() },
+    timings
+  );
+  signal?.throwIfAborted();
+  let best = timed(timings, "parseMs", () => primalToBitset(initial.primal, N, B));
+  if (!isValidAssignment(best, S, frequencies)) return null;
+
+  // Local search first so cuts target pairs the heuristic can't fix
+  let bestMax = (
+    await timedAsync(timings, "localSearchMs", () =>
+      localSearchOptimization(best, S, undefined, optimizerControl(report, signal))
+    )
+  ).maxOverlap;
+  let latest = best;
+  const cuts: Array<[number, number]> = [];
+  const lambda = lambdaColumn(N, B);
+
+  while (
+    bestMax > lowerBound &&
+    cuts.length < MAX_OVERLAP_CUTS &&
+    performance.now() < deadline
+  ) {
+    await yieldToEventLoop();
+    signal?.throwIfAborted();
+    const newCuts = violatingPairs(latest, lowerBound, CUTS_PER_ROUND);
+    if (newCuts.length === 0) break;
+    cuts.push(...newCuts);
+
+    const model = timed(timings, "modelBuildMs", () =>
+      buildOverlapModel(N, B, S, frequencies, cuts, lowerBound)
+    );
+    signal?.throwIfAborted();
+    if (performance.now() >= deadline) break;
+    const round = runModel(
+      solver,
+      model,
+      { time_limit: remainingSeconds() },
+      timings
+    );
+    signal?.throwIfAborted();
+    const candidate = timed(timings, "parseMs", () =>
+      primalToBitset(round.primal, N, B)
+    );
+    if (!isValidAssignment(candidate, S, frequencies)) break;
+
+    // λ* of a completed round bounds every assignment from below
+    if (round.status === "Optimal") {
+      lowerBound = Math.max(lowerBound, Math.ceil(round.primal[lambda] - 1e-6));
     }
 
-    outerLoop: for (const item of sharedItems) {
-      if (improved || attempts >= maxSwapAttempts) break;
-
-      for (const sourceBoard of [b1, b2]) {
-        if (improved || attempts >= maxSwapAttempts) break;
-
-        for (let targetBoard = 0; targetBoard < B; targetBoard++) {
-          if (improved || attempts >= maxSwapAttempts) break;
-          if (targetBoard === b1 || targetBoard === b2) continue;
-          if (assignment[item][targetBoard] === 1) continue;
-
-          let swapCount = 0;
-          for (const swapItem of boardItems[targetBoard]) {
-            if (swapCount >= 3) break;
-            if (assignment[swapItem][sourceBoard] === 1) continue;
-
-            attempts++;
-            swapCount++;
-
-            assignment[item][sourceBoard] = 0;
-            assignment[item][targetBoard] = 1;
-            assignment[swapItem][targetBoard] = 0;
-            assignment[swapItem][sourceBoard] = 1;
-
-            boardItems[sourceBoard].delete(item);
-            boardItems[sourceBoard].add(swapItem);
-            boardItems[targetBoard].delete(swapItem);
-            boardItems[targetBoard].add(item);
-
-            let newOverlap = 0;
-            for (let i = 0; i < N; i++) {
-              if (assignment[i][b1] === 1 && assignment[i][b2] === 1)
-                newOverlap++;
-            }
-
-            if (newOverlap < currentMaxOverlap) {
-              improved = true;
-              break outerLoop;
-            }
-
-            // Revert
-            assignment[item][sourceBoard] = 1;
-            assignment[item][targetBoard] = 0;
-            assignment[swapItem][targetBoard] = 1;
-            assignment[swapItem][sourceBoard] = 0;
-
-            boardItems[sourceBoard].add(item);
-            boardItems[sourceBoard].delete(swapItem);
-            boardItems[targetBoard].add(swapItem);
-            boardItems[targetBoard].delete(item);
-          }
-        }
-      }
+    latest = candidate;
+    const candidateMax = summarizeOverlaps(candidate).maxOverlap;
+    if (candidateMax < bestMax) {
+      best = candidate;
+      bestMax = candidateMax;
     }
 
-    if (!improved) break;
+    log.debug(
+      `Overlap cuts: ${cuts.length}, λ ≥ ${lowerBound}, best max overlap ${bestMax}`
+    );
   }
+
+  return { assignment: best, lowerBound: Math.min(lowerBound, bestMax) };
 }
 
 /**
- * Solve using HiGHS ILP solver
+ * Solve using HiGHS ILP solver (instance borrowed from the solver pool)
  */
 async function solveWithHiGHS(
   N: number,
   B: number,
   S: number,
-  frequencies: number[]
+  frequencies: number[],
+  options: HighsSolveOptions
 ): Promise<SolverResult> {
-  const startTime = performance.now();
+  let lease: SolverLease | null = null;
+  let instantiationTimeMs = 0;
 
   try {
-    const highs = await import("highs");
-    const solver = await highs.default();
+    lease = await timedAsync(options.timings, "solverInitMs", acquireSolver);
+    instantiationTimeMs = lease.instantiationMs;
+    const startTime = performance.now();
+
+    if (options.mode === "quality") {
+      const solved = await solveMinMaxOverlap(
+        lease.solver,
+        N,
+        B,
+        S,
+        frequencies,
+        options.timeBudgetMs,
+        options.report,
+        options.timings,
+        options.signal
+      );
+      lease.release();
+      options.signal?.throwIfAborted();
+
+      if (!solved) {
+        return {
+          success: false,
+          assignment: createBoardBitset(0, 0),
+          maxOverlap: -1,
+          solveTimeMs: 0,
+          instantiationTimeMs,
+          solverUsed: "highs",
+        };
+      }
+
+      options.report({ phase: "solved" });
+      const optimized = await optimizeAssignment(solved.assignment, S, options);
 
-    const model = buildModel(N, B, S, frequencies);
-    const result = solver.solve(model);
+      return {
+        success: true,
+        assignment: solved.assignment,
+        maxOverlap: optimized.maxOverlap,
+        lowerBound: solved.lowerBound,
+        solveTimeMs: performance.now() - startTime,
+        instantiationTimeMs,
+        solverUsed: "highs",
+        optimizer: optimized.optimizer,
+      };
+    }
 
-    if (result.Status !== "Optimal") {
+    const model = timed(options.timings, "modelBuildMs", () =>
+      buildAssignmentModel(N, B, S, frequencies)
+    );
+    options.report({ phase: "model-built" });
+    await yieldToEventLoop();
+    options.signal?.throwIfAborted();
+    const result = runModel(lease.solver, model, {}, options.timings);
+    lease.release();
+    options.signal?.throwIfAborted();
+
+    if (result.status !== "Optimal") {
       return {
         success: false,
-        assignment: [],
+        assignment: createBoardBitset(0, 0),
         maxOverlap: -1,
         solveTimeMs: 0,
+        instantiationTimeMs,
         solverUsed: "highs",
       };
     }
 
-    const assignment: number[][] = Array.from({ length: N }, () =>
-      Array(B).fill(0)
-    );
-    const boardItems: Set<number>[] = Array.from(
-      { length: B },
-      () => new Set()
+    const assignment = timed(options.timings, "parseMs", () =>
+      primalToBitset(result.primal, N, B)
     );
+    options.report({ phase: "solved" });
 
-    for (const [name, col] of Object.entries(result.Columns)) {
-      if (name.startsWith("x_")) {
-        const parts = name.split("_");
-        const i = parseInt(parts[1]);
-        const b = parseInt(parts[2]);
-        const primal = (col as { Primal: number }).Primal;
-        if (i < N && b < B && primal > 0.5) {
-          assignment[i][b] = 1;
-          boardItems[b].add(i);
-        }
-      }
-    }
-
-    // Apply local search
-    localSearchOptimization(assignment, boardItems, N, B);
-
-    // Calculate final max overlap
-    let maxOverlap = 0;
-    for (let b1 = 0; b1 < B; b1++) {
-      for (let b2 = b1 + 1; b2 < B; b2++) {
-        let overlap = 0;
-        for (let i = 0; i < N; i++) {
-          if (assignment[i][b1] === 1 && assignment[i][b2] === 1) {
-            overlap++;
-          }
-        }
-        maxOverlap = Math.max(maxOverlap, overlap);
-      }
-    }
+    // Reduce overlap with the selected optimizer
+    const optimized = await optimizeAssignment(assignment, S, options);
 
     return {
       success: true,
       assignment,
-      maxOverlap,
+      maxOverlap: optimized.maxOverlap,
       solveTimeMs: performance.now() - startTime,
+      instantiationTimeMs,
       solverUsed: "highs",
+      optimizer: optimized.optimizer,
     };
   } catch (error) {
+    if (options.signal?.aborted) {
+      // Cancelled between phases: the instance is fine (release is idempotent)
+      lease?.release();
+      throw error;
+    }
     log.error("Solver error", error);
+    // A WASM instance that threw may be corrupted; never reuse it
+    lease?.release({ discard: true });
     return {
       success: false,
-      assignment: [],
+      assignment: createBoardBitset(0, 0),
       maxOverlap: -1,
       solveTimeMs: 0,
+      instantiationTimeMs,
       solverUsed: "highs",
     };
   }
 }
 
 /**
- * Greedy fallback solver
+ * Solve the plain assignment model for one (sub-)problem
+ *
+ * Used for decomposition blocks, in-process or on a block worker.
+ *
+ * @returns The assignment, or null when HiGHS finds no optimal solution
  */
-function solveGreedy(
+export async function solveAssignment(
   N: number,
   B: number,
   S: number,
   frequencies: number[]
-): SolverResult {
+): Promise<BoardBitset | null> {
+  const lease = await acquireSolver();
+  try {
+    const result = runModel(lease.solver, buildAssignmentModel(N, B, S, frequencies));
+    lease.release();
+    return result.status === "Optimal" ? primalToBitset(result.primal, N, B) : null;
+  } catch (error) {
+    log.error("Block solver error", error);
+    lease.release({ discard: true });
+    return null;
+  }
+}
+
+/**
+ * Solve a large problem block by block, then fix cross-block overlap
+ * with the selected optimizer
+ */
+async function solveDecomposedWithHiGHS(
+  N: number,
+  B: number,
+  S: number,
+  frequencies: number[],
+  options: HighsSolveOptions
+): Promise<SolverResult> {
   const startTime = performance.now();
-  const assignment: number[][] = Array.from({ length: N }, () =>
-    Array(B).fill(0)
-  );
-  const boardItems: Set<number>[] = Array.from({ length: B }, () => new Set());
-  const itemUsage: number[] = Array(N).fill(0);
 
-  for (let b = 0; b < B; b++) {
-    const candidates = Array.from({ length: N }, (_, i) => i).filter(
-      (i) => itemUsage[i] < frequencies[i]
+  try {
+    options.report({ phase: "model-built" });
+    const assignment = await timedAsync(options.timings, "solveMs", () =>
+      solveDecomposed(N, B, S, frequencies, {
+        solveBlock: solveAssignment,
+        signal: options.signal,
+        random: options.random,
+      })
     );
+    options.signal?.throwIfAborted();
 
-    candidates.sort((a, b) => {
-      const needA = frequencies[a] - itemUsage[a];
-      const needB = frequencies[b] - itemUsage[b];
-      return needB - needA;
-    });
-
-    const selected = candidates.slice(0, S);
-    for (const item of selected) {
-      assignment[item][b] = 1;
-      boardItems[b].add(item);
-      itemUsage[item]++;
+    if (!assignment) {
+      return {
+        success: false,
+        assignment: createBoardBitset(0, 0),
+        maxOverlap: -1,
+        solveTimeMs: 0,
+        instantiationTimeMs: 0,
+        solverUsed: "decomposition",
+      };
     }
-  }
 
-  // Calculate max overlap
-  let maxOverlap = 0;
-  for (let b1 = 0; b1 < B; b1++) {
-    for (let b2 = b1 + 1; b2 < B; b2++) {
-      let overlap = 0;
-      for (let i = 0; i < N; i++) {
-        if (assignment[i][b1] === 1 && assignment[i][b2] === 1) overlap++;
-      }
-      maxOverlap = Math.max(maxOverlap, overlap);
-    }
+    options.report({ phase: "solved" });
+    const optimized = await optimizeAssignment(assignment, S, options);
+
+    return {
+      success: true,
+      assignment,
+      maxOverlap: optimized.maxOverlap,
+      solveTimeMs: performance.now() - startTime,
+      instantiationTimeMs: 0,
+      solverUsed: "decomposition",
+      optimizer: optimized.optimizer,
+    };
+  } catch (error) {
+    if (options.signal?.aborted) throw error;
+    log.error("Decomposition error", error);
+    return {
+      success: false,
+      assignment: createBoardBitset(0, 0),
+      maxOverlap: -1,
+      solveTimeMs: 0,
+      instantiationTimeMs: 0,
+      solverUsed: "decomposition",
+    };
   }
+}
+
+/**
+ * Constructive stage: a known combinatorial design for (N, S, B), if one
+ * applies and is near the overlap lower bound
+ */
+function solveWithDesign(
+  N: number,
+  B: number,
+  S: number,
+  frequencies: number[],
+  timings: GenerationTimings
+): SolverResult | null {
+  const startTime = performance.now();
+  const design = timed(timings, "constructionMs", () =>
+    constructDesign(N, B, S, frequencies)
+  );
+  if (!design) return null;
+
+  log.info(`Using ${design.name} (max overlap ${design.maxOverlap})`);
+  return {
+    success: true,
+    assignment: design.assignment,
+    maxOverlap: design.maxOverlap,
+    solveTimeMs: performance.now() - startTime,
+    instantiationTimeMs: 0,
+    solverUsed: "design",
+    construction: design.name,
+  };
+}
+
+/**
+ * Greedy fallback solver
+ */
+function solveGreedy(
+  N: number,
+  B: number,
+  S: number,
+  frequencies: number[],
+  timings: GenerationTimings
+): SolverResult {
+  const startTime = performance.now();
+  const assignment = timed(timings, "solveMs", () =>
+    greedyAssignment(N, B, S, frequencies)
+  );
 
   return {
     success: true,
     assignment,
-    maxOverlap,
+    maxOverlap: summarizeOverlaps(assignment).maxOverlap,
     solveTimeMs: performance.now() - startTime,
+    instantiationTimeMs: 0,
     solverUsed: "greedy",
   };
 }
 
 /**
- * Convert assignment matrix to GeneratedBoard objects
+ * Convert board bitsets to GeneratedBoard objects (grids are lazy views)
  */
-function assignmentToBoards(
-  assignment: number[][],
-  config: GeneratorConfig
+export function assignmentToBoards(
+  assignment: BoardBitset,
+  config: GeneratorConfig,
+  random: () => number
 ): GeneratedBoard[] {
   const B = config.numBoards;
-  const { rows, cols } = config.boardConfig;
+  const { cols } = config.boardConfig;
   const boards: GeneratedBoard[] = [];
 
   for (let b = 0; b < B; b++) {
-    const boardItemsList: Item[] = [];
-    for (let i = 0; i < config.items.length; i++) {
-      if (assignment[i][b] === 1) {
-        boardItemsList.push(config.items[i]);
-      }
-    }
-
-    // Shuffle items for visual diversity
-    const shuffledItems = shuffleArray(boardItemsList);
-
-    const grid: Item[][] = [];
-    for (let r = 0; r < rows; r++) {
-      const row: Item[] = [];
-      for (let c = 0; c < cols; c++) {
-        const idx = r * cols + c;
-        if (idx < shuffledItems.length) {
-          row.push(shuffledItems[idx]);
-        }
-      }
-      grid.push(row);
-    }
+    const boardItemsList: Item[] = boardItemIndices(assignment, b).map(
+      (i) => config.items[i]
+    );
 
-    boards.push({
-      id: `board-${b + 1}`,
-      boardNumber: b + 1,
-      items: shuffledItems,
-      grid,
-    });
+    // Shuffle items for visual diversity (row-major grid order)
+    boards.push(createBoard(b, shuffleArray(boardItemsList, random), cols));
   }
 
   return boards;
@@ -410,36 +690,20 @@ function assignmentToBoards(
 /**
  * Calculate generation statistics
  */
-function calculateStats(
-  boards: GeneratedBoard[],
+export function calculateStats(
   config: GeneratorConfig,
   frequencies: number[],
-  solverUsed: "highs" | "greedy",
-  maxOverlap: number,
+  solverResult: SolverResult,
   timeMs: number,
   seedUsed: number
 ): GenerationStats {
-  const B = boards.length;
+  const { solverUsed, assignment } = solverResult;
+  const B = assignment.numBoards;
   const S = getBoardSize(config.boardConfig);
 
-  // Calculate pairwise overlaps
-  let minOverlap = S;
-  let totalOverlap = 0;
-  let pairCount = 0;
-
-  for (let i = 0; i < B; i++) {
-    const items1 = new Set(boards[i].items.map((item) => item.id));
-    for (let j = i + 1; j < B; j++) {
-      let overlap = 0;
-      for (const item of boards[j].items) {
-        if (items1.has(item.id)) overlap++;
-      }
-      minOverlap = Math.min(minOverlap, overlap);
-      maxOverlap = Math.max(maxOverlap, overlap);
-      totalOverlap += overlap;
-      pairCount++;
-    }
-  }
+  // Pairwise overlaps via AND + popcount over board bitsets
+  const { minOverlap, maxOverlap, totalOverlap, pairCount } =
+    summarizeOverlaps(assignment);
 
   const freqMap: Record<string, number> = {};
   config.items.forEach((item, i) => {
@@ -449,11 +713,16 @@ function calculateStats(
   return {
     totalSlots: B * S,
     totalItems: config.items.length,
-    minOverlap,
-    maxOverlap,
+    minOverlap: pairCount > 0 ? minOverlap : S,
+    maxOverlap: Math.max(maxOverlap, solverResult.maxOverlap),
     avgOverlap: pairCount > 0 ? totalOverlap / pairCount : 0,
     generationTimeMs: timeMs,
+    solverInitTimeMs: solverResult.instantiationTimeMs,
+    solveTimeMs: solverResult.solveTimeMs,
     solverUsed,
+    construction: solverResult.construction,
+    overlapLowerBound: solverResult.lowerBound,
+    optimizer: solverResult.optimizer,
     frequencies: freqMap,
     seedUsed,
   };
@@ -466,65 +735,122 @@ function generateRandomSeed(): number {
   return Math.floor(Math.random() * 2147483647);
 }
 
+/**
+ * Unsuccessful result with empty stats
+ */
+function failedResult(seedUsed: number, errors: string[]): GenerationResult {
+  return {
+    success: false,
+    boards: [],
+    stats: {
+      totalSlots: 0,
+      totalItems: 0,
+      minOverlap: 0,
+      maxOverlap: 0,
+      avgOverlap: 0,
+      generationTimeMs: 0,
+      solverInitTimeMs: 0,
+      solveTimeMs: 0,
+      solverUsed: "greedy",
+      frequencies: {},
+      seedUsed,
+    },
+    errors,
+  };
+}
+
+/** Per-call hooks for generateBoardsWithHiGHS */
+export interface GenerateOptions {
+  /** Receives solver milestones and optimizer improvements */
+  onProgress?: (progress: GenerationProgress) => void;
+  /**
+   * Cancels the generation. Checked between phases and inside optimizer
+   * loops, which yield to the event loop so the signal can fire while
+   * generation runs on the calling thread; the returned promise rejects
+   * with the signal's reason.
+   */
+  signal?: AbortSignal;
+}
+
 /**
  * Main entry point - Generate boards with HiGHS solver
  */
 export async function generateBoardsWithHiGHS(
-  config: GeneratorConfig
+  config: GeneratorConfig,
+  { onProgress, signal }: GenerateOptions = {}
 ): Promise<GenerationResult> {
+  signal?.throwIfAborted();
   const startTime = performance.now();
+  const report: ProgressReporter = (progress) =>
+    onProgress?.({ ...progress, elapsedMs: performance.now() - startTime });
+
+  const timings = createTimings();
 
   // Use provided seed or generate a random one
   const seedUsed = config.seed ?? generateRandomSeed();
-  setSeed(seedUsed);
+  const random = createSeededRandom(seedUsed);
 
   const N = config.items.length;
   const B = config.numBoards;
   const S = getBoardSize(config.boardConfig);
-  const frequencies = calculateFrequencies(N, B, S, config.distribution);
+  const frequencies = timed(timings, "precheckMs", () =>
+    calculateFrequencies(N, B, S, config.distribution)
+  );
 
-  // Try HiGHS first
-  let solverResult = await solveWithHiGHS(N, B, S, frequencies);
+  // Reject configurations no solver can satisfy without taking a solver slot
+  const infeasible = timed(timings, "precheckMs", () => precheckFeasibility(config));
+  if (infeasible.length > 0) {
+    return failedResult(seedUsed, infeasible.map((v) => v.message));
+  }
+  await yieldToEventLoop();
+  signal?.throwIfAborted();
+
+  const solveOptions: HighsSolveOptions = {
+    mode: config.solverMode ?? "fast",
+    timeBudgetMs: config.timeBudgetMs ?? DEFAULT_QUALITY_TIME_BUDGET_MS,
+    optimizer: config.optimizer ?? { type: "local" },
+    random,
+    report,
+    signal,
+    timings,
+  };
+
+  // Known designs first, then HiGHS (block by block when the single
+  // model would be too large). A design replaces both the solve and the
+  // optimizer, so it is only the fast path: quality mode and an explicitly
+  // chosen optimizer go to HiGHS as requested.
+  const useDesign =
+    solveOptions.mode === "fast" && solveOptions.optimizer.type === "local";
+  let solverResult =
+    (useDesign ? solveWithDesign(N, B, S, frequencies, timings) : null) ??
+    (shouldDecompose(N, B)
+      ? await solveDecomposedWithHiGHS(N, B, S, frequencies, solveOptions)
+      : await solveWithHiGHS(N, B, S, frequencies, solveOptions));
+  signal?.throwIfAborted();
 
   // Fallback to greedy
   if (!solverResult.success) {
-    solverResult = solveGreedy(N, B, S, frequencies);
+    solverResult = solveGreedy(N, B, S, frequencies, timings);
+    report({ phase: "solved", maxOverlap: solverResult.maxOverlap });
   }
 
   if (!solverResult.success) {
-    resetSeed();
-    return {
-      success: false,
-      boards: [],
-      stats: {
-        totalSlots: 0,
-        totalItems: 0,
-        minOverlap: 0,
-        maxOverlap: 0,
-        avgOverlap: 0,
-        generationTimeMs: 0,
-        solverUsed: "greedy",
-        frequencies: {},
-        seedUsed,
-      },
-      errors: ["Failed to generate boards"],
-    };
+    return failedResult(seedUsed, ["Failed to generate boards"]);
   }
+  await yieldToEventLoop();
+  signal?.throwIfAborted();
 
-  const boards = assignmentToBoards(solverResult.assignment, config);
-  const stats = calculateStats(
-    boards,
-    config,
-    frequencies,
-    solverResult.solverUsed,
-    solverResult.maxOverlap,
-    performance.now() - startTime,
-    seedUsed
+  const boards = timed(timings, "boardsMs", () =>
+    assignmentToBoards(solverResult.assignment, config, random)
+  );
+  const stats = timed(timings, "statsMs", () =>
+    calculateStats(config, frequencies, solverResult, 0, seedUsed)
   );
 
-  // Reset to non-deterministic for future calls
-  resetSeed();
-
-  return { success: true, boards, stats };
+  return {
+    success: true,
+    boards,
+    stats: { ...stats, generationTimeMs: performance.now() - startTime, timings },
+  };
 }
 
@@ -0,0 +1,337 @@
+/**
+ * Sparse ILP Model Builder
+ *
+ * Builds the board-assignment model as typed arrays (CSR rows) instead of
+ * per-variable strings. Column j encodes item i on board b as
+ * j = i × B + b, so results are read back by column index without any
+ * name parsing.
+ *
+ * highs-js only accepts models as LP-format text, so the sparse model is
+ * serialized once with compact index-based names (`x0`, `x1`, ...).
+ * HiGHS numbers columns in order of first appearance in the LP text; the
+ * serializer records that order so solutions map back by index alone.
+ */
+
+// ============================================================================
+// TYPES
+// ============================================================================
+
+/** Sparse model in CSR (row-major) form */
+export interface SparseModel {
+  numCols: number;
+  numRows: number;
+  /** Objective coefficient per column (minimized) */
+  objective: Float64Array;
+  /** 1 for binary columns, 0 for continuous columns */
+  integrality: Uint8Array;
+  /** Bounds for continuous columns (binary columns are always [0, 1]) */
+  colLower: Float64Array;
+  colUpper: Float64Array;
+  /** CSR row pointers (length numRows + 1) */
+  rowStart: Uint32Array;
+  /** CSR column indices (length nnz) */
+  colIndex: Uint32Array;
+  /** CSR coefficients (length nnz) */
+  value: Float64Array;
+  /** Row bounds; lower === upper for equality rows */
+  rowLower: Float64Array;
+  rowUpper: Float64Array;
+}
+
+/** LP text plus the HiGHS column index → model column mapping */
+export interface SerializedModel {
+  lp: string;
+  /** columnOrder[highsIndex] = model column */
+  columnOrder: Uint32Array;
+}
+
+/** Minimal shape of a HiGHS solution column */
+export interface SolutionColumn {
+  Index: number;
+  Primal: number;
+}
+
+// ============================================================================
+// ASSIGNMENT MODEL
+// ============================================================================
+
+/**
+ * Column index for item i on board b
+ */
+export function columnIndex(i: number, b: number, B: number): number {
+  return i * B + b;
+}
+
+/**
+ * Build the assignment model:
+ *   ∑_b x[i,b] = freq[i]   for every item i
+ *   ∑_i x[i,b] = S         for every board b
+ * with x binary and a zero objective (feasibility only).
+ */
+export function buildAssignmentModel(
+  N: number,
+  B: number,
+  S: number,
+  freq: number[]
+): SparseModel {
+  const numCols = N * B;
+  const numRows = N + B;
+  const nnz = 2 * numCols;
+
+  const rowStart = new Uint32Array(numRows + 1);
+  const colIndex = new Uint32Array(nnz);
+  const value = new Float64Array(nnz).fill(1);
+  const rowLower = new Float64Array(numRows);
+  const rowUpper = new Float64Array(numRows);
+
+  let k = 0;
+
+  // Frequency rows: item i appears on exactly freq[i] boards
+  for (let i = 0; i < N; i++) {
+    rowStart[i] = k;
+    for (let b = 0; b < B; b++) {
+      colIndex[k++] = i * B + b;
+    }
+    rowLower[i] = freq[i];
+    rowUpper[i] = freq[i];
+  }
+
+  // Board rows: board b holds exactly S items
+  for (let b = 0; b < B; b++) {
+    rowStart[N + b] = k;
+    for (let i = 0; i < N; i++) {
+      colIndex[k++] = i * B + b;
+    }
+    rowLower[N + b] = S;
+    rowUpper[N + b] = S;
+  }
+  rowStart[numRows] = k;
+
+  return {
+    numCols,
+    numRows,
+    objective: new Float64Array(numCols),
+    integrality: new Uint8Array(numCols).fill(1),
+    colLower: new Float64Array(numCols),
+    colUpper: new Float64Array(numCols).fill(1),
+    rowStart,
+    colIndex,
+    value,
+    rowLower,
+    rowUpper,
+  };
+}
+
+// ============================================================================
+// MIN-MAX OVERLAP MODEL
+// ============================================================================
+
+/** Column holding the overlap bound λ in an overlap model */
+export function lambdaColumn(N: number, B: number): number {
+  return N * B;
+}
+
+/**
+ * Extend the assignment model with a minimized overlap bound λ and
+ * linearized overlap cuts for the given board pairs:
+ *   x[i,b1] + x[i,b2] − y[k,i] ≤ 1   for every item i   (y ≥ x₁ ∧ x₂)
+ *   ∑_i y[k,i] − λ ≤ 0
+ * Pairs are added lazily by the caller (only those seen violating λ),
+ * so the model stays far smaller than the full O(N·B²) formulation.
+ *
+ * @param lambdaLower - Proven lower bound on λ (tightens the relaxation)
+ */
+export function buildOverlapModel(
+  N: number,
+  B: number,
+  S: number,
+  freq: number[],
+  pairs: Array<[number, number]>,
+  lambdaLower: number
+): SparseModel {
+  const base = buildAssignmentModel(N, B, S, freq);
+  const P = pairs.length;
+  const lambda = lambdaColumn(N, B);
+
+  const numCols = base.numCols + 1 + P * N;
+  const numRows = base.numRows + P * (N + 1);
+  const baseNnz = base.rowStart[base.numRows];
+  const nnz = baseNnz + P * (3 * N + N + 1);
+
+  const objective = new Float64Array(numCols);
+  objective[lambda] = 1;
+
+  const integrality = new Uint8Array(numCols);
+  integrality.set(base.integrality);
+
+  const colLower = new Float64Array(numCols);
+  const colUpper = new Float64Array(numCols).fill(1);
+  colLower[lambda] = lambdaLower;
+  colUpper[lambda] = S;
+
+  const rowStart = new Uint32Array(numRows + 1);
+  const colIndex = new Uint32Array(nnz);
+  const value = new Float64Array(nnz);
+  const rowLower = new Float64Array(numRows).fill(-Infinity);
+  const rowUpper = new Float64Array(numRows);
+
+  rowStart.set(base.rowStart.subarray(0, base.numRows));
+  colIndex.set(base.colIndex);
+  value.set(base.value);
+  rowLower.set(base.rowLower);
+  rowUpper.set(base.rowUpper);
+
+  let k = baseNnz;
+  let r = base.numRows;
+
+  for (let p = 0; p < P; p++) {
+    const [b1, b2] = pairs[p];
+    const yStart = lambda + 1 + p * N;
+
+    // Linking rows: y[p,i] ≥ x[i,b1] + x[i,b2] − 1
+    for (let i = 0; i < N; i++) {
+      rowStart[r] = k;
+      colIndex[k] = i * B + b1;
+      value[k++] = 1;
+      colIndex[k] = i * B + b2;
+      value[k++] = 1;
+      colIndex[k] = yStart + i;
+      value[k++] = -1;
+      rowUpper[r++] = 1;
+    }
+
+    // Bound row: overlap of (b1, b2) ≤ λ
+    rowStart[r] = k;
+    for (let i = 0; i < N; i++) {
+      colIndex[k] = yStart + i;
+      value[k++] = 1;
+    }
+    colIndex[k] = lambda;
+    value[k++] = -1;
+    rowUpper[r++] = 0;
+  }
+  rowStart[numRows] = k;
+
+  return {
+    numCols,
+    numRows,
+    objective,
+    integrality,
+    colLower,
+    colUpper,
+    rowStart,
+    colIndex,
+    value,
+    rowLower,
+    rowUpper,
+  };
+}
+
+// ============================================================================
+// LP SERIALIZATION
+// ============================================================================
+
+function formatTerm(coef: number, col: number): string {
+  if (coef === 1) return `+ x${col}`;
+  if (coef === -1) return `- x${col}`;
+  return coef < 0 ? `- ${-coef} x${col}` : `+ ${coef} x${col}`;
+}
+
+/** Join terms into an expression, dropping the redundant leading "+" */
+function formatExpression(terms: string[]): string {
+  const expr = terms.join(" ");
+  return expr.startsWith("+ ") ? expr.slice(2) : expr;
+}
+
+/**
+ * Serialize a sparse model to LP format for highs-js
+ */
+export function modelToLp(model: SparseModel): SerializedModel {
+  const { numCols, numRows, objective, integrality } = model;
+  const lines: string[] = [];
+
+  const columnOrder = new Uint32Array(numCols);
+  const seen = new Uint8Array(numCols);
+  let nextIndex = 0;
+  const visit = (col: number) => {
+    if (seen[col] === 0) {
+      seen[col] = 1;
+      columnOrder[nextIndex++] = col;
+    }
+  };
+
+  lines.push("Minimize");
+  const objTerms: string[] = [];
+  for (let j = 0; j < numCols; j++) {
+    if (objective[j] !== 0) {
+      objTerms.push(formatTerm(objective[j], j));
+      visit(j);
+    }
+  }
+  lines.push(objTerms.length > 0 ? ` obj: ${formatExpression(objTerms)}` : " obj: 0");
+
+  lines.push("Subject To");
+  for (let r = 0; r < numRows; r++) {
+    const terms: string[] = [];
+    for (let k = model.rowStart[r]; k < model.rowStart[r + 1]; k++) {
+      terms.push(formatTerm(model.value[k], model.colIndex[k]));
+      visit(model.colIndex[k]);
+    }
+
+    const lower = model.rowLower[r];
+    const upper = model.rowUpper[r];
+    let bound: string;
+    if (lower === upper) bound = `= ${upper}`;
+    else if (lower === -Infinity) bound = `<= ${upper}`;
+    else if (upper === Infinity) bound = `>= ${lower}`;
+    else throw new Error(`Ranged row ${r} is not supported`);
+
+    lines.push(` r${r}: ${formatExpression(terms)} ${bound}`);
+  }
+
+  const bounds: string[] = [];
+  for (let j = 0; j < numCols; j++) {
+    if (integrality[j] === 0) {
+      const lower = model.colLower[j] === -Infinity ? "-inf" : model.colLower[j];
+      const upper = model.colUpper[j] === Infinity ? "+inf" : model.colUpper[j];
+      bounds.push(` ${lower} <= x${j} <= ${upper}`);
+      visit(j);
+    }
+  }
+
+  const binaries: string[] = [];
+  for (let j = 0; j < numCols; j++) {
+    if (integrality[j] === 1) {
+      binaries.push(` x${j}`);
+      visit(j);
+    }
+  }
+
+  // Joined rather than spread: large models exceed argument-count limits
+  if (bounds.length > 0) lines.push(`Bounds\n${bounds.join("\n")}`);
+  if (binaries.length > 0) lines.push(`Binary\n${binaries.join("\n")}`);
+  lines.push("End");
+
+  return { lp: lines.join("\n"), columnOrder };
+}
+
+// ============================================================================
+// SOLUTION READING
+// ============================================================================
+
+/**
+ * Read primal values into a dense array indexed by model column
+ */
+export function readPrimalValues(
+  columns: Record<string, SolutionColumn>,
+  columnOrder: Uint32Array
+): Float64Array {
+  const primal = new Float64Array(columnOrder.length);
+  for (const name in columns) {
+    const col = columns[name];
+    if (col.Index < columnOrder.length) {
+      primal[columnOrder[col.Index]] = col.Primal;
+    }
+  }
+  return primal;
+}
@@ -0,0 +1,567 @@
+/**
+ * Overlap Optimizers
+ *
+ * Post-solve stage that reduces pairwise overlap by swapping items between
+ * boards. Every move swaps an item on one board with an item on another,
+ * so board sizes and item frequencies are always preserved.
+ *
+ * - local: first-improvement descent on the worst pairs (default)
+ * - annealing: simulated annealing on the sum of squared overlaps
+ * - tabu: best-of-sample moves with a short-term tabu memory
+ *
+ * Randomized optimizers draw only from the random function they are given,
+ * so a seeded generator makes them reproducible. All of them yield to the
+ * event loop every few milliseconds, so an abort signal can fire while
+ * they run, and stop early, keeping their best assignment, once it does.
+ */
+
+import type { OptimizerStrategy } from "@/lib/types";
+import { createYielder } from "@/lib/utils/event-loop";
+import {
+  type BoardBitset,
+  addItem,
+  boardItemIndices,
+  cloneBoardBitset,
+  hasItem,
+  removeItem,
+  summarizeOverlaps,
+} from "./board-bitset";
+import {
+  MAX_MATRIX_BOARDS,
+  type OverlapMatrix,
+  createOverlapMatrix,
+  getOverlap,
+  moveItem,
+  pairsWithOverlap,
+} from "./overlap-matrix";
+
+// ============================================================================
+// TYPES
+// ============================================================================
+
+/** Outcome of an optimizer run */
+export interface OptimizerResult {
+  /** Max pairwise overlap after optimization */
+  maxOverlap: number;
+  iterations: number;
+  swapsAttempted: number;
+  swapsAccepted: number;
+}
+
+/**
+ * Progress callback: called once at the start and again whenever the max
+ * overlap drops, so it fires at most S + 1 times per run
+ */
+export type OptimizerProgress = (iteration: number, maxOverlap: number) => void;
+
+/** Optional hooks shared by every optimizer */
+export interface OptimizerControl {
+  onProgress?: OptimizerProgress;
+  /** Stops the run early (the best assignment so far is kept) */
+  signal?: AbortSignal;
+}
+
+/** A swap of `item` (source → target) with `swapItem` (target → source) */
+interface Swap {
+  item: number;
+  swapItem: number;
+  sourceBoard: number;
+  targetBoard: number;
+}
+
+/** Local search stops once no pair of boards shares more items than this */
+const OVERLAP_TARGET = 6;
+
+/** How often (in iterations) budgeted optimizers check the clock, yield
+ * and check the abort signal */
+const CLOCK_CHECK_INTERVAL = 256;
+
+export const DEFAULT_OPTIMIZER_BUDGETS = {
+  annealing: { maxIterations: 50000, timeBudgetMs: 2000 },
+  tabu: { maxIterations: 5000, timeBudgetMs: 2000 },
+} as const;
+
+// ============================================================================
+// SHARED MOVE HELPERS
+// ============================================================================
+
+/**
+ * Overlap change on (sourceBoard, c) for every board c: +1 if swapItem is
+ * on c, −1 if item is; (targetBoard, c) changes by the opposite amount.
+ */
+function swapDelta(assignment: BoardBitset, swap: Swap, c: number): number {
+  return (
+    Number(hasItem(assignment, c, swap.swapItem)) -
+    Number(hasItem(assignment, c, swap.item))
+  );
+}
+
+/**
+ * Apply a swap to both the bitset and the overlap matrix
+ */
+function applySwap(
+  assignment: BoardBitset,
+  matrix: OverlapMatrix,
+  { item, swapItem, sourceBoard, targetBoard }: Swap
+): void {
+  moveItem(matrix, (c) => hasItem(assignment, c, item), sourceBoard, targetBoard);
+  moveItem(matrix, (c) => hasItem(assignment, c, swapItem), targetBoard, sourceBoard);
+
+  removeItem(assignment, sourceBoard, item);
+  addItem(assignment, targetBoard, item);
+  removeItem(assignment, targetBoard, swapItem);
+  addItem(assignment, sourceBoard, swapItem);
+}
+
+/**
+ * Change in ∑ overlap² caused by a swap
+ */
+function squaredCostDelta(
+  assignment: BoardBitset,
+  matrix: OverlapMatrix,
+  swap: Swap
+): number {
+  let delta = 0;
+  for (let c = 0; c < assignment.numBoards; c++) {
+    if (c === swap.sourceBoard || c === swap.targetBoard) continue;
+    const d = swapDelta(assignment, swap, c);
+    if (d === 0) continue;
+    const source = getOverlap(matrix, swap.sourceBoard, c);
+    const target = getOverlap(matrix, swap.targetBoard, c);
+    // (o + d)² − o² = 2od + d², with d = ±1
+    delta += 2 * source * d + 1 - 2 * target * d + 1;
+  }
+  return delta;
+}
+
+/**
+ * ∑ overlap² over all pairs
+ */
+function squaredCost(matrix: OverlapMatrix): number {
+  let cost = 0;
+  for (let value = 1; value < matrix.counts.length; value++) {
+    cost += matrix.counts[value] * value * value;
+  }
+  return cost;
+}
+
+/**
+ * Any two boards of S items drawn from N share at least 2S − N
+ */
+function minPossibleOverlap(N: number, S: number): number {
+  return Math.max(0, 2 * S - N);
+}
+
+function randomInt(random: () => number, n: number): number {
+  return Math.floor(random() * n);
+}
+
+/**
+ * Draw a random swap, biased toward the worst pairs
+ *
+ * Half the time the moved item is one shared by a worst pair; otherwise
+ * it's any item on a random board. Returns null if the draw hits a
+ * dead end (e.g. the target board has no eligible item).
+ */
+function randomSwap(
+  assignment: BoardBitset,
+  matrix: OverlapMatrix,
+  random: () => number
+): Swap | null {
+  const B = assignment.numBoards;
+  let sourceBoard: number;
+  let item: number;
+
+  if (random() < 0.5) {
+    const worst = pairsWithOverlap(matrix, matrix.max, 8);
+    if (worst.length === 0) return null;
+    const [b1, b2] = worst[randomInt(random, worst.length)];
+    const shared = boardItemIndices(assignment, b1).filter((i) =>
+      hasItem(assignment, b2, i)
+    );
+    if (shared.length === 0) return null;
+    item = shared[randomInt(random, shared.length)];
+    sourceBoard = random() < 0.5 ? b1 : b2;
+  } else {
+    sourceBoard = randomInt(random, B);
+    const items = boardItemIndices(assignment, sourceBoard);
+    if (items.length === 0) return null;
+    item = items[randomInt(random, items.length)];
+  }
+
+  const targetBoard = randomInt(random, B);
+  if (targetBoard === sourceBoard || hasItem(assignment, targetBoard, item)) {
+    return null;
+  }
+
+  const candidates = boardItemIndices(assignment, targetBoard).filter(
+    (i) => !hasItem(assignment, sourceBoard, i)
+  );
+  if (candidates.length === 0) return null;
+
+  return {
+    item,
+    swapItem: candidates[randomInt(random, candidates.length)],
+    sourceBoard,
+    targetBoard,
+  };
+}
+
+// ============================================================================
+// LOCAL SEARCH
+// ============================================================================
+
+interface LocalSearchOptions {
+  /** Accepted swaps before giving up */
+  maxIterations: number;
+  /** Candidate swaps evaluated per board pair */
+  maxSwapAttempts: number;
+  /** Worst pairs examined per iteration before concluding no swap helps */
+  maxPairsPerIteration: number;
+}
+
+const DEFAULT_LOCAL_SEARCH_OPTIONS: LocalSearchOptions = {
+  maxIterations: 2000,
+  maxSwapAttempts: 20,
+  maxPairsPerIteration: 32,
+};
+
+/**
+ * Local search optimization to reduce overlap
+ *
+ * Repeatedly takes a worst pair of boards and swaps one of their shared
+ * items with an item from a third board. Overlaps are kept in an
+ * incremental matrix, so evaluating and applying a swap costs O(B).
+ * A swap is accepted only if it lowers the pair's overlap without pushing
+ * any other pair up to the current maximum, so the number of worst pairs
+ * strictly decreases and the search always terminates.
+ */
+export async function localSearchOptimization(
+  assignment: BoardBitset,
+  S: number,
+  options: LocalSearchOptions = DEFAULT_LOCAL_SEARCH_OPTIONS,
+  { onProgress, signal }: OptimizerControl = {}
+): Promise<OptimizerResult> {
+  const B = assignment.numBoards;
+  const pause = createYielder();
+  const matrix = createOverlapMatrix(assignment, S);
+  const stats = { iterations: 0, swapsAttempted: 0, swapsAccepted: 0 };
+  onProgress?.(0, matrix.max);
+
+  // Whether a pair change keeps the swap acceptable at the current max
+  const acceptable = (oldValue: number, newValue: number, current: number) =>
+    newValue < current || newValue <= oldValue;
+
+  const isSwapAcceptable = (swap: Swap, current: number): boolean => {
+    for (let c = 0; c < B; c++) {
+      if (c === swap.sourceBoard || c === swap.targetBoard) continue;
+      const delta = swapDelta(assignment, swap, c);
+      if (delta === 0) continue;
+      const sourceOverlap = getOverlap(matrix, swap.sourceBoard, c);
+      const targetOverlap = getOverlap(matrix, swap.targetBoard, c);
+      if (!acceptable(sourceOverlap, sourceOverlap + delta, current)) return false;
+      if (!acceptable(targetOverlap, targetOverlap - delta, current)) return false;
+    }
+    return true;
+  };
+
+  let rotation = 0;
+
+  const improvePair = (b1: number, b2: number, current: number): boolean => {
+    let attempts = 0;
+    rotation++;
+
+    const sharedItems = boardItemIndices(assignment, b1).filter((i) =>
+      hasItem(assignment, b2, i)
+    );
+
+    for (const item of sharedItems) {
+      for (const [sourceBoard, otherBoard] of [
+        [b1, b2],
+        [b2, b1],
+      ]) {
+        for (let targetBoard = 0; targetBoard < B; targetBoard++) {
+          if (attempts >= options.maxSwapAttempts) return false;
+          if (targetBoard === b1 || targetBoard === b2) continue;
+          if (hasItem(assignment, targetBoard, item)) continue;
+
+          // Rotate the starting candidate so repeated visits to a board
+          // don't keep proposing its lowest-indexed items
+          const candidates = boardItemIndices(assignment, targetBoard);
+          let swapCount = 0;
+          for (let k = 0; k < candidates.length; k++) {
+            if (swapCount >= 3) break;
+            const swapItem = candidates[(k + rotation) % candidates.length];
+            if (hasItem(assignment, sourceBoard, swapItem)) continue;
+            // Moving onto the other board of the pair keeps the overlap
+            if (hasItem(assignment, otherBoard, swapItem)) continue;
+
+            attempts++;
+            swapCount++;
+            stats.swapsAttempted++;
+
+            const swap = { item, swapItem, sourceBoard, targetBoard };
+            if (isSwapAcceptable(swap, current)) {
+              applySwap(assignment, matrix, swap);
+              stats.swapsAccepted++;
+              return true;
+            }
+          }
+        }
+      }
+    }
+
+    return false;
+  };
+
+  for (let iter = 0; iter < options.maxIterations; iter++) {
+    if (matrix.max <= OVERLAP_TARGET || signal?.aborted) break;
+    await pause();
+    if (signal?.aborted) break;
+    const current = matrix.max;
+    stats.iterations++;
+
+    const worstPairs = pairsWithOverlap(
+      matrix,
+      current,
+      options.maxPairsPerIteration
+    );
+
+    let improved = false;
+    for (const [b1, b2] of worstPairs) {
+      if (improvePair(b1, b2, current)) {
+        improved = true;
+        break;
+      }
+    }
+
+    if (!improved) break;
+    if (matrix.max < current) onProgress?.(stats.iterations, matrix.max);
+  }
+
+  return { maxOverlap: matrix.max, ...stats };
+}
+
+// ============================================================================
+// SIMULATED ANNEALING
+// ============================================================================
+
+/**
+ * Simulated annealing over item swaps
+ *
+ * Minimizes ∑ overlap² (the total overlap is fixed by the frequencies, so
+ * this spreads it evenly and pulls the maximum down) with geometric
+ * cooling. The best assignment seen, ranked by max overlap then cost, is
+ * restored at the end.
+ */
+export async function annealingOptimization(
+  assignment: BoardBitset,
+  S: number,
+  random: () => number,
+  maxIterations: number,
+  timeBudgetMs: number,
+  { onProgress, signal }: OptimizerControl = {}
+): Promise<OptimizerResult> {
+  const deadline = performance.now() + timeBudgetMs;
+  const pause = createYielder();
+  const matrix = createOverlapMatrix(assignment, S);
+  const stats = { iterations: 0, swapsAttempted: 0, swapsAccepted: 0 };
+  const lowerBound = minPossibleOverlap(assignment.numItems, S);
+
+  const startTemperature = 2;
+  const endTemperature = 0.02;
+  const cooling = Math.pow(
+    endTemperature / startTemperature,
+    1 / Math.max(1, maxIterations)
+  );
+
+  let temperature = startTemperature;
+  let cost = squaredCost(matrix);
+  let best = cloneBoardBitset(assignment);
+  let bestMax = matrix.max;
+  let bestCost = cost;
+  onProgress?.(0, bestMax);
+
+  for (let iter = 0; iter < maxIterations; iter++) {
+    if (iter % CLOCK_CHECK_INTERVAL === 0) {
+      await pause();
+      if (performance.now() > deadline || signal?.aborted) break;
+    }
+    if (bestMax <= lowerBound) break;
+    stats.iterations++;
+    temperature *= cooling;
+
+    const swap = randomSwap(assignment, matrix, random);
+    if (!swap) continue;
+    stats.swapsAttempted++;
+
+    const delta = squaredCostDelta(assignment, matrix, swap);
+    if (delta > 0 && random() >= Math.exp(-delta / temperature)) continue;
+
+    applySwap(assignment, matrix, swap);
+    stats.swapsAccepted++;
+    cost += delta;
+
+    if (matrix.max < bestMax || (matrix.max === bestMax && cost < bestCost)) {
+      if (matrix.max < bestMax) onProgress?.(stats.iterations, matrix.max);
+      best = cloneBoardBitset(assignment);
+      bestMax = matrix.max;
+      bestCost = cost;
+    }
+  }
+
+  assignment.bits.set(best.bits);
+  return { maxOverlap: bestMax, ...stats };
+}
+
+// ============================================================================
+// TABU SEARCH
+// ============================================================================
+
+/** Candidate moves sampled per tabu iteration */
+const TABU_SAMPLE_SIZE = 24;
+
+/**
+ * Tabu search over item swaps
+ *
+ * Each iteration samples candidate swaps and applies the best one by
+ * ∑ overlap², even if it is worse than the current state, as long as it
+ * doesn't move an item back onto a board it recently left (unless that
+ * yields a new best). The best assignment seen is restored at the end.
+ */
+export async function tabuOptimization(
+  assignment: BoardBitset,
+  S: number,
+  random: () => number,
+  maxIterations: number,
+  timeBudgetMs: number,
+  { onProgress, signal }: OptimizerControl = {}
+): Promise<OptimizerResult> {
+  const deadline = performance.now() + timeBudgetMs;
+  const pause = createYielder();
+  const { numItems: N, numBoards: B } = assignment;
+  const matrix = createOverlapMatrix(assignment, S);
+  const stats = { iterations: 0, swapsAttempted: 0, swapsAccepted: 0 };
+
+  // tabuUntil[i × B + b]: iteration until which item i may not rejoin board b
+  const tabuUntil = new Uint32Array(N * B);
+  const tenure = Math.max(7, Math.round(Math.sqrt(B)));
+  const lowerBound = minPossibleOverlap(N, S);
+  const isTabu = (i: number, b: number, iter: number) => tabuUntil[i * B + b] > iter;
+
+  let cost = squaredCost(matrix);
+  let best = cloneBoardBitset(assignment);
+  let bestMax = matrix.max;
+  let bestCost = cost;
+  onProgress?.(0, bestMax);
+
+  for (let iter = 0; iter < maxIterations; iter++) {
+    if (iter % CLOCK_CHECK_INTERVAL === 0) {
+      await pause();
+      if (performance.now() > deadline || signal?.aborted) break;
+    }
+    if (bestMax <= lowerBound) break;
+    stats.iterations++;
+
+    let chosen: Swap | null = null;
+    let chosenDelta = Infinity;
+
+    for (let k = 0; k < TABU_SAMPLE_SIZE; k++) {
+      const swap = randomSwap(assignment, matrix, random);
+      if (!swap) continue;
+      stats.swapsAttempted++;
+
+      const delta = squaredCostDelta(assignment, matrix, swap);
+      const tabu =
+        isTabu(swap.item, swap.targetBoard, iter) ||
+        isTabu(swap.swapItem, swap.sourceBoard, iter);
+      // Aspiration: a tabu move is allowed if it beats the best cost
+      if (tabu && cost + delta >= bestCost) continue;
+
+      if (delta < chosenDelta) {
+        chosen = swap;
+        chosenDelta = delta;
+      }
+    }
+
+    if (!chosen) continue;
+
+    applySwap(assignment, matrix, chosen);
+    stats.swapsAccepted++;
+    cost += chosenDelta;
+    tabuUntil[chosen.item * B + chosen.sourceBoard] = iter + tenure;
+    tabuUntil[chosen.swapItem * B + chosen.targetBoard] = iter + tenure;
+
+    if (matrix.max < bestMax || (matrix.max === bestMax && cost < bestCost)) {
+      if (matrix.max < bestMax) onProgress?.(stats.iterations, matrix.max);
+      best = cloneBoardBitset(assignment);
+      bestMax = matrix.max;
+      bestCost = cost;
+    }
+  }
+
+  assignment.bits.set(best.bits);
+  return { maxOverlap: bestMax, ...stats };
+}
+
+// ============================================================================
+// DISPATCH
+// ============================================================================
+
+/**
+ * Run the optimizer selected by a strategy
+ *
+ * Above MAX_MATRIX_BOARDS the overlap matrix would not fit, so the
+ * assignment is returned unchanged with zero iterations.
+ */
+export async function runOptimizer(
+  strategy: OptimizerStrategy,
+  assignment: BoardBitset,
+  S: number,
+  random: () => number,
+  control: OptimizerControl = {}
+): Promise<OptimizerResult> {
+  if (assignment.numBoards > MAX_MATRIX_BOARDS) {
+    return {
+      maxOverlap: summarizeOverlaps(assignment).maxOverlap,
+      iterations: 0,
+      swapsAttempted: 0,
+      swapsAccepted: 0,
+    };
+  }
+
+  switch (strategy.type) {
+    case "annealing": {
+      const budget = DEFAULT_OPTIMIZER_BUDGETS.annealing;
+      return annealingOptimization(
+        assignment,
+        S,
+        random,
+        strategy.maxIterations ?? budget.maxIterations,
+        strategy.timeBudgetMs ?? budget.timeBudgetMs,
+        control
+      );
+    }
+
+    case "tabu": {
+      const budget = DEFAULT_OPTIMIZER_BUDGETS.tabu;
+      return tabuOptimization(
+        assignment,
+        S,
+        random,
+        strategy.maxIterations ?? budget.maxIterations,
+        strategy.timeBudgetMs ?? budget.timeBudgetMs,
+        control
+      );
+    }
+
+    case "local":
+    default:
+      return localSearchOptimization(
+        assignment,
+        S,
+        DEFAULT_LOCAL_SEARCH_OPTIONS,
+        control
+      );
+  }
+}
@@ -0,0 +1,283 @@
+/**
+ * Generation Result Cache
+ *
+ * Content-addressed cache of generation results, keyed by a SHA-256 hash
+ * of the canonicalized GeneratorConfig. Regenerating with the same items,
+ * board size, distribution, solver settings and seed returns the stored
+ * result instead of solving again.
+ *
+ * Two tiers:
+ * - memory: LRU over the most recent results (Map insertion order)
+ * - disk (optional): one JSON file per key, oldest files removed once
+ *   the directory exceeds its byte budget
+ *
+ * Only seeded configs are cached: an unseeded request asks for a fresh
+ * random seed, so returning a stored result would change its meaning.
+ * Wall-clock-limited solves (quality mode, annealing, tabu) aren't cached
+ * either: how far they get depends on machine load, so the same seed can
+ * give different boards and a weak first result would stick for the TTL.
+ *
+ * Server-only: import from route handlers, never from client code.
+ */
+
+import { createHash } from "node:crypto";
+import { mkdir, readFile, readdir, rm, stat, utimes, writeFile } from "node:fs/promises";
+import { join } from "node:path";
+import type { GenerationResult, GeneratorConfig } from "@/lib/types";
+import { DEFAULT_QUALITY_TIME_BUDGET_MS } from "@/lib/types";
+import { restoreBoards } from "@/lib/utils/board-layout";
+import { createDevLogger } from "@/lib/utils/dev-logger";
+
+const log = createDevLogger("ResultCache");
+
+// ============================================================================
+// TYPES
+// ============================================================================
+
+/** Cache tuning options */
+export interface ResultCacheOptions {
+  /** Results kept in memory (0 disables the memory tier) */
+  maxEntries: number;
+  /** Directory for the disk tier (null disables it) */
+  diskDir: string | null;
+  /** Byte budget for the disk tier */
+  maxDiskBytes: number;
+}
+
+/** Snapshot of cache activity (for diagnostics) */
+export interface ResultCacheStats {
+  entries: number;
+  hits: number;
+  diskHits: number;
+  misses: number;
+}
+
+// ============================================================================
+// CACHE STATE
+// ============================================================================
+
+function envNumber(name: string, fallback: number): number {
+  const value = Number(process.env[name]);
+  return Number.isFinite(value) && value >= 0 ? value : fallback;
+}
+
+export const DEFAULT_RESULT_CACHE_OPTIONS: ResultCacheOptions = {
+  maxEntries: envNumber("RESULT_CACHE_SIZE", 64),
+  diskDir: process.env.RESULT_CACHE_DIR || null,
+  maxDiskBytes: envNumber("RESULT_CACHE_MAX_BYTES", 256 * 1024 * 1024),
+};
+
+let options: ResultCacheOptions = { ...DEFAULT_RESULT_CACHE_OPTIONS };
+const memory = new Map<string, GenerationResult>();
+let hits = 0;
+let diskHits = 0;
+let misses = 0;
+
+/**
+ * Override cache options (tests, tuning)
+ */
+export function configureResultCache(overrides: Partial<ResultCacheOptions>): void {
+  options = { ...options, ...overrides };
+  while (memory.size > options.maxEntries) {
+    memory.delete(memory.keys().next().value!);
+  }
+}
+
+export function getResultCacheStats(): ResultCacheStats {
+  return { entries: memory.size, hits, diskHits, misses };
+}
+
+/**
+ * Drop the memory tier, reset counters and restore default options.
+ * The disk tier is left in place.
+ */
+export function resetResultCache(): void {
+  memory.clear();
+  hits = 0;
+  diskHits = 0;
+  misses = 0;
+  options = { ...DEFAULT_RESULT_CACHE_OPTIONS };
+}
+
+// ============================================================================
+// KEYS
+// ============================================================================
+
+/** JSON with object keys sorted, so key order never changes the hash */
+function stableStringify(value: unknown): string {
+  if (value === null || typeof value !== "object") {
+    return JSON.stringify(value) ?? "null";
+  }
+  if (Array.isArray(value)) {
+    return `[${value.map(stableStringify).join(",")}]`;
+  }
+  const entries = Object.entries(value as Record<string, unknown>)
+    .filter(([, v]) => v !== undefined)
+    .sort(([a], [b]) => (a < b ? -1 : a > b ? 1 : 0))
+    .map(([k, v]) => `${JSON.stringify(k)}:${stableStringify(v)}`);
+  return `{${entries.join(",")}}`;
+}
+
+/**
+ * Canonical hash of everything that affects the generated boards.
+ * Defaults are filled in so an omitted field and its default share a key.
+ */
+export function configCacheKey(config: GeneratorConfig): string {
+  const solverMode = config.solverMode ?? "fast";
+  const canonical = {
+    items: config.items,
+    numBoards: config.numBoards,
+    boardConfig: config.boardConfig,
+    distribution: config.distribution,
+    seed: config.seed,
+    solverMode,
+    timeBudgetMs:
+      solverMode === "quality"
+        ? (config.timeBudgetMs ?? DEFAULT_QUALITY_TIME_BUDGET_MS)
+        : undefined,
+    optimizer: config.optimizer ?? { type: "local" },
+  };
+  return createHash("sha256").update(stableStringify(canonical)).digest("hex");
+}
+
+/**
+ * Whether a config's result depends only on its inputs
+ *
+ * False for solves stopped by a wall-clock budget: "quality" mode's
+ * lazy-cut loop and the annealing and tabu optimizers, whose iteration
+ * counts vary with machine load.
+ */
+export function isReproducible(config: GeneratorConfig): boolean {
+  if (config.seed === undefined) return false;
+  if (config.solverMode === "quality") return false;
+  const optimizer = config.optimizer?.type ?? "local";
+  return optimizer === "local";
+}
+
+// ============================================================================
+// TIERS
+// ============================================================================
+
+function remember(key: string, result: GenerationResult): void {
+  if (options.maxEntries === 0) return;
+  memory.delete(key);
+  memory.set(key, result);
+  if (memory.size > options.maxEntries) {
+    memory.delete(memory.keys().next().value!);
+  }
+}
+
+async function readDisk(key: string): Promise<GenerationResult | null> {
+  if (!options.diskDir) return null;
+  const path = join(options.diskDir, `${key}.json`);
+  try {
+    const result = JSON.parse(await readFile(path, "utf8")) as GenerationResult;
+    // Touch so the size sweep treats it as recently used
+    const now = new Date();
+    await utimes(path, now, now);
+    return result;
+  } catch {
+    return null;
+  }
+}
+
+async function writeDisk(key: string, result: GenerationResult): Promise<void> {
+  const dir = options.diskDir;
+  if (!dir) return;
+  try {
+    await mkdir(dir, { recursive: true });
+    await writeFile(join(dir, `${key}.json`), JSON.stringify(result));
+    await sweepDisk(dir);
+  } catch (error) {
+    log.warn("Disk cache write failed", error);
+  }
+}
+
+/** Remove least recently used files until the directory fits its budget */
+async function sweepDisk(dir: string): Promise<void> {
+  const files = await Promise.all(
+    (await readdir(dir))
+      .filter((name) => name.endsWith(".json"))
+      .map(async (name) => {
+        const info = await stat(join(dir, name));
+        return { name, size: info.size, mtimeMs: info.mtimeMs };
+      })
+  );
+
+  let total = files.reduce((sum, f) => sum + f.size, 0);
+  files.sort((a, b) => a.mtimeMs - b.mtimeMs);
+  for (const file of files) {
+    if (total <= options.maxDiskBytes) break;
+    await rm(join(dir, file.name), { force: true });
+    total -= file.size;
+  }
+}
+
+/**
+ * Look up a result (memory first, then disk)
+ */
+export async function getCachedResult(key: string): Promise<GenerationResult | null> {
+  const cached = memory.get(key);
+  if (cached) {
+    hits++;
+    remember(key, cached);
+    return cached;
+  }
+
+  const stored = await readDisk(key);
+  if (stored) {
+    hits++;
+    diskHits++;
+    remember(key, stored);
+    return stored;
+  }
+
+  misses++;
+  return null;
+}
+
+/**
+ * Store a successful result in both tiers
+ */
+export async function setCachedResult(
+  key: string,
+  result: GenerationResult
+): Promise<void> {
+  remember(key, result);
+  await writeDisk(key, result);
+}
+
+// ============================================================================
+// ENTRY POINT
+// ============================================================================
+
+/**
+ * Serve a config from the cache, or generate and store it.
+ *
+ * Unseeded, time-limited (see isReproducible) and `bypassCache` configs
+ * always generate. Hits are reported through `stats.cacheHit`.
+ */
+export async function withResultCache(
+  config: GeneratorConfig,
+  generate: () => Promise<GenerationResult>
+): Promise<GenerationResult> {
+  if (!isReproducible(config) || config.bypassCache) {
+    return markCacheHit(await generate(), false);
+  }
+
+  const key = configCacheKey(config);
+  const cached = await getCachedResult(key);
+  if (cached) {
+    // Disk entries are JSON, which carries no grid views
+    const boards = restoreBoards(cached.boards, config.boardConfig.cols);
+    return markCacheHit({ ...cached, boards }, true);
+  }
+
+  const result = markCacheHit(await generate(), false);
+  if (result.success) await setCachedResult(key, result);
+  return result;
+}
+
+function markCacheHit(result: GenerationResult, cacheHit: boolean): GenerationResult {
+  return { ...result, stats: { ...result.stats, cacheHit } };
+}
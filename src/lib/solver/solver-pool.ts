@@ -0,0 +1,216 @@
+/**
+ * HiGHS Solver Pool
+ *
+ * Keeps warm HiGHS WASM instances alive between generate requests so that
+ * only the first request (or the first after an idle period) pays the cost
+ * of importing and instantiating the WASM module.
+ *
+ * Each `solve()` call in highs-js creates and destroys its own native
+ * `Highs` object, so an instance holds no model state between solves.
+ * The WASM heap, however, only ever grows, and a solve that throws can
+ * leave the module in an unusable state. Instances are therefore recycled
+ * after a fixed number of uses and discarded after any error.
+ */
+
+import { createDevLogger } from "@/lib/utils/dev-logger";
+
+const log = createDevLogger("SolverPool");
+
+// ============================================================================
+// TYPES
+// ============================================================================
+
+type HighsLoader = (typeof import("highs"))["default"];
+
+/** A loaded HiGHS WASM instance */
+export type HighsInstance = Awaited<ReturnType<HighsLoader>>;
+
+/** Pool tuning options */
+export interface SolverPoolOptions {
+  /** Maximum number of idle instances kept warm */
+  maxSize: number;
+  /** Idle instances older than this are evicted (ms) */
+  idleTimeoutMs: number;
+  /** Instances are recycled after this many solves */
+  maxUsesPerInstance: number;
+}
+
+/** A solver checked out of the pool */
+export interface SolverLease {
+  solver: HighsInstance;
+  /** Time spent obtaining the instance (≈0 for a warm instance) */
+  instantiationMs: number;
+  /** Whether a new instance had to be created for this lease */
+  cold: boolean;
+  /**
+   * Return the instance to the pool.
+   * Pass `discard: true` when the solve failed so the instance is dropped.
+   */
+  release: (options?: { discard?: boolean }) => void;
+}
+
+/** Snapshot of pool state (for diagnostics) */
+export interface SolverPoolStats {
+  idle: number;
+  inUse: number;
+  created: number;
+  evicted: number;
+}
+
+interface PooledSolver {
+  solver: HighsInstance;
+  uses: number;
+  lastUsedAt: number;
+}
+
+// ============================================================================
+// POOL STATE
+// ============================================================================
+
+function envNumber(name: string, fallback: number): number {
+  const value = Number(process.env[name]);
+  return Number.isFinite(value) && value >= 0 ? value : fallback;
+}
+
+export const DEFAULT_SOLVER_POOL_OPTIONS: SolverPoolOptions = {
+  maxSize: envNumber("HIGHS_POOL_SIZE", 2),
+  idleTimeoutMs: envNumber("HIGHS_POOL_IDLE_MS", 5 * 60 * 1000),
+  maxUsesPerInstance: envNumber("HIGHS_POOL_MAX_USES", 100),
+};
+
+let options: SolverPoolOptions = { ...DEFAULT_SOLVER_POOL_OPTIONS };
+let loaderPromise: Promise<HighsLoader> | null = null;
+let evictionTimer: ReturnType<typeof setTimeout> | null = null;
+
+const idle: PooledSolver[] = [];
+let inUse = 0;
+let created = 0;
+let evicted = 0;
+
+/**
+ * Override pool options (unspecified fields keep their current value)
+ */
+export function configureSolverPool(overrides: Partial<SolverPoolOptions>): void {
+  options = { ...options, ...overrides };
+  evictIdle();
+}
+
+/**
+ * Current pool statistics
+ */
+export function getSolverPoolStats(): SolverPoolStats {
+  return { idle: idle.length, inUse, created, evicted };
+}
+
+/**
+ * Drop every idle instance and reset options (useful for tests)
+ */
+export function resetSolverPool(): void {
+  evicted += idle.length;
+  idle.length = 0;
+  options = { ...DEFAULT_SOLVER_POOL_OPTIONS };
+  if (evictionTimer) {
+    clearTimeout(evictionTimer);
+    evictionTimer = null;
+  }
+}
+
+// ============================================================================
+// ACQUIRE / RELEASE
+// ============================================================================
+
+/**
+ * Load the highs module once per process
+ */
+function getLoader(): Promise<HighsLoader> {
+  if (!loaderPromise) {
+    loaderPromise = import("highs")
+      .then((mod) => mod.default)
+      .catch((error) => {
+        // Allow a retry on the next request
+        loaderPromise = null;
+        throw error;
+      });
+  }
+  return loaderPromise;
+}
+
+/**
+ * Check out a HiGHS instance, reusing a warm one when available
+ */
+export async function acquireSolver(): Promise<SolverLease> {
+  const startTime = performance.now();
+
+  // Most recently used instance first (warmest heap)
+  let entry = idle.pop();
+  const cold = entry === undefined;
+
+  if (!entry) {
+    const loader = await getLoader();
+    entry = { solver: await loader(), uses: 0, lastUsedAt: 0 };
+    created++;
+    log.debug(`Instantiated HiGHS instance #${created}`);
+  }
+
+  inUse++;
+  const pooled = entry;
+  let released = false;
+
+  return {
+    solver: pooled.solver,
+    instantiationMs: performance.now() - startTime,
+    cold,
+    release: ({ discard = false } = {}) => {
+      if (released) return;
+      released = true;
+      inUse--;
+      pooled.uses++;
+      pooled.lastUsedAt = Date.now();
+
+      if (
+        discard ||
+        pooled.uses >= options.maxUsesPerInstance ||
+        idle.length >= options.maxSize
+      ) {
+        evicted++;
+        return;
+      }
+
+      idle.push(pooled);
+      scheduleEviction();
+    },
+  };
+}
+
+// ============================================================================
+// IDLE EVICTION
+// ============================================================================
+
+function evictIdle(): void {
+  const cutoff = Date.now() - options.idleTimeoutMs;
+
+  // Oldest instances sit at the front of the stack
+  while (idle.length > 0 && idle[0].lastUsedAt <= cutoff) {
+    idle.shift();
+    evicted++;
+  }
+  while (idle.length > options.maxSize) {
+    idle.shift();
+    evicted++;
+  }
+}
+
+function scheduleEviction(): void {
+  if (evictionTimer) return;
+
+  evictionTimer = setTimeout(() => {
+    evictionTimer = null;
+    evictIdle();
+    if (idle.length > 0) scheduleEviction();
+  }, options.idleTimeoutMs);
+
+  // Never keep the process alive just to evict solvers
+  if (typeof evictionTimer === "object" && "unref" in evictionTimer) {
+    evictionTimer.unref();
+  }
+}
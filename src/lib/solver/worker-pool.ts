@@ -0,0 +1,545 @@
+/**
+ * Generation Worker Pool
+ *
+ * Runs board generation on worker_threads so a long HiGHS solve never
+ * blocks the request thread. Jobs wait in a bounded FIFO queue; each job
+ * has a timeout and can be cancelled through an AbortSignal.
+ *
+ * A solve is synchronous inside its worker, so timing out or cancelling
+ * a running job terminates that worker and a fresh one is spawned on
+ * demand. Each worker keeps its own warm HiGHS solver pool.
+ *
+ * Threads are opt-in (GENERATION_WORKERS > 0, typically cores − 1): the
+ * worker entry is a .ts module that must be emitted by the build. If a
+ * worker can't be created or dies before signalling that it loaded, the
+ * pool switches to in-process generation for that job and every later one.
+ *
+ * In-process (inline) generation goes through the same queue, one job at
+ * a time, with the same queue bound, timeout and counters. The solver
+ * yields to the event loop between phases and optimizer chunks, so a
+ * timeout or cancellation aborts an inline job through its signal.
+ *
+ * Server-only: import from route handlers, never from client code.
+ */
+
+import { Worker } from "node:worker_threads";
+import type {
+  GenerationProgress,
+  GenerationResult,
+  GeneratorConfig,
+} from "@/lib/types";
+import type { GenerateOptions } from "./highs-solver";
+import { restoreBoards } from "@/lib/utils/board-layout";
+import { createDevLogger } from "@/lib/utils/dev-logger";
+
+const log = createDevLogger("WorkerPool");
+
+// ============================================================================
+// TYPES
+// ============================================================================
+
+/** Message sent to a generation worker */
+export interface WorkerRequest {
+  id: number;
+  config: GeneratorConfig;
+}
+
+/** Message sent back by a generation worker (any number of progress
+ * messages, then exactly one result or error) */
+export type WorkerResponse =
+  | { id: number; progress: GenerationProgress }
+  | { id: number; result: GenerationResult }
+  | { id: number; error: string };
+
+/** Sent once by a generation worker after its entry module has loaded */
+export interface WorkerReady {
+  ready: true;
+}
+
+/** Minimal worker surface used by the pool (satisfied by worker_threads) */
+export interface GenerationWorker {
+  postMessage(message: WorkerRequest): void;
+  on(
+    event: "message",
+    listener: (message: WorkerResponse | WorkerReady) => void
+  ): unknown;
+  on(event: "error", listener: (error: Error) => void): unknown;
+  on(event: "exit", listener: (code: number) => void): unknown;
+  terminate(): Promise<number>;
+}
+
+/** Reason a job did not produce a result */
+export type GenerationJobErrorCode =
+  | "QUEUE_FULL"
+  | "TIMEOUT"
+  | "CANCELLED"
+  | "WORKER_FAILED";
+
+export class GenerationJobError extends Error {
+  readonly code: GenerationJobErrorCode;
+
+  constructor(code: GenerationJobErrorCode, message: string) {
+    super(message);
+    this.name = "GenerationJobError";
+    this.code = code;
+  }
+}
+
+/** Pool tuning options */
+export interface WorkerPoolOptions {
+  /** Number of worker threads (0 = run inline on the calling thread; the default) */
+  size: number;
+  /** Maximum jobs waiting for a worker */
+  maxQueue: number;
+  /** Default per-job timeout (ms) */
+  jobTimeoutMs: number;
+  /** Creates a worker (injectable for tests) */
+  createWorker: () => GenerationWorker;
+  /** Generates on the calling thread (injectable for tests) */
+  generateInline: (
+    config: GeneratorConfig,
+    options: GenerateOptions
+  ) => Promise<GenerationResult>;
+}
+
+/** Per-job options */
+export interface GenerationJobOptions {
+  /** Overrides the pool's default timeout (ms) */
+  timeoutMs?: number;
+  /** Cancels the job when aborted (queued or running) */
+  signal?: AbortSignal;
+  /** Receives progress events while the job runs */
+  onProgress?: (progress: GenerationProgress) => void;
+}
+
+/** Snapshot of pool activity */
+export interface WorkerPoolStats {
+  /** Configured worker count (0 = inline) */
+  size: number;
+  /** Jobs that can run at once (1 when generating inline) */
+  capacity: number;
+  /** Whether threads failed to start and jobs now run inline */
+  fellBackInline: boolean;
+  workers: number;
+  busy: number;
+  queueDepth: number;
+  completed: number;
+  failed: number;
+  timedOut: number;
+  cancelled: number;
+  rejected: number;
+}
+
+interface Job {
+  id: number;
+  config: GeneratorConfig;
+  timeoutMs: number;
+  signal?: AbortSignal;
+  onProgress?: (progress: GenerationProgress) => void;
+  resolve: (result: GenerationResult) => void;
+  reject: (error: Error) => void;
+  onAbort?: () => void;
+  timer?: ReturnType<typeof setTimeout>;
+  /** Aborts the solve of a job running inline */
+  controller?: AbortController;
+}
+
+interface PoolWorker {
+  worker: GenerationWorker;
+  job: Job | null;
+  /** Set once the worker reports that its entry module loaded */
+  ready: boolean;
+}
+
+// ============================================================================
+// DEFAULTS
+// ============================================================================
+
+function envNumber(name: string, fallback: number): number {
+  const value = Number(process.env[name]);
+  return process.env[name] !== undefined && Number.isFinite(value) && value >= 0
+    ? value
+    : fallback;
+}
+
+function createThreadWorker(): GenerationWorker {
+  return new Worker(new URL("./generation-worker.ts", import.meta.url));
+}
+
+async function generateInProcess(
+  config: GeneratorConfig,
+  options: GenerateOptions
+): Promise<GenerationResult> {
+  const { generateBoardsWithHiGHS } = await import("./highs-solver");
+  return generateBoardsWithHiGHS(config, options);
+}
+
+export function defaultWorkerPoolOptions(): WorkerPoolOptions {
+  return {
+    size: envNumber("GENERATION_WORKERS", 0),
+    maxQueue: envNumber("GENERATION_QUEUE_LIMIT", 32),
+    jobTimeoutMs: envNumber("GENERATION_TIMEOUT_MS", 30000),
+    createWorker: createThreadWorker,
+    generateInline: generateInProcess,
+  };
+}
+
+// ============================================================================
+// POOL
+// ============================================================================
+
+/**
+ * Fixed-size worker pool with a bounded queue.
+ *
+ * @example
+ * ```ts
+ * const pool = new GenerationWorkerPool({ size: 2 });
+ * const result = await pool.run(config, { signal: request.signal });
+ * ```
+ */
+export class GenerationWorkerPool {
+  private options: WorkerPoolOptions;
+  private workers: PoolWorker[] = [];
+  private queue: Job[] = [];
+  /** Job generating on the calling thread, if any */
+  private inlineJob: Job | null = null;
+  private nextJobId = 1;
+  /** Set when a worker fails to start; later jobs run inline */
+  private fellBackInline = false;
+  private counters = {
+    completed: 0,
+    failed: 0,
+    timedOut: 0,
+    cancelled: 0,
+    rejected: 0,
+  };
+
+  constructor(options: Partial<WorkerPoolOptions> = {}) {
+    this.options = { ...defaultWorkerPoolOptions(), ...options };
+  }
+
+  /**
+   * Generate boards on a worker thread (or inline when threads are off)
+   *
+   * @throws GenerationJobError when the queue is full, the job times out,
+   *   is cancelled, or its worker crashes
+   */
+  run(
+    config: GeneratorConfig,
+    { timeoutMs, signal, onProgress }: GenerationJobOptions = {}
+  ): Promise<GenerationResult> {
+    if (signal?.aborted) {
+      this.counters.cancelled++;
+      return Promise.reject(
+        new GenerationJobError("CANCELLED", "Generation cancelled")
+      );
+    }
+
+    const hasCapacity = this.isInline()
+      ? this.inlineJob === null
+      : this.workers.length < this.options.size ||
+        this.workers.some((w) => w.job === null);
+    if (!hasCapacity && this.queue.length >= this.options.maxQueue) {
+      this.counters.rejected++;
+      return Promise.reject(
+        new GenerationJobError(
+          "QUEUE_FULL",
+          `Generation queue is full (${this.options.maxQueue} waiting)`
+        )
+      );
+    }
+
+    return new Promise<GenerationResult>((resolve, reject) => {
+      const job: Job = {
+        id: this.nextJobId++,
+        config,
+        timeoutMs: timeoutMs ?? this.options.jobTimeoutMs,
+        signal,
+        onProgress,
+        resolve,
+        reject,
+      };
+
+      if (signal) {
+        job.onAbort = () =>
+          this.abortJob(job, new GenerationJobError("CANCELLED", "Generation cancelled"));
+        signal.addEventListener("abort", job.onAbort, { once: true });
+      }
+
+      this.queue.push(job);
+      this.dispatch();
+    });
+  }
+
+  /**
+   * Current pool activity (queueDepth is the number of waiting jobs)
+   */
+  getStats(): WorkerPoolStats {
+    return {
+      size: this.options.size,
+      capacity: this.isInline() ? 1 : this.options.size,
+      fellBackInline: this.fellBackInline,
+      workers: this.workers.length,
+      busy:
+        this.workers.filter((w) => w.job !== null).length +
+        (this.inlineJob ? 1 : 0),
+      queueDepth: this.queue.length,
+      ...this.counters,
+    };
+  }
+
+  /**
+   * Terminate all workers and reject queued jobs
+   */
+  async shutdown(): Promise<void> {
+    for (const job of this.queue.splice(0)) {
+      this.settle(job);
+      job.reject(new GenerationJobError("CANCELLED", "Worker pool shut down"));
+    }
+    if (this.inlineJob) {
+      const job = this.inlineJob;
+      this.settle(job);
+      job.controller?.abort();
+      job.reject(new GenerationJobError("CANCELLED", "Worker pool shut down"));
+    }
+    const workers = this.workers.splice(0);
+    await Promise.all(
+      workers.map(({ worker, job }) => {
+        if (job) {
+          this.settle(job);
+          job.reject(new GenerationJobError("CANCELLED", "Worker pool shut down"));
+        }
+        return worker.terminate();
+      })
+    );
+  }
+
+  // --------------------------------------------------------------------------
+  // Internals
+  // --------------------------------------------------------------------------
+
+  private isInline(): boolean {
+    return this.options.size === 0 || this.fellBackInline;
+  }
+
+  /**
+   * Stop using threads after a worker failed to start; the given job goes
+   * back to the front of the queue and runs inline with everything else
+   */
+  private fallBackInline(error: unknown, job: Job | null): void {
+    if (!this.fellBackInline) {
+      log.error("Generation worker failed to start; generating in-process", error);
+    }
+    this.fellBackInline = true;
+
+    if (job) {
+      if (job.timer) clearTimeout(job.timer);
+      this.queue.unshift(job);
+    }
+    this.dispatch();
+  }
+
+  /** Start a job's timeout (from dispatch, so queueing time doesn't count) */
+  private startTimer(job: Job): void {
+    job.timer = setTimeout(
+      () =>
+        this.abortJob(
+          job,
+          new GenerationJobError(
+            "TIMEOUT",
+            `Generation timed out after ${job.timeoutMs}ms`
+          )
+        ),
+      job.timeoutMs
+    );
+  }
+
+  /**
+   * Generate on the calling thread. The slot is freed once the solve has
+   * actually stopped, even if the job was already timed out or cancelled.
+   */
+  private runInline(job: Job): void {
+    const controller = new AbortController();
+    job.controller = controller;
+    this.inlineJob = job;
+    this.startTimer(job);
+
+    const finish = (settle: () => void) => {
+      // A timed-out or cancelled job was already rejected by abortJob
+      if (!controller.signal.aborted) {
+        this.settle(job);
+        settle();
+      }
+      this.inlineJob = null;
+      this.dispatch();
+    };
+
+    this.options
+      .generateInline(job.config, {
+        onProgress: job.onProgress,
+        signal: controller.signal,
+      })
+      .then(
+        (result) =>
+          finish(() => {
+            this.counters.completed++;
+            job.resolve(result);
+          }),
+        (error: unknown) =>
+          finish(() => {
+            this.counters.failed++;
+            job.reject(error instanceof Error ? error : new Error(String(error)));
+          })
+      );
+  }
+
+  private dispatch(): void {
+    while (this.queue.length > 0) {
+      if (this.isInline()) {
+        if (!this.inlineJob) this.runInline(this.queue.shift()!);
+        return;
+      }
+
+      let slot = this.workers.find((w) => w.job === null);
+      if (!slot && this.workers.length < this.options.size) {
+        try {
+          slot = this.spawn();
+        } catch (error) {
+          return this.fallBackInline(error, null);
+        }
+      }
+      if (!slot) return;
+
+      const job = this.queue.shift()!;
+      slot.job = job;
+      this.startTimer(job);
+      slot.worker.postMessage({ id: job.id, config: job.config });
+    }
+  }
+
+  private spawn(): PoolWorker {
+    const slot: PoolWorker = {
+      worker: this.options.createWorker(),
+      job: null,
+      ready: false,
+    };
+
+    slot.worker.on("message", (message: WorkerResponse | WorkerReady) => {
+      if ("ready" in message) {
+        slot.ready = true;
+        return;
+      }
+      const job = slot.job;
+      if (!job || job.id !== message.id) return;
+
+      if ("progress" in message) {
+        job.onProgress?.(message.progress);
+        return;
+      }
+
+      slot.job = null;
+      this.settle(job);
+
+      if ("error" in message) {
+        this.counters.failed++;
+        job.reject(new GenerationJobError("WORKER_FAILED", message.error));
+      } else {
+        this.counters.completed++;
+        // Structured clone drops the lazy grid views
+        const { result } = message;
+        job.resolve({
+          ...result,
+          boards: restoreBoards(result.boards, job.config.boardConfig.cols),
+        });
+      }
+      this.dispatch();
+    });
+
+    const onCrash = (reason: string) => {
+      if (!this.workers.includes(slot)) return;
+      this.removeWorker(slot);
+      const job = slot.job;
+      if (!slot.ready) {
+        // The entry never loaded (e.g. not bundled); threads are unusable
+        slot.job = null;
+        return this.fallBackInline(new Error(reason), job);
+      }
+      if (job) {
+        slot.job = null;
+        this.settle(job);
+        this.counters.failed++;
+        job.reject(new GenerationJobError("WORKER_FAILED", reason));
+      }
+      this.dispatch();
+    };
+
+    slot.worker.on("error", (error: Error) => {
+      log.error("Worker error", error);
+      onCrash(error.message);
+    });
+    slot.worker.on("exit", (code: number) => onCrash(`Worker exited with code ${code}`));
+
+    this.workers.push(slot);
+    return slot;
+  }
+
+  private removeWorker(slot: PoolWorker): void {
+    this.workers = this.workers.filter((w) => w !== slot);
+  }
+
+  /** Clear a job's timer and abort listener */
+  private settle(job: Job): void {
+    if (job.timer) clearTimeout(job.timer);
+    if (job.signal && job.onAbort) {
+      job.signal.removeEventListener("abort", job.onAbort);
+    }
+  }
+
+  /** Time out or cancel a job, whether queued or running */
+  private abortJob(job: Job, error: GenerationJobError): void {
+    this.settle(job);
+    if (error.code === "TIMEOUT") this.counters.timedOut++;
+    else this.counters.cancelled++;
+
+    const queued = this.queue.indexOf(job);
+    if (queued !== -1) {
+      this.queue.splice(queued, 1);
+      job.reject(error);
+      return;
+    }
+
+    if (job === this.inlineJob) {
+      // The solve stops at its next abort check; the slot frees after that
+      job.controller?.abort(error);
+      log.warn(`Aborted inline job ${job.id}: ${error.code}`);
+      job.reject(error);
+      return;
+    }
+
+    const slot = this.workers.find((w) => w.job === job);
+    if (slot) {
+      // The solve can't be interrupted; replace the worker
+      slot.job = null;
+      this.removeWorker(slot);
+      void slot.worker.terminate();
+      log.warn(`Terminated worker for job ${job.id}: ${error.code}`);
+    }
+
+    job.reject(error);
+    this.dispatch();
+  }
+}
+
+// ============================================================================
+// SHARED INSTANCE
+// ============================================================================
+
+let sharedPool: GenerationWorkerPool | null = null;
+
+/**
+ * Process-wide pool used by the API routes
+ */
+export function getGenerationPool(): GenerationWorkerPool {
+  if (!sharedPool) sharedPool = new GenerationWorkerPool();
+  return sharedPool;
+}
@@ -81,6 +81,22 @@ export type DistributionStrategy =
 // GENERATOR CONFIGURATION
 // ============================================================================
 
+/**
+ * Solver effort
+ * - fast: feasible assignment + local search (default)
+ * - quality: minimize the max pairwise overlap within a time budget
+ */
+export type SolverMode = "fast" | "quality";
+
+/** Post-solve overlap optimizer */
+export type OptimizerStrategy =
+  | { type: "local" }
+  | { type: "annealing"; maxIterations?: number; timeBudgetMs?: number }
+  | { type: "tabu"; maxIterations?: number; timeBudgetMs?: number };
+
+/** Default wall-clock budget for "quality" mode */
+export const DEFAULT_QUALITY_TIME_BUDGET_MS = 10000;
+
 /** Complete generator configuration */
 export interface GeneratorConfig {
   items: Item[];
@@ -89,6 +105,14 @@ export interface GeneratorConfig {
   distribution: DistributionStrategy;
   /** Optional seed for reproducible generation */
   seed?: number;
+  /** Solver effort (defaults to "fast") */
+  solverMode?: SolverMode;
+  /** Wall-clock budget for "quality" mode (ms) */
+  timeBudgetMs?: number;
+  /** Overlap optimizer run after solving (defaults to "local") */
+  optimizer?: OptimizerStrategy;
+  /** Skip the server result cache and always solve */
+  bypassCache?: boolean;
 }
 
 /** Default Tabula items (Barranquilla edition) */
@@ -156,8 +180,52 @@ export const DEFAULT_CONFIG: GeneratorConfig = {
 export interface GeneratedBoard {
   id: string;
   boardNumber: number;
+  /** Row-major layout (the board's only stored copy of its cells) */
   items: Item[];
-  grid: Item[][]; // 2D representation for display
+  /**
+   * Row view over `items`, built on first read. Non-enumerable, so JSON and
+   * structured clones omit it (see utils/board-layout)
+   */
+  grid: Item[][];
+}
+
+/**
+ * Solver that produced the boards
+ * - design: a combinatorial construction (see GenerationStats.construction)
+ * - highs: a single HiGHS model
+ * - decomposition: HiGHS on blocks of boards, merged and re-optimized
+ * - greedy: fallback heuristic
+ */
+export type SolverUsed = "design" | "highs" | "decomposition" | "greedy";
+
+/** Wall-clock time spent in each generation phase (ms) */
+export interface GenerationTimings {
+  /** Frequency calculation and feasibility precheck */
+  precheckMs: number;
+  /** Trying combinatorial design constructions */
+  constructionMs: number;
+  /** Obtaining a HiGHS instance (WASM instantiation when cold) */
+  solverInitMs: number;
+  /** Building and serializing LP models */
+  modelBuildMs: number;
+  /** HiGHS solves (decomposed blocks and greedy fallback included) */
+  solveMs: number;
+  /** Reading solution columns back into an assignment */
+  parseMs: number;
+  /** Post-solve overlap optimizer */
+  localSearchMs: number;
+  /** Converting the assignment to boards */
+  boardsMs: number;
+  /** Computing overlap statistics */
+  statsMs: number;
+}
+
+/** Counters from the post-solve overlap optimizer */
+export interface OptimizerStats {
+  strategy: OptimizerStrategy["type"];
+  iterations: number;
+  swapsAttempted: number;
+  swapsAccepted: number;
 }
 
 /** Statistics about the generation */
@@ -168,10 +236,24 @@ export interface GenerationStats {
   maxOverlap: number;
   avgOverlap: number;
   generationTimeMs: number;
-  solverUsed: "highs" | "greedy";
+  /** Time spent obtaining a HiGHS instance (≈0 when a warm instance is reused) */
+  solverInitTimeMs: number;
+  /** Time spent solving and optimizing, excluding instantiation */
+  solveTimeMs: number;
+  solverUsed: SolverUsed;
+  /** Design used when solverUsed is "design", e.g. "(13, 4, 1) Singer difference set" */
+  construction?: string;
+  /** Proven lower bound on max overlap ("quality" mode only) */
+  overlapLowerBound?: number;
+  /** Time per phase (sums to slightly less than generationTimeMs) */
+  timings?: GenerationTimings;
+  /** Optimizer counters (absent when no optimizer ran) */
+  optimizer?: OptimizerStats;
   frequencies: Record<string, number>;
   /** Seed used for this generation (save to reproduce) */
   seedUsed: number;
+  /** Whether the result was served from the server result cache */
+  cacheHit?: boolean;
 }
 
 /** Complete generation result */
@@ -182,6 +264,67 @@ export interface GenerationResult {
   errors?: string[];
 }
 
+/**
+ * One board's layout as base64 little-endian Uint16 indices into a shared
+ * item table, in row-major grid order
+ */
+export type PackedBoard = string;
+
+/**
+ * Compact /api/generate response (`?format=compact`): every item is sent
+ * once and boards reference it by index. Board ids and numbers follow
+ * array position.
+ */
+export interface CompactGenerationResult {
+  format: "compact";
+  success: boolean;
+  items: Item[];
+  boardConfig: BoardConfig;
+  boards: PackedBoard[];
+  stats: GenerationStats;
+  errors?: string[];
+}
+
+/** Solver milestone reported while generating */
+export type GenerationPhase = "model-built" | "solved" | "local-search";
+
+/** Progress update emitted during generation */
+export interface GenerationProgress {
+  phase: GenerationPhase;
+  /** Time since generation started (ms) */
+  elapsedMs: number;
+  /** Optimizer iteration ("local-search" only) */
+  iteration?: number;
+  /** Current max pairwise overlap, when known */
+  maxOverlap?: number;
+}
+
+/** One line of the NDJSON stream returned by /api/generate */
+export type GenerationStreamEvent =
+  | { type: "progress"; progress: GenerationProgress }
+  | { type: "board"; board: GeneratedBoard }
+  /** Compact streams: the item table, sent once before any boards */
+  | { type: "items"; items: Item[]; boardConfig: BoardConfig }
+  /** Compact streams: packed boards starting at position `start` */
+  | { type: "boards"; start: number; boards: PackedBoard[] }
+  | {
+      type: "done";
+      success: boolean;
+      stats: GenerationStats;
+      errors?: string[];
+    }
+  | { type: "error"; error: string };
+
+/**
+ * One line of the NDJSON stream returned by /api/generate/batch
+ * (index is the config's position in the request)
+ */
+export type BatchStreamEvent =
+  | { type: "progress"; index: number; progress: GenerationProgress }
+  | { type: "result"; index: number; result: GenerationResult }
+  | { type: "error"; index: number; error: string }
+  | { type: "done"; completed: number; failed: number };
+
 // ============================================================================
 // CONSTRAINT TYPES
 // ============================================================================
@@ -196,6 +339,7 @@ export type ConstraintType =
   | "MIN_FREQUENCY"
   | "MAX_FREQUENCY"
   | "FEASIBILITY"
+  | "DEGREE_SEQUENCE"
   | "UNIQUE_BOARDS"
   | "OVERLAP_QUALITY";
 
@@ -221,9 +365,12 @@ export interface SystemConstraints {
   C: number; // Columns
   frequencies: number[]; // Frequency per item
   sumFrequencies: number;
+  minFrequency: number; // min fᵢ
+  maxFrequency: number; // max fᵢ
   minPossibleSlots: number; // N
   maxPossibleSlots: number; // N × B
-  possibleUniqueBoards: number; // C(N, S)
+  possibleUniqueBoards: number; // C(N, S) (exact up to 2^53, may be Infinity)
+  logPossibleUniqueBoards: number; // ln C(N, S) (always finite for N ≥ S)
 }
 
 // ============================================================================
@@ -240,6 +387,10 @@ export interface WizardState {
   result: GenerationResult | null;
   validations: ConstraintValidation[];
   isGenerating: boolean;
+  /** Latest progress update while generating */
+  progress: GenerationProgress | null;
+  /** Boards received so far from a streaming generation */
+  streamedBoards: GeneratedBoard[];
   error: string | null;
 }
 
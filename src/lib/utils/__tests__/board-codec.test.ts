@@ -0,0 +1,120 @@
+/**
+ * Compact Board Codec Tests
+ */
+
+import { describe, it, expect } from "vitest";
+import {
+  decodeIndices,
+  encodeIndices,
+  packBoards,
+  packResult,
+  unpackBoard,
+  unpackResult,
+} from "../board-codec";
+import type { GeneratedBoard, GenerationResult, Item } from "@/lib/types";
+
+// ============================================================================
+// HELPERS
+// ============================================================================
+
+function createItems(count: number): Item[] {
+  return Array.from({ length: count }, (_, i) => ({
+    id: String(i + 1).padStart(3, "0"),
+    name: `Item number ${i + 1}`,
+  }));
+}
+
+function createBoard(items: Item[], indices: number[], cols: number, position: number): GeneratedBoard {
+  const layout = indices.map((i) => items[i]);
+  return {
+    id: `board-${position + 1}`,
+    boardNumber: position + 1,
+    items: layout,
+    grid: Array.from({ length: layout.length / cols }, (_, r) =>
+      layout.slice(r * cols, (r + 1) * cols)
+    ),
+  };
+}
+
+function createResult(items: Item[], numBoards: number, size: number, cols: number): GenerationResult {
+  const boards = Array.from({ length: numBoards }, (_, b) =>
+    createBoard(
+      items,
+      Array.from({ length: size }, (_, k) => (b * 7 + k * 13) % items.length),
+      cols,
+      b
+    )
+  );
+  return {
+    success: true,
+    boards,
+    stats: {
+      totalSlots: numBoards * size,
+      totalItems: items.length,
+      minOverlap: 0,
+      maxOverlap: 0,
+      avgOverlap: 0,
+      generationTimeMs: 1,
+      solverInitTimeMs: 0,
+      solveTimeMs: 1,
+      solverUsed: "greedy",
+      frequencies: {},
+      seedUsed: 1,
+    },
+  };
+}
+
+// ============================================================================
+// TESTS
+// ============================================================================
+
+describe("Board codec", () => {
+  it("round-trips indices across the full Uint16 range", () => {
+    const indices = [0, 1, 255, 256, 4095, 65535];
+    expect(Array.from(decodeIndices(encodeIndices(indices)))).toEqual(indices);
+  });
+
+  it("round-trips a result with boards in grid order", () => {
+    const items = createItems(40);
+    const result = createResult(items, 12, 16, 4);
+
+    const unpacked = unpackResult(packResult(result, items, { rows: 4, cols: 4 }));
+
+    expect(unpacked.stats).toEqual(result.stats);
+    unpacked.boards.forEach((board, b) => {
+      expect(board.id).toBe(result.boards[b].id);
+      expect(board.boardNumber).toBe(result.boards[b].boardNumber);
+      expect(board.items).toEqual(result.boards[b].items);
+      expect(board.grid).toEqual(result.boards[b].grid);
+    });
+  });
+
+  it("decodes a board only when its items are read", () => {
+    const items = createItems(20);
+    const [packed] = packBoards([createBoard(items, [3, 1, 4, 15], 2, 0)], items);
+
+    const board = unpackBoard(packed, 0, items, { rows: 2, cols: 2 });
+
+    expect(board.items).toBe(board.items);
+    expect(board.grid).toEqual([
+      [items[3], items[1]],
+      [items[4], items[15]],
+    ]);
+  });
+
+  it("rejects boards holding items missing from the table", () => {
+    const items = createItems(10);
+    const board = createBoard(items, [0, 1, 2, 3], 2, 0);
+    expect(() => packBoards([board], items.slice(0, 2))).toThrow(/Unknown item/);
+  });
+
+  it("shrinks large payloads by an order of magnitude", () => {
+    const items = createItems(200);
+    const result = createResult(items, 1000, 25, 5);
+
+    const full = JSON.stringify(result).length;
+    const compact = JSON.stringify(packResult(result, items, { rows: 5, cols: 5 })).length;
+
+    expect(compact).toBeLessThan(full / 10);
+  });
+});
@@ -0,0 +1,67 @@
+/**
+ * Board Layout View Tests
+ */
+
+import { describe, it, expect } from "vitest";
+import { boardRows, createBoard, restoreBoards, toPlainBoard } from "../board-layout";
+import type { Item } from "@/lib/types";
+
+const items: Item[] = Array.from({ length: 6 }, (_, i) => ({
+  id: String(i + 1),
+  name: `Item ${i + 1}`,
+}));
+
+describe("Board layout views", () => {
+  it("splits a flat layout into rows", () => {
+    expect(boardRows(items, 3)).toEqual([items.slice(0, 3), items.slice(3)]);
+  });
+
+  it("builds the grid on first read and keeps it", () => {
+    let reads = 0;
+    const board = createBoard(4, () => {
+      reads++;
+      return items;
+    }, 2);
+
+    expect(board.id).toBe("board-5");
+    expect(board.boardNumber).toBe(5);
+    expect(reads).toBe(0);
+
+    expect(board.grid).toEqual([items.slice(0, 2), items.slice(2, 4), items.slice(4)]);
+    expect(board.grid).toBe(board.grid);
+    expect(board.items).toBe(items);
+    expect(reads).toBe(1);
+  });
+
+  it("leaves grid out of JSON and structured clones", () => {
+    let reads = 0;
+    const board = createBoard(0, () => {
+      reads++;
+      return items.slice(0, 4);
+    }, 2);
+    const plain = { id: "board-1", boardNumber: 1, items: items.slice(0, 4) };
+
+    expect(JSON.parse(JSON.stringify(board))).toEqual(plain);
+    expect(structuredClone(board)).toEqual(plain);
+    expect(Object.keys(board)).toEqual(["id", "boardNumber", "items"]);
+    expect(reads).toBe(1);
+  });
+
+  it("restores grid views after a copy", () => {
+    const [board] = restoreBoards([structuredClone(createBoard(0, items, 3))], 3);
+
+    expect(board.id).toBe("board-1");
+    expect(board.grid).toEqual([items.slice(0, 3), items.slice(3)]);
+  });
+
+  it("materializes grid for full-format responses", () => {
+    const board = toPlainBoard(createBoard(0, items.slice(0, 4), 2));
+
+    expect(JSON.parse(JSON.stringify(board))).toEqual({
+      id: "board-1",
+      boardNumber: 1,
+      items: items.slice(0, 4),
+      grid: [items.slice(0, 2), items.slice(2, 4)],
+    });
+  });
+});
@@ -0,0 +1,48 @@
+/**
+ * NDJSON Helper Tests
+ */
+
+import { describe, it, expect } from "vitest";
+import { encodeNdjsonLine, readNdjson } from "../ndjson";
+
+/** Stream that yields the given byte chunks in order */
+function streamOf(chunks: Uint8Array[]): ReadableStream<Uint8Array> {
+  return new ReadableStream({
+    start(controller) {
+      for (const chunk of chunks) controller.enqueue(chunk);
+      controller.close();
+    },
+  });
+}
+
+async function collect(chunks: Uint8Array[]): Promise<unknown[]> {
+  const values: unknown[] = [];
+  await readNdjson(streamOf(chunks), (value) => values.push(value));
+  return values;
+}
+
+describe("NDJSON", () => {
+  const values = [{ type: "a", n: 1 }, { type: "b", text: "ñandú" }, [1, 2, 3]];
+
+  it("should round-trip values written one per chunk", async () => {
+    expect(await collect(values.map(encodeNdjsonLine))).toEqual(values);
+  });
+
+  it("should handle lines split across chunks, including mid-character", async () => {
+    const bytes = new Uint8Array(
+      values.flatMap((v) => Array.from(encodeNdjsonLine(v)))
+    );
+    // One byte per chunk splits every line and every multi-byte character
+    const chunks = Array.from(bytes, (byte) => Uint8Array.of(byte));
+
+    expect(await collect(chunks)).toEqual(values);
+  });
+
+  it("should read a final line without a trailing newline", async () => {
+    const encoder = new TextEncoder();
+    expect(await collect([encoder.encode('{"a":1}\n{"b":2}')])).toEqual([
+      { a: 1 },
+      { b: 2 },
+    ]);
+  });
+});
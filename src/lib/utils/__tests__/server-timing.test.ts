@@ -0,0 +1,62 @@
+/**
+ * Server-Timing Tests
+ */
+
+import { describe, it, expect } from "vitest";
+import { formatServerTiming } from "../server-timing";
+import type { GenerationStats } from "@/lib/types";
+
+function createStats(overrides: Partial<GenerationStats> = {}): GenerationStats {
+  return {
+    totalSlots: 240,
+    totalItems: 36,
+    minOverlap: 2,
+    maxOverlap: 6,
+    avgOverlap: 4.2,
+    generationTimeMs: 120.04,
+    solverInitTimeMs: 0,
+    solveTimeMs: 80,
+    solverUsed: "highs",
+    frequencies: {},
+    seedUsed: 1,
+    timings: {
+      precheckMs: 0.5,
+      constructionMs: 0,
+      solverInitMs: 0,
+      modelBuildMs: 10,
+      solveMs: 80.25,
+      parseMs: 2,
+      localSearchMs: 25,
+      boardsMs: 1,
+      statsMs: 1,
+    },
+    ...overrides,
+  };
+}
+
+describe("formatServerTiming", () => {
+  it("lists non-zero phases in pipeline order, then the totals", () => {
+    const header = formatServerTiming(createStats(), 150);
+    const names = header.split(", ").map((m) => m.split(";")[0]);
+
+    expect(names).toEqual([
+      "precheck",
+      "model-build",
+      "solve",
+      "parse",
+      "local-search",
+      "boards",
+      "stats",
+      "generation",
+      "request",
+    ]);
+    expect(header).toContain('solve;dur=80.3;desc="Solve"');
+    expect(header).toContain("generation;dur=120.0");
+  });
+
+  it("reports only the hit for cached results", () => {
+    expect(formatServerTiming(createStats({ cacheHit: true }))).toBe(
+      'cache;desc="Result cache hit"'
+    );
+  });
+});
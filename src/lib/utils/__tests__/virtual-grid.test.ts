@@ -0,0 +1,106 @@
+/**
+ * Virtual Grid Math Tests
+ */
+
+import { describe, it, expect } from "vitest";
+import {
+  computeVirtualWindow,
+  gridColumns,
+  parseBoardQuery,
+  scrollTopForIndex,
+} from "../virtual-grid";
+
+describe("Virtual grid", () => {
+  it("fits as many columns as the width allows, within bounds", () => {
+    expect(gridColumns(0, 150, 12, 6)).toBe(1);
+    expect(gridColumns(312, 150, 12, 6)).toBe(2);
+    expect(gridColumns(311, 150, 12, 6)).toBe(1);
+    expect(gridColumns(5000, 150, 12, 6)).toBe(6);
+  });
+
+  it("renders the visible rows plus overscan", () => {
+    const range = computeVirtualWindow({
+      count: 1000,
+      columns: 4,
+      rowStride: 100,
+      scrollTop: 1050,
+      viewportHeight: 300,
+      overscanRows: 2,
+    });
+
+    // Rows 10-13 are visible; overscan widens that to 8-15
+    expect(range).toEqual({
+      startIndex: 32,
+      endIndex: 64,
+      offsetTop: 800,
+      totalHeight: 25000,
+    });
+  });
+
+  it("keeps the window size flat however many boards there are", () => {
+    const sizes = [1_000, 100_000].map((count) => {
+      const range = computeVirtualWindow({
+        count,
+        columns: 6,
+        rowStride: 180,
+        scrollTop: 90_000,
+        viewportHeight: 640,
+        overscanRows: 2,
+      });
+      return range.endIndex - range.startIndex;
+    });
+    expect(sizes[0]).toBeLessThanOrEqual(sizes[1]);
+    expect(sizes[1]).toBeLessThanOrEqual(6 * 9);
+  });
+
+  it("clamps the window at both ends of the grid", () => {
+    const top = computeVirtualWindow({
+      count: 10,
+      columns: 3,
+      rowStride: 50,
+      scrollTop: -20,
+      viewportHeight: 60,
+      overscanRows: 1,
+    });
+    expect(top.startIndex).toBe(0);
+
+    const bottom = computeVirtualWindow({
+      count: 10,
+      columns: 3,
+      rowStride: 50,
+      scrollTop: 10_000,
+      viewportHeight: 60,
+      overscanRows: 1,
+    });
+    expect(bottom.startIndex).toBe(9);
+    expect(bottom.endIndex).toBe(10);
+    expect(bottom.offsetTop).toBe(150);
+
+    const empty = computeVirtualWindow({
+      count: 0,
+      columns: 3,
+      rowStride: 50,
+      scrollTop: 0,
+      viewportHeight: 60,
+      overscanRows: 1,
+    });
+    expect(empty).toEqual({ startIndex: 0, endIndex: 0, offsetTop: 0, totalHeight: 0 });
+  });
+
+  it("scrolls a board's row to the top", () => {
+    expect(scrollTopForIndex(0, 4, 120)).toBe(0);
+    expect(scrollTopForIndex(9, 4, 120)).toBe(240);
+  });
+
+  it.each([
+    ["12", 11],
+    ["#12", 11],
+    [" board-3 ", 2],
+    ["0", -1],
+    ["51", -1],
+    ["apple", -1],
+    ["", -1],
+  ])("parses the jump query %j", (query, expected) => {
+    expect(parseBoardQuery(query, 50)).toBe(expected);
+  });
+});
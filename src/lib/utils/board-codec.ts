@@ -0,0 +1,146 @@
+/**
+ * Compact Board Codec
+ *
+ * Shared by the generate route (packing) and the generator store
+ * (unpacking). Full results repeat every Item object in each board's
+ * `items` and `grid`; the compact format sends the item table once and
+ * each board as base64 little-endian Uint16 indices into it (2 bytes per
+ * cell before base64).
+ *
+ * Unpacked boards decode lazily: `items` and `grid` are built on first
+ * access, so boards that are never displayed cost one short string each.
+ *
+ * @example
+ * const compact = packResult(result, config.items, config.boardConfig); // server
+ * const result = unpackResult(compact);                                 // client
+ */
+
+import type {
+  BoardConfig,
+  CompactGenerationResult,
+  GeneratedBoard,
+  GenerationResult,
+  Item,
+  PackedBoard,
+} from "@/lib/types";
+import { createBoard } from "./board-layout";
+
+/** Query value (`?format=compact`) that selects the compact response */
+export const COMPACT_FORMAT = "compact";
+
+/** Packed boards per "boards" event in compact NDJSON streams */
+export const PACKED_BOARDS_PER_EVENT = 256;
+
+/** Largest item table addressable by Uint16 indices */
+const MAX_PACKED_ITEMS = 0x10000;
+
+// ============================================================================
+// INDEX ARRAYS
+// ============================================================================
+
+/**
+ * Encode item indices as base64 little-endian Uint16s
+ */
+export function encodeIndices(indices: ArrayLike<number>): PackedBoard {
+  let binary = "";
+  for (let k = 0; k < indices.length; k++) {
+    const index = indices[k];
+    binary += String.fromCharCode(index & 0xff, index >>> 8);
+  }
+  return btoa(binary);
+}
+
+/**
+ * Decode a packed board back to item indices
+ */
+export function decodeIndices(packed: PackedBoard): Uint16Array {
+  const binary = atob(packed);
+  const indices = new Uint16Array(binary.length >> 1);
+  for (let k = 0; k < indices.length; k++) {
+    indices[k] = binary.charCodeAt(2 * k) | (binary.charCodeAt(2 * k + 1) << 8);
+  }
+  return indices;
+}
+
+// ============================================================================
+// PACKING
+// ============================================================================
+
+/**
+ * Pack boards against an item table (matched by item id)
+ *
+ * @throws If the table is too large for Uint16 indices or a board holds an
+ * item missing from it
+ */
+export function packBoards(boards: GeneratedBoard[], items: Item[]): PackedBoard[] {
+  if (items.length > MAX_PACKED_ITEMS) {
+    throw new Error(`Cannot pack more than ${MAX_PACKED_ITEMS} items`);
+  }
+  const indexById = new Map(items.map((item, i) => [item.id, i]));
+
+  return boards.map((board) =>
+    encodeIndices(
+      board.items.map((item) => {
+        const index = indexById.get(item.id);
+        if (index === undefined) throw new Error(`Unknown item "${item.id}"`);
+        return index;
+      })
+    )
+  );
+}
+
+/**
+ * Convert a full generation result to the compact wire format
+ */
+export function packResult(
+  result: GenerationResult,
+  items: Item[],
+  boardConfig: BoardConfig
+): CompactGenerationResult {
+  return {
+    format: "compact",
+    success: result.success,
+    items,
+    boardConfig,
+    boards: packBoards(result.boards, items),
+    stats: result.stats,
+    errors: result.errors,
+  };
+}
+
+// ============================================================================
+// UNPACKING
+// ============================================================================
+
+/**
+ * Rehydrate one packed board (decoded on first access of items or grid)
+ *
+ * @param position Board position in the result (0-based)
+ */
+export function unpackBoard(
+  packed: PackedBoard,
+  position: number,
+  items: Item[],
+  boardConfig: BoardConfig
+): GeneratedBoard {
+  return createBoard(
+    position,
+    () => Array.from(decodeIndices(packed), (i) => items[i]),
+    boardConfig.cols
+  );
+}
+
+/**
+ * Rehydrate a compact result into a GenerationResult with lazy boards
+ */
+export function unpackResult(compact: CompactGenerationResult): GenerationResult {
+  const { items, boardConfig } = compact;
+  return {
+    success: compact.success,
+    boards: compact.boards.map((packed, position) =>
+      unpackBoard(packed, position, items, boardConfig)
+    ),
+    stats: compact.stats,
+    errors: compact.errors,
+  };
+}
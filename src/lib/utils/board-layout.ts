@@ -0,0 +1,86 @@
+/**
+ * Board Layout Views
+ *
+ * A GeneratedBoard stores one flat, row-major `items` array. Its `grid` is
+ * a view over that array, built on first read and then kept, so boards
+ * whose rows are never displayed never allocate them. Hot paths (preview,
+ * export) read `items` with the column count instead of touching `grid`.
+ *
+ * The `grid` getter is non-enumerable, so structured clone (worker →
+ * main thread) and JSON.stringify carry only `id`, `boardNumber` and
+ * `items` and never build it. restoreBoards puts the view back after such
+ * a copy; toPlainBoard materializes `grid` for the full-format API, whose
+ * boards document it.
+ */
+
+import type { GeneratedBoard, Item } from "@/lib/types";
+
+/**
+ * Rows of a flat row-major layout (fresh slices; nothing is cached)
+ */
+export function boardRows(items: readonly Item[], cols: number): Item[][] {
+  const rows: Item[][] = [];
+  for (let start = 0; start < items.length; start += cols) {
+    rows.push(items.slice(start, start + cols));
+  }
+  return rows;
+}
+
+/**
+ * Create a board over a flat layout with a lazily built `grid`
+ *
+ * @param position Board position in the result (0-based)
+ * @param layout Row-major items, or a function producing them on first read
+ */
+export function createBoard(
+  position: number,
+  layout: Item[] | (() => Item[]),
+  cols: number
+): GeneratedBoard {
+  let items = typeof layout === "function" ? null : layout;
+  let grid: Item[][] | null = null;
+
+  const getItems = () => {
+    if (!items) items = (layout as () => Item[])();
+    return items;
+  };
+
+  const board = {
+    id: `board-${position + 1}`,
+    boardNumber: position + 1,
+    get items() {
+      return getItems();
+    },
+  } as GeneratedBoard;
+  Object.defineProperty(board, "grid", {
+    get() {
+      if (!grid) grid = boardRows(getItems(), cols);
+      return grid;
+    },
+    enumerable: false,
+  });
+  return board;
+}
+
+/**
+ * Rebuild lazy boards from copies that lost their `grid` view
+ * (structured clone, JSON round trips)
+ */
+export function restoreBoards(
+  boards: ReadonlyArray<Pick<GeneratedBoard, "items">>,
+  cols: number
+): GeneratedBoard[] {
+  return boards.map((board, position) => createBoard(position, board.items, cols));
+}
+
+/**
+ * Plain copy with `grid` as an own property, for full-format responses
+ */
+export function toPlainBoard(board: GeneratedBoard): GeneratedBoard {
+  return {
+    id: board.id,
+    boardNumber: board.boardNumber,
+    items: board.items,
+    grid: board.grid,
+  };
+}
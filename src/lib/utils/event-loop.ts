@@ -0,0 +1,44 @@
+/**
+ * Event Loop Yielding
+ *
+ * Generation runs on the request thread unless worker threads are
+ * enabled, and its solver and optimizer loops are synchronous. Awaiting
+ * an already-resolved promise only drains microtasks, so without a real
+ * yield an abort event, a job timeout or a stream flush would wait for
+ * the whole solve. These helpers hand control back to the macrotask
+ * queue.
+ *
+ * @example
+ * const pause = createYielder();
+ * for (...) {
+ *   await pause();
+ *   if (signal?.aborted) break;
+ * }
+ */
+
+/** Longest stretch of synchronous work between yields (ms) */
+export const YIELD_INTERVAL_MS = 16;
+
+/**
+ * Resolve on a later macrotask, after pending timers, I/O and events
+ */
+export function yieldToEventLoop(): Promise<void> {
+  return new Promise((resolve) => {
+    if (typeof setImmediate === "function") setImmediate(resolve);
+    else setTimeout(resolve, 0);
+  });
+}
+
+/**
+ * Yield at most once per `intervalMs` (cheap enough for hot loops)
+ */
+export function createYielder(
+  intervalMs: number = YIELD_INTERVAL_MS
+): () => Promise<void> {
+  let last = performance.now();
+  return async () => {
+    if (performance.now() - last < intervalMs) return;
+    await yieldToEventLoop();
+    last = performance.now();
+  };
+}
@@ -0,0 +1,59 @@
+/**
+ * Newline-Delimited JSON Helpers
+ *
+ * Shared by the streaming generate route (encoding) and the generator
+ * store (decoding). Each value is one line of JSON terminated by "\n".
+ *
+ * @example
+ * controller.enqueue(encodeNdjsonLine({ type: "progress", ... }));
+ * await readNdjson(response.body, (event) => handle(event));
+ */
+
+const encoder = new TextEncoder();
+
+/** MIME type for NDJSON responses */
+export const NDJSON_CONTENT_TYPE = "application/x-ndjson";
+
+/**
+ * Encode a value as one NDJSON line
+ */
+export function encodeNdjsonLine(value: unknown): Uint8Array {
+  return encoder.encode(`${JSON.stringify(value)}\n`);
+}
+
+/**
+ * Read an NDJSON byte stream, calling `onValue` for each line as soon as
+ * it is complete. Lines may be split across chunks arbitrarily.
+ */
+export async function readNdjson<T>(
+  body: ReadableStream<Uint8Array>,
+  onValue: (value: T) => void
+): Promise<void> {
+  const reader = body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+
+  const flush = (text: string) => {
+    const line = text.trim();
+    if (line) onValue(JSON.parse(line) as T);
+  };
+
+  try {
+    for (;;) {
+      const { done, value } = await reader.read();
+      if (done) break;
+
+      buffer += decoder.decode(value, { stream: true });
+      let newline = buffer.indexOf("\n");
+      while (newline !== -1) {
+        flush(buffer.slice(0, newline));
+        buffer = buffer.slice(newline + 1);
+        newline = buffer.indexOf("\n");
+      }
+    }
+
+    flush(buffer + decoder.decode());
+  } finally {
+    reader.releaseLock();
+  }
+}
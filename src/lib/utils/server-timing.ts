@@ -0,0 +1,59 @@
+/**
+ * Server-Timing Header
+ *
+ * Formats a generation's per-phase timings as a Server-Timing header
+ * value, so slow phases show up in the browser devtools network panel.
+ *
+ * @example
+ * headers: { "Server-Timing": formatServerTiming(result.stats, requestMs) }
+ * // solve;dur=812.4;desc="Solve", local-search;dur=95.1;desc="Local search", …
+ */
+
+import type { GenerationStats, GenerationTimings } from "@/lib/types";
+
+/** Metric name and description per phase, in pipeline order */
+const PHASE_METRICS: Array<[keyof GenerationTimings, string, string]> = [
+  ["precheckMs", "precheck", "Precheck"],
+  ["constructionMs", "design", "Design construction"],
+  ["solverInitMs", "solver-init", "HiGHS init"],
+  ["modelBuildMs", "model-build", "Model build"],
+  ["solveMs", "solve", "Solve"],
+  ["parseMs", "parse", "Column parsing"],
+  ["localSearchMs", "local-search", "Local search"],
+  ["boardsMs", "boards", "Board layout"],
+  ["statsMs", "stats", "Stats"],
+];
+
+function metric(name: string, durationMs: number, description: string): string {
+  return `${name};dur=${durationMs.toFixed(1)};desc="${description}"`;
+}
+
+/**
+ * Server-Timing value for a generation result
+ *
+ * Cache hits report only the hit (their timings belong to the original
+ * run). Phases that took no time are omitted.
+ *
+ * @param requestMs Time the route spent on the request (includes queueing)
+ */
+export function formatServerTiming(
+  stats: GenerationStats,
+  requestMs?: number
+): string {
+  const metrics: string[] = [];
+
+  if (stats.cacheHit) {
+    metrics.push('cache;desc="Result cache hit"');
+  } else {
+    for (const [phase, name, description] of PHASE_METRICS) {
+      const duration = stats.timings?.[phase] ?? 0;
+      if (duration > 0) metrics.push(metric(name, duration, description));
+    }
+    metrics.push(metric("generation", stats.generationTimeMs, "Generation"));
+  }
+
+  if (requestMs !== undefined) {
+    metrics.push(metric("request", requestMs, "Request"));
+  }
+  return metrics.join(", ");
+}
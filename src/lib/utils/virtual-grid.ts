@@ -0,0 +1,98 @@
+/**
+ * Virtual Grid Math
+ *
+ * Windowing for a scrolling grid of equally sized cells: only rows that
+ * intersect the viewport (plus an overscan margin) are rendered, and a
+ * spacer keeps the scroll height of the full grid. Every row has the same
+ * stride (row height + gap), so the window for any scroll position is
+ * O(1) and rendering cost doesn't depend on the number of cells.
+ */
+
+/** Rows and cells to render for one scroll position */
+export interface VirtualWindow {
+  /** First rendered cell (inclusive) */
+  startIndex: number;
+  /** Last rendered cell (exclusive) */
+  endIndex: number;
+  /** Offset of the first rendered row from the top of the grid (px) */
+  offsetTop: number;
+  /** Height of the whole grid (px) */
+  totalHeight: number;
+}
+
+export interface VirtualWindowOptions {
+  count: number;
+  columns: number;
+  /** Row height plus the gap below it (px) */
+  rowStride: number;
+  scrollTop: number;
+  viewportHeight: number;
+  /** Extra rows rendered above and below the viewport */
+  overscanRows: number;
+}
+
+/**
+ * Columns that fit in `width` with cells at least `minCellWidth` wide
+ */
+export function gridColumns(
+  width: number,
+  minCellWidth: number,
+  gap: number,
+  maxColumns: number
+): number {
+  const fit = Math.floor((width + gap) / (minCellWidth + gap));
+  return Math.max(1, Math.min(maxColumns, fit));
+}
+
+/**
+ * Cells to render for a scroll position
+ */
+export function computeVirtualWindow({
+  count,
+  columns,
+  rowStride,
+  scrollTop,
+  viewportHeight,
+  overscanRows,
+}: VirtualWindowOptions): VirtualWindow {
+  const rowCount = Math.ceil(count / columns);
+  const totalHeight = rowCount * rowStride;
+  if (rowCount === 0 || rowStride <= 0) {
+    return { startIndex: 0, endIndex: 0, offsetTop: 0, totalHeight };
+  }
+
+  const firstVisible = Math.floor(Math.max(0, scrollTop) / rowStride);
+  const lastVisible = Math.ceil((Math.max(0, scrollTop) + viewportHeight) / rowStride);
+  const startRow = Math.min(rowCount - 1, Math.max(0, firstVisible - overscanRows));
+  const endRow = Math.min(rowCount, lastVisible + overscanRows);
+
+  return {
+    startIndex: startRow * columns,
+    endIndex: Math.min(count, endRow * columns),
+    offsetTop: startRow * rowStride,
+    totalHeight,
+  };
+}
+
+/**
+ * Scroll position that puts a cell's row at the top of the viewport
+ */
+export function scrollTopForIndex(
+  index: number,
+  columns: number,
+  rowStride: number
+): number {
+  return Math.floor(index / columns) * rowStride;
+}
+
+/**
+ * Board index for a jump-to-board query ("12", "#12" or "board-12")
+ *
+ * @returns The 0-based index, or -1 when the query names no board
+ */
+export function parseBoardQuery(query: string, boardCount: number): number {
+  const match = /^\s*(?:#|board-)?\s*(\d+)\s*$/i.exec(query);
+  if (!match) return -1;
+  const index = Number(match[1]) - 1;
+  return index >= 0 && index < boardCount ? index : -1;
+}
@@ -8,7 +8,9 @@ import type {
   WizardStep,
   WizardState,
   GeneratorConfig,
+  GeneratedBoard,
   GenerationResult,
+  GenerationStreamEvent,
   ConstraintValidation,
   Item,
   BoardConfig,
@@ -21,6 +23,8 @@ import {
   DEFAULT_NUM_BOARDS,
 } from "@/lib/types";
 import { validateConstraints } from "@/lib/constraints/engine";
+import { NDJSON_CONTENT_TYPE, readNdjson } from "@/lib/utils/ndjson";
+import { COMPACT_FORMAT, unpackBoard } from "@/lib/utils/board-codec";
 
 interface GeneratorStore extends WizardState {
   // Navigation
@@ -41,6 +45,7 @@ interface GeneratorStore extends WizardState {
   // Generation
   generate: () => Promise<void>;
   regenerate: () => Promise<void>;
+  cancelGeneration: () => void;
 
   // Reset
   reset: () => void;
@@ -61,9 +66,44 @@ const initialState: WizardState = {
   result: null,
   validations: [],
   isGenerating: false,
+  progress: null,
+  streamedBoards: [],
   error: null,
 };
 
+// Controller for the in-flight generate request (aborting it cancels the
+// fetch, which aborts the route's request signal and stops the solver)
+let generationController: AbortController | null = null;
+
+/**
+ * Abort the in-flight generation and clear its transient state right away,
+ * so a new generation can start before the aborted one unwinds
+ */
+function abortGeneration(): void {
+  if (!generationController) return;
+  generationController.abort();
+  generationController = null;
+  useGeneratorStore.setState({
+    isGenerating: false,
+    progress: null,
+    streamedBoards: [],
+  });
+}
+
+/**
+ * Error message from a failed generate response (JSON body if present)
+ */
+async function responseError(response: Response): Promise<string> {
+  try {
+    const body: { error?: string; errors?: string[] } = await response.json();
+    if (body.errors?.length) return body.errors.join(", ");
+    if (body.error) return body.error;
+  } catch {
+    // Not JSON; fall through to the status
+  }
+  return `HTTP ${response.status}`;
+}
+
 export const useGeneratorStore = create<GeneratorStore>((set, get) => ({
   ...initialState,
 
@@ -126,6 +166,7 @@ export const useGeneratorStore = create<GeneratorStore>((set, get) => ({
 
   // Configuration
   setItems: (items) => {
+    abortGeneration();
     set((state) => {
       const newConfig = { ...state.config, items };
       return {
@@ -145,6 +186,7 @@ export const useGeneratorStore = create<GeneratorStore>((set, get) => ({
   },
 
   setBoardConfig: (boardConfig) => {
+    abortGeneration();
     set((state) => {
       const newConfig = { ...state.config, boardConfig };
       return {
@@ -156,6 +198,7 @@ export const useGeneratorStore = create<GeneratorStore>((set, get) => ({
   },
 
   setNumBoards: (numBoards) => {
+    abortGeneration();
     set((state) => {
       const newConfig = { ...state.config, numBoards };
       return {
@@ -167,6 +210,7 @@ export const useGeneratorStore = create<GeneratorStore>((set, get) => ({
   },
 
   setDistribution: (distribution) => {
+    abortGeneration();
     set((state) => {
       const newConfig = { ...state.config, distribution };
       return {
@@ -178,6 +222,7 @@ export const useGeneratorStore = create<GeneratorStore>((set, get) => ({
   },
 
   setSeed: (seed) => {
+    abortGeneration();
     set((state) => ({
       config: { ...state.config, seed },
       result: null, // Invalidate previous result when seed changes
@@ -190,39 +235,120 @@ export const useGeneratorStore = create<GeneratorStore>((set, get) => ({
 
     if (isGenerating) return;
 
-    set({ isGenerating: true, error: null });
+    const controller = new AbortController();
+    generationController = controller;
+    set({ isGenerating: true, error: null, progress: null, streamedBoards: [] });
 
     try {
       // Call API route for HiGHS solver (runs on server with Node.js runtime)
-      const response = await fetch("/api/generate", {
+      // and consume its NDJSON stream: progress while solving, then boards
+      // (sent once the solve has finished) as each chunk is parsed.
+      // Boards arrive packed against a shared item table and are decoded
+      // only when displayed.
+      const response = await fetch(`/api/generate?format=${COMPACT_FORMAT}`, {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
+        headers: {
+          "Content-Type": "application/json",
+          Accept: NDJSON_CONTENT_TYPE,
+        },
         body: JSON.stringify(config),
+        signal: controller.signal,
       });
 
-      if (!response.ok) {
-        throw new Error(`HTTP ${response.status}`);
+      if (!response.ok || !response.body) {
+        throw new Error(await responseError(response));
       }
 
-      const result: GenerationResult = await response.json();
+      const boards: GeneratedBoard[] = [];
+      // Assigned inside the stream callback (casts keep TS from narrowing to null)
+      let result = null as GenerationResult | null;
+      let table = null as { items: Item[]; boardConfig: BoardConfig } | null;
+      let flushScheduled = false;
+
+      // Publish boards once per received chunk rather than once per line
+      const flushBoards = () => {
+        flushScheduled = false;
+        if (!controller.signal.aborted) set({ streamedBoards: boards.slice() });
+      };
+      const scheduleFlush = () => {
+        if (flushScheduled) return;
+        flushScheduled = true;
+        queueMicrotask(flushBoards);
+      };
+
+      await readNdjson<GenerationStreamEvent>(response.body, (event) => {
+        switch (event.type) {
+          case "progress":
+            set({ progress: event.progress });
+            break;
+          case "items":
+            table = { items: event.items, boardConfig: event.boardConfig };
+            break;
+          case "board":
+            boards.push(event.board);
+            scheduleFlush();
+            break;
+          case "boards": {
+            if (!table) throw new Error("Packed boards arrived before the item table");
+            const { items, boardConfig } = table;
+            event.boards.forEach((packed, k) => {
+              const position = event.start + k;
+              boards[position] = unpackBoard(packed, position, items, boardConfig);
+            });
+            scheduleFlush();
+            break;
+          }
+          case "done":
+            result = {
+              success: event.success,
+              boards,
+              stats: event.stats,
+              errors: event.errors,
+            };
+            break;
+          case "error":
+            throw new Error(event.error);
+        }
+      });
+
+      if (!result) {
+        throw new Error("Generation stream ended unexpectedly");
+      }
 
       if (result.success) {
-        set({ result, isGenerating: false });
+        set({
+          result,
+          isGenerating: false,
+          progress: null,
+          streamedBoards: [],
+        });
       } else {
         set({
           result,
           error: result.errors?.join(", ") ?? "Generation failed",
           isGenerating: false,
+          progress: null,
+          streamedBoards: [],
         });
       }
     } catch (e) {
+      // A cancelled generation was already cleaned up by abortGeneration
+      if (controller.signal.aborted) return;
       set({
         error: e instanceof Error ? e.message : "Unknown error",
         isGenerating: false,
+        progress: null,
+        streamedBoards: [],
       });
+    } finally {
+      if (generationController === controller) generationController = null;
     }
   },
 
+  cancelGeneration: () => {
+    abortGeneration();
+  },
+
   regenerate: async () => {
     set({ result: null });
     await get().generate();
@@ -230,10 +356,12 @@ export const useGeneratorStore = create<GeneratorStore>((set, get) => ({
 
   // Reset
   reset: () => {
+    abortGeneration();
     set(initialState);
   },
 
   loadDefaults: () => {
+    abortGeneration();
     set({
       config: {
         items: DEFAULT_ITEMS,
@@ -253,5 +381,7 @@ export const useConfig = () => useGeneratorStore((s) => s.config);
 export const useResult = () => useGeneratorStore((s) => s.result);
 export const useValidations = () => useGeneratorStore((s) => s.validations);
 export const useIsGenerating = () => useGeneratorStore((s) => s.isGenerating);
+export const useProgress = () => useGeneratorStore((s) => s.progress);
+export const useStreamedBoards = () => useGeneratorStore((s) => s.streamedBoards);
 export const useError = () => useGeneratorStore((s) => s.error);
 
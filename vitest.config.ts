@@ -7,6 +7,9 @@ export default defineConfig({
     environment: "node",
     include: ["**/*.test.ts"],
     testTimeout: 60000, // 60s for solver tests
+    benchmark: {
+      include: ["bench/**/*.bench.ts"],
+    },
   },
   resolve: {
     alias: {